@@ -0,0 +1,114 @@
+"""
+Compare le dessin du décor tuile par tuile (un `blit` par entité) et le
+dessin par séquences préparées une fois (`Surface.blits` / `fblits`).
+
+    python benchmarks/bench_blits.py
+
+Le niveau de test remplit l'écran de murs, de monstres fixes et de
+monstres mobiles pour que le coût par entité domine.
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from jeu_arcade.affichage import dessiner_decor, dessiner_entites, preparer_decor
+from jeu_arcade.config import (
+    COULEURS,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    TAILLE_TUILE,
+    ElementDecor,
+)
+from jeu_arcade.images import initialiser_images, retourner_images
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.physique import initialiser_joueur, joueur
+
+NB_FRAMES = 300
+
+
+def niveau_dense() -> str:
+    """Niveau de la taille de l'écran, rempli aux trois quarts."""
+    largeur = ECRAN_LARGEUR // TAILLE_TUILE
+    hauteur = ECRAN_HAUTEUR // TAILLE_TUILE
+    motif = "#MX#"
+    lignes = [
+        "".join(motif[(x + y) % len(motif)] for x in range(largeur))
+        for y in range(hauteur)
+    ]
+    lignes[0] = "P" + "." * (largeur - 2) + "E"
+    return "\n".join(lignes)
+
+
+def dessiner_tuile_par_tuile(ecran, niveau_data, images, images_retournees):
+    """Boucles de dessin d'origine : un blit et un test par entité."""
+    ecran.blit(images[ElementDecor.VIDE], (0, 0))
+    for tuile in niveau_data['tuiles_sol']:
+        if images[ElementDecor.MUR]:
+            ecran.blit(images[ElementDecor.MUR], tuile)
+        else:
+            pygame.draw.rect(ecran, COULEURS[ElementDecor.MUR], tuile)
+    for monstre in niveau_data['tuiles_monstres_fixes']:
+        if images[ElementDecor.MONSTRE]:
+            ecran.blit(images[ElementDecor.MONSTRE], monstre)
+        else:
+            pygame.draw.rect(ecran, COULEURS[ElementDecor.MONSTRE], monstre)
+    ecran.blit(images[ElementDecor.SORTIE], niveau_data['tuile_sortie'])
+    img_joueur = images[ElementDecor.JOUEUR]
+    if joueur["direction"] == "gauche":
+        img_joueur = pygame.transform.flip(img_joueur, True, False)
+    ecran.blit(img_joueur, joueur["rect"])
+    for m in niveau_data['tuiles_monstres_mobiles']:
+        img = images.get(
+            ElementDecor.MONSTRE_MOBILE, images.get(ElementDecor.MONSTRE)
+        )
+        if img:
+            if m['vitesse_x'] > 0:
+                img = pygame.transform.flip(img, True, False)
+            ecran.blit(img, m['rect'])
+        else:
+            pygame.draw.rect(
+                ecran, COULEURS[ElementDecor.MONSTRE_MOBILE], m['rect']
+            )
+
+
+def main():
+    pygame.display.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    images = initialiser_images(frozenset(ElementDecor))
+    images_retournees = retourner_images(images)
+    niveau_data = construire_niveau(niveau_dense())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    nb_entites = (
+        len(niveau_data['tuiles_sol'])
+        + len(niveau_data['tuiles_monstres_fixes'])
+        + len(niveau_data['tuiles_monstres_mobiles'])
+    )
+    decor = preparer_decor(niveau_data, images)
+
+    def par_sequences():
+        dessiner_decor(ecran, decor)
+        dessiner_entites(ecran, niveau_data, images, images_retournees)
+
+    def par_tuiles():
+        dessiner_tuile_par_tuile(ecran, niveau_data, images, images_retournees)
+
+    print(f"{nb_entites} entités, {NB_FRAMES} frames, "
+          f"fblits : {'oui' if hasattr(ecran, 'fblits') else 'non'}")
+    resultats = {}
+    for nom, dessin in (("tuile par tuile", par_tuiles),
+                        ("blits", par_sequences)):
+        duree = min(timeit.repeat(dessin, number=NB_FRAMES, repeat=5))
+        resultats[nom] = duree
+        print(f"{nom:16s} : {duree / NB_FRAMES * 1000:.3f} ms par frame")
+    gain = resultats["tuile par tuile"] / resultats["blits"]
+    print(f"Accélération : x{gain:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare trois façons de décoder le texte d'un niveau en grille de tuiles :
+un `ElementDecor(caractere)` par case (l'ancien analyseur à `match`), une
+table NumPy indexée par les codes UTF-32 des caractères, et la table de
+256 octets de `decoder_lignes` (`bytes.translate`).
+
+    python benchmarks/bench_decodage.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from jeu_arcade.config import IDS_TUILES, TUILE_INVALIDE, ElementDecor
+from jeu_arcade.erreurs import CaractereInvalideErreur
+from jeu_arcade.niveau import TOUS_LES_ELEMENTS, decoder_lignes
+
+TAILLES = ((20, 8), (200, 100), (1000, 500)) # colonnes, lignes
+DUREE_MIN = 0.5 # secondes de mesure par décodeur et par taille
+
+
+def decoder_par_enum(lignes: list[str]) -> np.ndarray:
+    largeur = max(len(ligne) for ligne in lignes)
+    grille = np.zeros((len(lignes), largeur), dtype=np.uint8)
+    for y, ligne in enumerate(lignes):
+        for x, caractere in enumerate(ligne):
+            try:
+                element = ElementDecor(caractere)
+            except ValueError:
+                raise CaractereInvalideErreur(caractere, y, x)
+            grille[y, x] = IDS_TUILES[element]
+    return grille
+
+
+TABLE_NUMPY = np.full(256, TUILE_INVALIDE, dtype=np.uint8)
+for _element in TOUS_LES_ELEMENTS:
+    TABLE_NUMPY[ord(_element.value)] = IDS_TUILES[_element]
+
+
+def decoder_par_numpy(lignes: list[str]) -> np.ndarray:
+    largeur = max(len(ligne) for ligne in lignes)
+    texte = "".join(ligne.ljust(largeur, ".") for ligne in lignes)
+    codes = np.frombuffer(texte.encode("utf-32-le"), dtype="<u4")
+    codes = codes.reshape(len(lignes), largeur)
+    grille = TABLE_NUMPY[np.minimum(codes, 255)]
+    grille[codes > 255] = TUILE_INVALIDE
+    invalides = grille == TUILE_INVALIDE
+    if invalides.any():
+        y, x = np.argwhere(invalides)[0]
+        raise CaractereInvalideErreur(lignes[y][x], y, x)
+    return grille
+
+
+def niveau_aleatoire(colonnes: int, lignes: int) -> list[str]:
+    rng = random.Random(colonnes)
+    return [
+        "".join(rng.choices("....#MX", k=colonnes)) for _ in range(lignes)
+    ]
+
+
+def mesurer(decoder, lignes: list[str]) -> float:
+    n = 0
+    debut = time.perf_counter()
+    while time.perf_counter() - debut < DUREE_MIN:
+        decoder(lignes)
+        n += 1
+    return (time.perf_counter() - debut) / n
+
+
+def main():
+    decodeurs = (
+        ("enum", decoder_par_enum),
+        ("numpy", decoder_par_numpy),
+        ("translate", decoder_lignes),
+    )
+    for colonnes, nb_lignes in TAILLES:
+        lignes = niveau_aleatoire(colonnes, nb_lignes)
+        reference = decoder_par_enum(lignes)
+        for _, decoder in decodeurs[1:]:
+            assert (decoder(lignes) == reference).all()
+        temps = [mesurer(decoder, lignes) for _, decoder in decodeurs]
+        print(f"{colonnes} x {nb_lignes} cases :")
+        for (nom, _), duree in zip(decodeurs, temps):
+            print(
+                f"  {nom:<10} {duree * 1e6:10.1f} µs "
+                f"(x{temps[0] / duree:.0f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
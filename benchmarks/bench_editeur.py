@@ -0,0 +1,91 @@
+"""
+Compare le coût d'une modification dans l'éditeur de niveaux : mise à jour
+en place (`Editeur.poser`) et reconstruction complète du niveau et de la
+couche du décor (`construire_niveau`, `preparer_decor`,
+`rendre_couche_decor`).
+
+    python benchmarks/bench_editeur.py
+
+Les modifications sont tirées au hasard (murs, monstres, vide) sur un
+niveau de la taille de l'écran peuplé de monstres mobiles.
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from bench_regression import niveau_stress
+from jeu_arcade.affichage import preparer_decor, rendre_couche_decor
+from jeu_arcade.config import (
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    IDS_TUILES,
+    TUILE_JOUEUR,
+    TUILE_SORTIE,
+    ElementDecor,
+)
+from jeu_arcade.editeur import Editeur
+from jeu_arcade.images import initialiser_images
+from jeu_arcade.niveau import construire_niveau, decouper_lignes
+
+NB_MODIFICATIONS = 500
+ELEMENTS = (
+    ElementDecor.MUR,
+    ElementDecor.MONSTRE,
+    ElementDecor.MONSTRE_MOBILE,
+    ElementDecor.VIDE,
+)
+
+
+def modifications(editeur: Editeur) -> list[tuple[int, int, ElementDecor]]:
+    rng = random.Random(1)
+    hauteur, largeur = editeur.grille.shape
+    cases = [
+        (colonne, ligne)
+        for ligne in range(hauteur) for colonne in range(largeur)
+        if editeur.grille[ligne, colonne] not in (TUILE_JOUEUR, TUILE_SORTIE)
+    ]
+    return [
+        (*rng.choice(cases), rng.choice(ELEMENTS))
+        for _ in range(NB_MODIFICATIONS)
+    ]
+
+
+def main():
+    pygame.display.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    images = initialiser_images(frozenset(ElementDecor))
+    lignes = decouper_lignes(niveau_stress(1, 20, 15, 40))
+    editeur = Editeur(lignes, images)
+    liste = modifications(editeur)
+
+    debut = time.perf_counter()
+    for colonne, ligne, element in liste:
+        editeur.poser(colonne, ligne, element)
+    en_place = (time.perf_counter() - debut) / len(liste)
+
+    editeur = Editeur(lignes, images)
+    debut = time.perf_counter()
+    for colonne, ligne, element in liste:
+        editeur.grille[ligne, colonne] = IDS_TUILES[element]
+        niveau_data = construire_niveau(editeur.texte())
+        rendre_couche_decor(
+            preparer_decor(niveau_data, images), ecran.get_size()
+        )
+    reconstruction = (time.perf_counter() - debut) / len(liste)
+    print(f"{len(liste)} modifications")
+    print(f"en place       : {en_place * 1e6:8.1f} µs")
+    print(
+        f"reconstruction : {reconstruction * 1e6:8.1f} µs "
+        f"(x{reconstruction / en_place:.0f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compare le chargement des images une par une (`charger_image`) et par le
+pool de threads de `charger_images` (lecture et redimensionnement en
+parallèle, conversion sur le thread principal).
+
+    python benchmarks/bench_images.py
+
+Pour simuler un jeu d'images plus fourni, chaque image du jeu est chargée
+plusieurs fois, à la taille de l'écran.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from jeu_arcade.config import ECRAN_HAUTEUR, ECRAN_LARGEUR
+from jeu_arcade.images import (
+    FICHIERS_IMAGES,
+    THREADS_IMAGES,
+    charger_image,
+    charger_images,
+)
+
+NB_COPIES = 8
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    demandes = {
+        (element, copie): (nom, ECRAN_LARGEUR, ECRAN_HAUTEUR, alpha)
+        for element, (nom, _, _, alpha) in FICHIERS_IMAGES.items()
+        for copie in range(NB_COPIES)
+    }
+    print(f"{len(demandes)} images, {THREADS_IMAGES} threads")
+    debut = time.perf_counter()
+    for demande in demandes.values():
+        charger_image(*demande)
+    sequentiel = time.perf_counter() - debut
+    debut = time.perf_counter()
+    charger_images(demandes)
+    parallele = time.perf_counter() - debut
+    print(f"une par une : {sequentiel * 1000:.0f} ms")
+    print(f"pool        : {parallele * 1000:.0f} ms (x{sequentiel / parallele:.2f})")
+
+
+if __name__ == "__main__":
+    main()
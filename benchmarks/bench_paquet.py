@@ -0,0 +1,62 @@
+"""
+Compare la lecture d'une campagne de niveaux fichier par fichier
+(`charger_niveau` sur un dossier) et depuis un paquet projeté en mémoire.
+
+    python benchmarks/bench_paquet.py
+
+Les niveaux de test sont des copies des niveaux du mode `stats`, écrites
+dans un dossier temporaire.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jeu_arcade.config import DOSSIER_NIVEAUX_MONSTRES_MOBILES
+from jeu_arcade.erreurs import NiveauIntrouvableErreur
+from jeu_arcade.niveau import charger_niveau
+from jeu_arcade.paquet import PaquetNiveaux, ecrire_paquet, niveaux_du_dossier
+
+NB_NIVEAUX = 5000
+
+
+def tout_lire(source) -> int:
+    """Lit les niveaux un par un jusqu'au premier manquant, comme le jeu."""
+    numero = 1
+    while True:
+        try:
+            charger_niveau(numero, source)
+        except NiveauIntrouvableErreur:
+            return numero - 1
+        numero += 1
+
+
+def main():
+    modeles = niveaux_du_dossier(DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    with tempfile.TemporaryDirectory() as temp:
+        dossier = Path(temp) / "niveaux"
+        dossier.mkdir()
+        niveaux = []
+        for numero in range(1, NB_NIVEAUX + 1):
+            texte = modeles[(numero - 1) % len(modeles)][1]
+            (dossier / f"niveau_{numero}.txt").write_text(texte, encoding="utf-8")
+            niveaux.append((f"niveau_{numero}", texte))
+        chemin_paquet = Path(temp) / "campagne.paq"
+        ecrire_paquet(chemin_paquet, niveaux)
+
+        debut = time.perf_counter()
+        nb = tout_lire(dossier)
+        duree_dossier = time.perf_counter() - debut
+        debut = time.perf_counter()
+        with PaquetNiveaux(chemin_paquet) as paquet:
+            nb_paquet = tout_lire(paquet)
+        duree_paquet = time.perf_counter() - debut
+        print(f"{nb} niveaux lus depuis le dossier, {nb_paquet} depuis le paquet")
+        print(f"dossier : {duree_dossier / nb * 1e6:.1f} µs par niveau")
+        print(f"paquet  : {duree_paquet / nb_paquet * 1e6:.1f} µs par niveau")
+
+
+if __name__ == "__main__":
+    main()
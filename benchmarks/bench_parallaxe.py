@@ -0,0 +1,74 @@
+"""
+Coût par frame d'un fond en parallaxe selon le nombre de couches : motif
+redimensionné à chaque frame et répété, motif redimensionné une fois et
+répété, ou bandes en cache (`FondParallaxe`, deux blits par couche au plus).
+
+    python benchmarks/bench_parallaxe.py
+
+Chaque couche est l'image de fond réduite à un motif étroit, pour que la
+répétition du motif demande plusieurs blits par couche.
+"""
+import os
+import sys
+import timeit
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from jeu_arcade.config import ECRAN_HAUTEUR, ECRAN_LARGEUR, IMG_FOND
+from jeu_arcade.images import charger_image
+from jeu_arcade.parallaxe import FondParallaxe
+
+NB_FRAMES = 300
+LARGEUR_MOTIF = 160
+NB_COUCHES = (1, 3, 6)
+
+
+def dessiner_motifs(ecran, motifs, camera_x, redimensionner):
+    """Répète chaque motif sur la largeur de l'écran."""
+    for i, motif in enumerate(motifs):
+        if redimensionner:
+            motif = pygame.transform.smoothscale(
+                motif, (LARGEUR_MOTIF, ECRAN_HAUTEUR)
+            )
+        x = -(int(camera_x * i / len(motifs)) % LARGEUR_MOTIF)
+        while x < ECRAN_LARGEUR:
+            ecran.blit(motif, (x, 0))
+            x += LARGEUR_MOTIF
+
+
+def main():
+    pygame.display.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    image = charger_image(IMG_FOND, alpha=False)
+    # Seule la couche du fond est opaque, les autres ont de la transparence
+    originaux = [image] + [image.convert_alpha()] * (max(NB_COUCHES) - 1)
+    motifs = [
+        pygame.transform.smoothscale(img, (LARGEUR_MOTIF, ECRAN_HAUTEUR))
+        for img in originaux
+    ]
+    for nb in NB_COUCHES:
+        fond = FondParallaxe(
+            [(motif, i / nb) for i, motif in enumerate(motifs[:nb])],
+            (ECRAN_LARGEUR, ECRAN_HAUTEUR),
+        )
+        camera = iter(range(10**9))
+        print(f"--- {nb} couche(s) ---")
+        for nom, dessin in (
+            ("redimensionné", lambda: dessiner_motifs(
+                ecran, originaux[:nb], next(camera), True
+            )),
+            ("motif répété", lambda: dessiner_motifs(
+                ecran, motifs[:nb], next(camera), False
+            )),
+            ("bandes en cache", lambda: fond.dessiner(ecran, next(camera))),
+        ):
+            duree = min(timeit.repeat(dessin, number=NB_FRAMES, repeat=3))
+            print(f"{nom:16s} : {duree / NB_FRAMES * 1000:.3f} ms par frame")
+
+
+if __name__ == "__main__":
+    main()
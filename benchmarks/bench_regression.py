@@ -0,0 +1,366 @@
+"""
+Suite de non-régression des performances à partir de traces d'entrées.
+
+    python benchmarks/bench_regression.py                     # compare
+    python benchmarks/bench_regression.py --nouvelle-reference
+    python benchmarks/bench_regression.py --generer-traces
+
+Chaque trace de `benchmarks/traces/` rejoue un niveau livré (`niveaux*/`)
+ou un niveau de stress généré, tick par tick, sans fenêtre (pilote vidéo
+SDL `dummy`) : le temps de simulation de chaque tick (monstres, joueur,
+collisions) et le temps de dessin de chaque frame dans une surface hors
+écran sont mesurés. Le joueur qui meurt, tombe ou sort repart du début du
+niveau, comme dans le jeu.
+
+Le rejeu est déterministe : un même tick fait le même travail d'un rejeu à
+l'autre. Chaque trace est rejouée `--repetitions` fois et chaque tick (et
+chaque frame) garde sa durée la plus courte, ce qui écarte les interruptions
+du système ; la médiane de ces minima est la mesure d'une série. La vitesse
+d'un même code varie surtout d'un processus à l'autre (placement en
+mémoire, cœur attribué) : chaque série rejoue donc toutes les traces dans un
+processus neuf, et c'est la médiane des `--series` séries, avec leur
+dispersion (écart absolu médian), qui est comparée à la référence
+enregistrée (`reference_regression.json`). Une mesure régresse quand elle
+dépasse la référence à la fois de `--seuil` (en proportion), de
+`PLANCHER_US` microsecondes et de `K_DISPERSION` fois la dispersion : le
+script se termine alors avec le code 1.
+
+Les traces sont écrites par un joueur simulé (aléatoire à graine fixe) ;
+une ligne `actions` est une suite de `masque*nombre_de_ticks` avec les
+masques `ACTION_*` de `config`.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # une fois par série sinon
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from jeu_arcade.affichage import dessiner_niveau, preparer_decor
+from jeu_arcade.config import (
+    ACTION_DROITE,
+    ACTION_GAUCHE,
+    ACTION_SAUT,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    RACINE,
+    ElementDecor,
+)
+from jeu_arcade.images import initialiser_images, retourner_images
+from jeu_arcade.modes import MODES
+from jeu_arcade.monstres import gerer_physique_monstres, verifier_collisions_danger
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+from jeu_arcade.reseau import actions_vers_touches
+from jeu_arcade.reserve import ReserveMonstres
+
+DOSSIER_TRACES = Path(__file__).resolve().parent / "traces"
+REFERENCE = Path(__file__).resolve().parent / "reference_regression.json"
+NB_TICKS_TRACE = 1200 # 20 secondes de jeu à 60 FPS
+REPETITIONS = 3 # rejeux d'une série, dont on garde le minimum par tick
+SERIES = 5 # un processus neuf par série
+SEUIL = 0.15 # hausse relative tolérée de la médiane
+PLANCHER_US = 5.0 # hausse ignorée en dessous, quelle que soit la proportion
+K_DISPERSION = 3 # hausse tolérée, en écarts absolus médians
+
+# Niveaux de stress : (graine, colonnes, lignes, monstres mobiles)
+NIVEAUX_STRESS = ((1, 20, 15, 40), (2, 60, 15, 300))
+# Segments du joueur simulé : (masque, poids) ; surtout vers la sortie
+SEGMENTS = (
+    (ACTION_DROITE, 5),
+    (ACTION_DROITE | ACTION_SAUT, 3),
+    (0, 1),
+    (ACTION_GAUCHE, 1),
+    (ACTION_GAUCHE | ACTION_SAUT, 1),
+    (ACTION_SAUT, 1),
+)
+
+
+def niveau_stress(graine: int, colonnes: int, lignes: int, nb_monstres: int) -> str:
+    """Niveau généré : étages de plateformes peuplés de monstres mobiles."""
+    rng = random.Random(graine)
+    grille = [["."] * colonnes for _ in range(lignes)]
+    grille[-1] = ["#"] * colonnes
+    for y in range(lignes - 4, 2, -3): # une plateforme tous les trois rangs
+        debut = rng.randrange(0, colonnes // 3)
+        for x in range(debut, rng.randrange(colonnes // 2, colonnes)):
+            grille[y][x] = "#"
+    cases = [
+        (x, y) for y in range(lignes - 1) for x in range(1, colonnes - 1)
+        if grille[y][x] == "." and grille[y + 1][x] == "#"
+    ]
+    for x, y in rng.sample(cases, min(nb_monstres, len(cases) - 2)):
+        grille[y][x] = "X"
+    grille[lignes - 2][0] = "P"
+    grille[lignes - 2][colonnes - 1] = "E"
+    return "\n".join("".join(ligne) for ligne in grille)
+
+
+def lire_trace(chemin: Path) -> dict:
+    trace = {"nom": chemin.stem}
+    for ligne in chemin.read_text(encoding="utf-8").splitlines():
+        if not ligne or ligne.startswith("#"):
+            continue
+        cle, _, valeur = ligne.partition(" ")
+        trace[cle] = valeur
+    actions = []
+    for segment in trace["actions"].split():
+        masque, nombre = segment.split("*")
+        actions += [int(masque)] * int(nombre)
+    trace["actions"] = actions
+    return trace
+
+
+def ecrire_trace(chemin: Path, source: str, mode: str, actions: list[int]):
+    segments = []
+    for masque in actions:
+        if segments and segments[-1][0] == masque:
+            segments[-1][1] += 1
+        else:
+            segments.append([masque, 1])
+    chemin.write_text(
+        "# Trace d'entrées pour benchmarks/bench_regression.py\n"
+        f"niveau {source}\n"
+        f"mode {mode}\n"
+        "actions " + " ".join(f"{m}*{n}" for m, n in segments) + "\n",
+        encoding="utf-8",
+    )
+
+
+def texte_du_niveau(source: str) -> str:
+    """`stress graine colonnes lignes monstres` ou un chemin depuis la racine."""
+    if source.startswith("stress "):
+        return niveau_stress(*map(int, source.split()[1:]))
+    return (RACINE / source).read_text(encoding="utf-8")
+
+
+def generer_traces():
+    """Réécrit les traces du joueur simulé (graine fixe par trace)."""
+    DOSSIER_TRACES.mkdir(exist_ok=True)
+    sources = [
+        (f"{dossier}/niveau_{numero}.txt", mode)
+        for dossier, mode in (
+            ("niveaux", "images"),
+            ("niveaux_monstres", "monstres"),
+            ("niveaux_monstres_mobiles", "monstres_mobiles"),
+        )
+        for numero in (1, 2, 3)
+    ]
+    sources += [
+        ("stress " + " ".join(map(str, stress)), "monstres_mobiles")
+        for stress in NIVEAUX_STRESS
+    ]
+    masques, poids = zip(*SEGMENTS)
+    for graine, (source, mode) in enumerate(sources):
+        rng = random.Random(graine)
+        actions = []
+        while len(actions) < NB_TICKS_TRACE:
+            actions += rng.choices(masques, poids)[0:1] * rng.randint(5, 40)
+        if source.startswith("stress"):
+            nom = "stress_" + "_".join(source.split()[1:])
+        else:
+            nom = source.removesuffix(".txt").replace("/", "_")
+        ecrire_trace(
+            DOSSIER_TRACES / f"{nom}.trace", source, mode,
+            actions[:NB_TICKS_TRACE],
+        )
+        print(f"{nom}.trace ({source})")
+
+
+def rejouer(trace: dict, images: dict, images_retournees: dict) -> dict:
+    """Rejoue une trace ; durées des ticks et des frames en nanosecondes."""
+    mode = MODES[trace["mode"]]
+    texte = texte_du_niveau(trace["niveau"])
+    reserve = ReserveMonstres()
+    ecran = pygame.Surface((ECRAN_LARGEUR, ECRAN_HAUTEUR)).convert()
+    compte = {"morts": 0, "sorties": 0}
+    niveau = None
+    ticks, frames = [], []
+    horloge = time.perf_counter_ns
+    for actions in trace["actions"]:
+        if niveau is None:
+            niveau = construire_niveau(texte, mode.elements, reserve=reserve)
+            initialiser_joueur(*niveau['pos_joueur'])
+            decor = preparer_decor(niveau, images)
+        touches = actions_vers_touches(actions)
+        debut = horloge()
+        if mode.monstres:
+            gerer_physique_monstres(niveau)
+        appliquer_physique(niveau, touches)
+        if mode.monstres:
+            verifier_collisions_danger(niveau)
+        ticks.append(horloge() - debut)
+        if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+            compte["morts"] += 1
+            niveau = None
+            continue
+        if joueur['rect'].colliderect(niveau['tuile_sortie']):
+            compte["sorties"] += 1
+            niveau = None
+            continue
+        debut = horloge()
+        dessiner_niveau(ecran, niveau, images, images_retournees, decor)
+        frames.append(horloge() - debut)
+    compte["position"] = list(joueur['rect'].topleft) if niveau else None
+    return {"ticks": ticks, "frames": frames, "controle": compte}
+
+
+def resumer(medianes: list[float], p95: list[float]) -> dict:
+    mediane = statistics.median(medianes)
+    return {
+        "mediane_us": round(mediane / 1000, 3),
+        "dispersion_us": round(
+            statistics.median(abs(m - mediane) for m in medianes) / 1000, 3
+        ),
+        "p95_us": round(statistics.median(p95) / 1000, 3),
+    }
+
+
+def minimum_par_indice(rejeux: list[list[int]]) -> list[int]:
+    """Durée la plus courte de chaque tick (ou frame) sur plusieurs rejeux."""
+    return [min(durees) for durees in zip(*rejeux)]
+
+
+def serie(chemins: list[Path], repetitions: int) -> dict:
+    """
+    Une série, dans son propre processus : médiane et 95e centile (ns) des
+    minima par tick et par frame de chaque trace.
+    """
+    pygame.display.init()
+    pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    with contextlib.redirect_stdout(io.StringIO()): # en-tête répété à chaque série
+        images = initialiser_images(frozenset(ElementDecor))
+    images_retournees = retourner_images(images)
+    mesures = {}
+    for chemin in chemins:
+        trace = lire_trace(chemin)
+        rejeux = [
+            rejouer(trace, images, images_retournees) for _ in range(repetitions)
+        ]
+        mesures[trace["nom"]] = {"controle": rejeux[-1]["controle"]}
+        for nom, cle in (("simulation", "ticks"), ("rendu", "frames")):
+            durees = minimum_par_indice([r[cle] for r in rejeux])
+            if durees:
+                mesures[trace["nom"]][nom] = (
+                    statistics.median(durees),
+                    statistics.quantiles(durees, n=20)[-1]
+                    if len(durees) > 1 else durees[0],
+                )
+    pygame.quit()
+    return mesures
+
+
+def mesurer(chemins: list[Path], series: int, repetitions: int) -> dict:
+    """Médiane et dispersion des séries de chaque trace (µs)."""
+    contexte = multiprocessing.get_context("spawn")
+    toutes = []
+    for _ in range(series): # une à une : deux séries ne se gênent pas
+        with ProcessPoolExecutor(1, mp_context=contexte) as executeur:
+            toutes.append(executeur.submit(serie, chemins, repetitions).result())
+    resultats = {}
+    for nom, derniere in toutes[-1].items():
+        resultats[nom] = {
+            partie: resumer(*zip(*(s[nom][partie] for s in toutes)))
+            for partie in ("simulation", "rendu") if partie in derniere
+        }
+        resultats[nom]["controle"] = derniere["controle"]
+        simulation = resultats[nom]["simulation"]
+        rendu = resultats[nom].get("rendu", {"mediane_us": 0})
+        print(
+            f"{nom:<34} simulation {simulation['mediane_us']:>8.1f} µs"
+            f"  rendu {rendu['mediane_us']:>8.1f} µs"
+        )
+    return resultats
+
+
+def comparer(resultats: dict, reference: dict, seuil: float) -> list[str]:
+    """Messages des mesures qui régressent par rapport à la référence."""
+    regressions = []
+    for nom, mesures in resultats.items():
+        if nom not in reference:
+            print(f"{nom} : absente de la référence, ignorée")
+            continue
+        if mesures["controle"] != reference[nom]["controle"]:
+            print(
+                f"{nom} : le rejeu ne finit plus pareil "
+                f"({reference[nom]['controle']} -> {mesures['controle']}), "
+                "la référence est peut-être à refaire"
+            )
+        for partie in ("simulation", "rendu"):
+            if partie not in mesures or partie not in reference[nom]:
+                continue
+            actuel, ancien = mesures[partie], reference[nom][partie]
+            ecart = actuel["mediane_us"] - ancien["mediane_us"]
+            bruit = K_DISPERSION * max(
+                actuel["dispersion_us"], ancien["dispersion_us"]
+            )
+            if ecart > max(seuil * ancien["mediane_us"], PLANCHER_US, bruit):
+                regressions.append(
+                    f"{nom} / {partie} : {ancien['mediane_us']:.1f} -> "
+                    f"{actuel['mediane_us']:.1f} µs "
+                    f"(+{ecart / ancien['mediane_us']:.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--nouvelle-reference", action="store_true",
+        help="enregistre les mesures comme nouvelle référence",
+    )
+    parser.add_argument(
+        "--generer-traces", action="store_true",
+        help="réécrit les traces du joueur simulé",
+    )
+    parser.add_argument("--reference", type=Path, default=REFERENCE)
+    parser.add_argument("--series", type=int, default=SERIES)
+    parser.add_argument("--repetitions", type=int, default=REPETITIONS)
+    parser.add_argument("--seuil", type=float, default=SEUIL)
+    parser.add_argument(
+        "traces", nargs="*", type=Path,
+        help="traces à rejouer (défaut : toutes celles de benchmarks/traces)",
+    )
+    args = parser.parse_args()
+    if args.generer_traces:
+        generer_traces()
+        return 0
+    chemins = args.traces or sorted(DOSSIER_TRACES.glob("*.trace"))
+    if not args.nouvelle_reference:
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+    resultats = mesurer(chemins, args.series, args.repetitions)
+    if args.nouvelle_reference:
+        args.reference.write_text(json.dumps({
+            "machine": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "processeur": platform.machine(),
+            },
+            "traces": resultats,
+        }, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Référence enregistrée dans {args.reference}.")
+        return 0
+    regressions = comparer(resultats, reference["traces"], args.seuil)
+    for message in regressions:
+        print(f"RÉGRESSION : {message}")
+    if regressions:
+        return 1
+    print("Aucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Mesure le serveur du jeu en réseau local avec 2, 4 puis 8 joueurs simulés.
+
+    python benchmarks/bench_reseau.py
+
+Le serveur tourne dans un thread et les joueurs sont des clients UDP sur
+127.0.0.1 qui envoient des touches aléatoires à chaque frame : aucune
+fenêtre ni service extérieur n'est nécessaire.
+"""
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jeu_arcade.client import Client
+from jeu_arcade.config import FPS
+from jeu_arcade.env_vectorise import NB_ACTIONS
+from jeu_arcade.modes import MODES
+from jeu_arcade.serveur import Serveur, afficher_mesures
+
+DUREE = 3.0 # secondes de mesure par nombre de joueurs
+
+
+def mesurer(nb_joueurs: int) -> dict:
+    serveur = Serveur(MODES["stats"], adresse=("127.0.0.1", 0))
+    thread = threading.Thread(target=serveur.executer, daemon=True)
+    thread.start()
+    clients = [Client(serveur.adresse) for _ in range(nb_joueurs)]
+    for client in clients:
+        client.rejoindre()
+    rng = random.Random(0)
+    serveur.reinitialiser_mesures()
+    fin = time.perf_counter() + DUREE
+    while time.perf_counter() < fin:
+        for client in clients:
+            client.envoyer_actions(rng.randrange(NB_ACTIONS))
+            client.recevoir()
+        time.sleep(1 / FPS)
+    mesures = serveur.mesures()
+    for client in clients:
+        client.fermer()
+    serveur.arreter()
+    thread.join()
+    images = [c.derniere_image['tick'] for c in clients if c.derniere_image]
+    mesures["clients_synchronises"] = len(images)
+    return mesures
+
+
+def main():
+    for nb_joueurs in (2, 4, 8):
+        mesures = mesurer(nb_joueurs)
+        print(f"{nb_joueurs} joueurs ({mesures['clients_synchronises']} "
+              f"recevant des images) :")
+        afficher_mesures(mesures)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compare l'ancienne gestion des monstres mobiles (nouveau dict et Rect à
+chaque apparition, `list.remove` à chaque disparition) à la réserve
+(`ReserveMonstres` : retrait par échange et liste libre).
+
+    python benchmarks/bench_reserve.py
+
+À chaque tick, NB_ECHANGES monstres disparaissent et autant apparaissent
+parmi NB_ACTIFS. Le nombre de passages du ramasse-miettes (génération 0)
+mesure les allocations d'objets.
+"""
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pygame
+
+from jeu_arcade.config import TAILLE_TUILE, VITESSE_MONSTRE
+from jeu_arcade.reserve import ReserveMonstres
+
+NB_ACTIFS = 5000
+NB_ECHANGES = 200 # par tick, soit 12 000 apparitions par seconde à 60 FPS
+NB_TICKS = 300
+
+
+def nouveau_monstre(x: int, y: int) -> dict:
+    return {
+        "rect": pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE),
+        "vitesse_x": VITESSE_MONSTRE,
+        "vitesse_y": 0,
+        "depart": (x, y),
+    }
+
+
+def preparer_liste() -> list[dict]:
+    return [nouveau_monstre(i, 0) for i in range(NB_ACTIFS)]
+
+
+def tick_liste(monstres: list[dict], a_supprimer: list[dict]):
+    for m in a_supprimer:
+        if m in monstres:
+            monstres.remove(m)
+    for i in range(NB_ECHANGES):
+        monstres.append(nouveau_monstre(i, 0))
+
+
+def preparer_reserve() -> ReserveMonstres:
+    monstres = ReserveMonstres()
+    for i in range(NB_ACTIFS):
+        monstres.ajouter(i, 0)
+    return monstres
+
+
+def tick_reserve(monstres: ReserveMonstres, a_supprimer: list[dict]):
+    for m in a_supprimer:
+        monstres.retirer(m)
+    for i in range(NB_ECHANGES):
+        monstres.ajouter(i, 0)
+
+
+def main():
+    for nom, preparer, tick in (
+        ("liste", preparer_liste, tick_liste),
+        ("réserve", preparer_reserve, tick_reserve),
+    ):
+        rng = random.Random(0)
+        monstres = preparer()
+        gc.collect()
+        passages = gc.get_stats()[0]['collections']
+        duree = 0.0
+        for _ in range(NB_TICKS):
+            a_supprimer = rng.sample(monstres, NB_ECHANGES)
+            debut = time.perf_counter()
+            tick(monstres, a_supprimer)
+            duree += time.perf_counter() - debut
+        passages = gc.get_stats()[0]['collections'] - passages
+        print(
+            f"{nom:8s}: {duree / NB_TICKS * 1000:.2f} ms par tick, "
+            f"{passages} passages du ramasse-miettes"
+        )
+
+
+if __name__ == "__main__":
+    main()
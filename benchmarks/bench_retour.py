@@ -0,0 +1,90 @@
+"""
+Compare le coût par tick de la sauvegarde et de la restauration de l'état
+du jeu : dictionnaires de `instantanes.capturer` / `restaurer` et tampon
+préalloué de `retour_arriere.TamponEtats`.
+
+    python benchmarks/bench_retour.py
+
+Chaque tick capture un état (comme pendant une partie avec
+--retour-arriere) ; chaque restauration remonte d'un état (touche RETOUR
+ARRIÈRE maintenue). Les monstres sont déplacés entre deux captures pour
+que les états diffèrent.
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jeu_arcade.config import FPS, TAILLE_TUILE
+from jeu_arcade.instantanes import capturer, restaurer
+from jeu_arcade.physique import initialiser_joueur
+from jeu_arcade.retour_arriere import DUREE_RETOUR, TamponEtats
+from jeu_arcade.reserve import ReserveMonstres
+
+NB_MONSTRES = (0, 40, 300)
+NB_TICKS = DUREE_RETOUR * FPS
+REPETITIONS = 20
+
+
+def preparer_niveau(nb_monstres: int) -> dict:
+    initialiser_joueur(TAILLE_TUILE, TAILLE_TUILE)
+    reserve = ReserveMonstres()
+    for i in range(nb_monstres):
+        x, y = (i % 60) * TAILLE_TUILE, (i // 60) * TAILLE_TUILE
+        reserve.ajouter(x, y, depart=(x, y))
+    return {"tuiles_monstres_mobiles": reserve}
+
+
+def avancer(niveau_data: dict):
+    for m in niveau_data['tuiles_monstres_mobiles']:
+        m['rect'].x += m['vitesse_x']
+
+
+def mesurer_dicts(niveau_data: dict) -> tuple[float, float]:
+    capture = restauration = 0.0
+    for _ in range(REPETITIONS):
+        etats = []
+        for tick in range(NB_TICKS):
+            avancer(niveau_data)
+            debut = time.perf_counter()
+            etats.append(capturer(niveau_data, tick))
+            capture += time.perf_counter() - debut
+        debut = time.perf_counter()
+        while etats:
+            restaurer(etats.pop(), niveau_data)
+        restauration += time.perf_counter() - debut
+    return capture, restauration
+
+
+def mesurer_tampon(niveau_data: dict) -> tuple[float, float]:
+    retour = TamponEtats(len(niveau_data['tuiles_monstres_mobiles']), NB_TICKS)
+    capture = restauration = 0.0
+    for _ in range(REPETITIONS):
+        for tick in range(NB_TICKS):
+            avancer(niveau_data)
+            debut = time.perf_counter()
+            retour.capturer(niveau_data, tick * 16, 1, tick)
+            capture += time.perf_counter() - debut
+        debut = time.perf_counter()
+        while retour.reculer(niveau_data) is not None:
+            pass
+        restauration += time.perf_counter() - debut
+    return capture, restauration
+
+
+def main():
+    nb = NB_TICKS * REPETITIONS
+    print(f"{NB_TICKS} états par anneau, µs par tick (capture / restauration)")
+    for nb_monstres in NB_MONSTRES:
+        dicts = mesurer_dicts(preparer_niveau(nb_monstres))
+        tampon = mesurer_tampon(preparer_niveau(nb_monstres))
+        print(
+            f"{nb_monstres:>4} monstres : "
+            f"dicts {dicts[0] / nb * 1e6:6.1f} / {dicts[1] / nb * 1e6:6.1f}  "
+            f"tampon {tampon[0] / nb * 1e6:6.1f} / {tampon[1] / nb * 1e6:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+"""
+Jeu de plateforme du TP, regroupé en un seul paquet.
+
+Chaque étape du TP est un mode (voir `jeu_arcade.modes.MODES`) ; seuls les
+sous-systèmes utilisés par le mode choisi sont importés au lancement.
+"""
+import time
+
+# Origine des mesures de temps de démarrage (--temps-demarrage)
+DEBUT_PROCESSUS = time.perf_counter()
+
+from jeu_arcade.modes import MODES, Mode, Options, lancer
+
+__all__ = ["MODES", "Mode", "Options", "lancer"]
@@ -0,0 +1,114 @@
+"""Point d'entrée : `python -m jeu_arcade --mode stats`."""
+import argparse
+from pathlib import Path
+
+from jeu_arcade.modes import MODE_PAR_DEFAUT, MODES, Options, lancer
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="jeu_arcade", description=__doc__)
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default=MODE_PAR_DEFAUT,
+        help="étape du jeu à lancer (défaut : %(default)s)",
+    )
+    parser.add_argument(
+        "--demarrage-rapide",
+        action="store_true",
+        help="n'initialise que l'affichage et charge les images en différé",
+    )
+    parser.add_argument(
+        "--temps-demarrage",
+        action="store_true",
+        help="affiche le temps écoulé jusqu'à la première image",
+    )
+    parser.add_argument(
+        "--surveiller",
+        action="store_true",
+        help="recharge le niveau en cours quand son fichier est modifié",
+    )
+    parser.add_argument(
+        "--rendu-partiel",
+        action="store_true",
+        help="ne rafraîchit que les zones de l'écran qui ont changé",
+    )
+    parser.add_argument(
+        "--cadence-adaptative",
+        action="store_true",
+        help="dégrade ou saute le dessin quand une frame prend du retard",
+    )
+    parser.add_argument(
+        "--rapport-memoire",
+        action="store_true",
+        help="affiche la mémoire occupée par sous-système à chaque niveau",
+    )
+    parser.add_argument(
+        "--niveau-compact",
+        action="store_true",
+        help="stocke les tuiles fixes en grille de bits et coordonnées",
+    )
+    parser.add_argument(
+        "--latence-entrees",
+        action="store_true",
+        help="mesure la latence entre une touche et son affichage",
+    )
+    parser.add_argument(
+        "--parallaxe",
+        action="store_true",
+        help="dessine le fond en couches qui défilent avec le joueur",
+    )
+    parser.add_argument(
+        "--animations",
+        action="store_true",
+        help="anime le joueur et les monstres à partir de planches de sprites",
+    )
+    parser.add_argument(
+        "--paquet",
+        type=Path,
+        metavar="FICHIER",
+        help="lit les niveaux dans un paquet (python -m jeu_arcade.paquet)",
+    )
+    parser.add_argument(
+        "--metriques",
+        type=int,
+        nargs="?",
+        const=9108,
+        metavar="PORT",
+        help="exporte les métriques sur http://127.0.0.1:PORT/metrics "
+        "(défaut : %(const)s)",
+    )
+    parser.add_argument(
+        "--profil-allocations",
+        action="store_true",
+        help="affiche chaque seconde les lignes du jeu qui allouent le plus",
+    )
+    parser.add_argument(
+        "--retour-arriere",
+        action="store_true",
+        help="RETOUR ARRIÈRE maintenu remonte les dernières secondes de jeu",
+    )
+    args = parser.parse_args()
+    lancer(
+        args.mode,
+        Options(
+            demarrage_rapide=args.demarrage_rapide,
+            temps_demarrage=args.temps_demarrage,
+            surveiller=args.surveiller,
+            rendu_partiel=args.rendu_partiel,
+            cadence_adaptative=args.cadence_adaptative,
+            rapport_memoire=args.rapport_memoire,
+            niveau_compact=args.niveau_compact,
+            latence_entrees=args.latence_entrees,
+            parallaxe=args.parallaxe,
+            animations=args.animations,
+            paquet=args.paquet,
+            metriques=args.metriques,
+            profil_allocations=args.profil_allocations,
+            retour_arriere=args.retour_arriere,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
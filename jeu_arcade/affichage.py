@@ -0,0 +1,373 @@
+"""Dessin du niveau, messages, HUD et écran de fin."""
+import sys
+
+import pygame
+
+from jeu_arcade.config import (
+    COULEUR_HUD_BG,
+    COULEUR_TEXTE,
+    COULEURS,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    TAILLE_TUILE,
+    ElementDecor,
+)
+from jeu_arcade.etats import etat_joueur, etat_monstre
+from jeu_arcade.niveau import rects_de
+from jeu_arcade.physique import joueur
+from jeu_arcade.tables_tuiles import TUILES_DECOR
+
+
+def blits(
+    ecran: pygame.Surface, sequence: list, retourner_rects: bool = False
+):
+    """Dessine une séquence (image, position) en un seul appel."""
+    if not retourner_rects and hasattr(ecran, "fblits"): # pygame-ce
+        ecran.fblits(sequence)
+        return None
+    return ecran.blits(sequence, doreturn=retourner_rects)
+
+
+def preparer_decor(
+    niveau_data: dict,
+    images: dict[ElementDecor, pygame.Surface],
+    parallaxe=None,
+) -> dict:
+    """
+    Prépare une fois pour toutes les couches fixes du niveau : une séquence
+    (image, position) pour `blits` et des (couleur, rect) pour les éléments
+    sans image. Les tuiles dessinées sont celles du registre marquées
+    `decor`, lues dans la grille du niveau pour la partie visible. À refaire
+    quand les tuiles ou les images changent. Un `FondParallaxe` non vide
+    remplace l'image de fond.
+    """
+    decor = {
+        "fond": images.get(ElementDecor.VIDE),
+        "parallaxe": parallaxe or None,
+        "blits": [],
+        "couleurs": [],
+    }
+    visible = niveau_data['grille'][
+        :ECRAN_HAUTEUR // TAILLE_TUILE + 1, :ECRAN_LARGEUR // TAILLE_TUILE + 1
+    ]
+    for tuile in TUILES_DECOR:
+        rects = rects_de(visible, tuile.ident)
+        img = images.get(tuile.element)
+        if img:
+            decor["blits"] += [(img, rect) for rect in rects]
+        else:
+            decor["couleurs"] += [(tuile.couleur, rect) for rect in rects]
+    return decor
+
+
+def modifier_decor(
+    decor: dict,
+    niveau_data: dict,
+    images: dict[ElementDecor, pygame.Surface],
+    lignes: list[int],
+) -> list[pygame.Rect]:
+    """
+    Remplace en place, dans un décor de `preparer_decor`, les tuiles des
+    lignes modifiées de la grille. Retourne les bandes de l'écran de ces
+    lignes, à redessiner dans les couches en cache (`redessiner_decor`).
+    """
+    visibles = {y for y in lignes if y <= ECRAN_HAUTEUR // TAILLE_TUILE}
+    if not visibles:
+        return []
+    for cle in ("blits", "couleurs"):
+        decor[cle][:] = [
+            (source, rect) for source, rect in decor[cle]
+            if rect.y // TAILLE_TUILE not in visibles
+        ]
+    grille = niveau_data['grille']
+    for y in sorted(visibles):
+        rangee = grille[y:y + 1, :ECRAN_LARGEUR // TAILLE_TUILE + 1]
+        for tuile in TUILES_DECOR:
+            rects = rects_de(rangee, tuile.ident, y)
+            img = images.get(tuile.element)
+            if img:
+                decor["blits"] += [(img, rect) for rect in rects]
+            else:
+                decor["couleurs"] += [(tuile.couleur, rect) for rect in rects]
+    return [
+        pygame.Rect(0, y * TAILLE_TUILE, ECRAN_LARGEUR, TAILLE_TUILE)
+        for y in sorted(visibles)
+    ]
+
+
+def redessiner_decor(
+    surface: pygame.Surface, decor: dict, zones: list[pygame.Rect]
+):
+    """Redessine le décor fixe dans les seules `zones` d'une couche en cache."""
+    for zone in zones:
+        surface.set_clip(zone)
+        if decor["parallaxe"]:
+            decor["parallaxe"].dessiner(surface, 0)
+        elif decor["fond"]:
+            surface.blit(decor["fond"], zone, zone)
+        else:
+            surface.fill(COULEURS[ElementDecor.VIDE], zone)
+        blits(surface, [
+            (img, rect) for img, rect in decor["blits"]
+            if rect.colliderect(zone)
+        ])
+        for couleur, tuile in decor["couleurs"]:
+            if tuile.colliderect(zone):
+                surface.fill(couleur, tuile)
+    surface.set_clip(None)
+
+
+def dessiner_niveau(
+    ecran: pygame.Surface,
+    niveau_data: dict,
+    images: dict[ElementDecor, pygame.Surface],
+    images_retournees: dict[ElementDecor, pygame.Surface],
+    decor: dict | None = None,
+    camera_x: int = 0,
+    animations=None,
+    tick: int = 0,
+):
+    """Dessine le fond, les tuiles, les monstres et le joueur."""
+    dessiner_decor(ecran, decor or preparer_decor(niveau_data, images), camera_x)
+    dessiner_entites(
+        ecran, niveau_data, images, images_retournees,
+        animations=animations, tick=tick,
+    )
+
+
+def dessiner_decor(ecran: pygame.Surface, decor: dict, camera_x: int = 0):
+    """
+    Dessine la partie fixe du niveau : fond, murs, monstres fixes, sortie.
+    `camera_x` ne sert qu'au défilement des couches du fond en parallaxe.
+    """
+    if decor["parallaxe"]:
+        decor["parallaxe"].dessiner(ecran, camera_x)
+    elif decor["fond"]:
+        ecran.blit(decor["fond"], (0, 0))
+    else:
+        ecran.fill(COULEURS[ElementDecor.VIDE]) # Fond noir
+    blits(ecran, decor["blits"])
+    for couleur, tuile in decor["couleurs"]:
+        ecran.fill(couleur, tuile)
+
+
+def rendre_couche_decor(decor: dict, taille: tuple[int, int]) -> pygame.Surface:
+    """Dessine le décor fixe une fois dans une surface à blitter d'un coup."""
+    couche = pygame.Surface(taille)
+    dessiner_decor(couche, decor)
+    return couche.convert()
+
+
+def dessiner_entites(
+    ecran: pygame.Surface,
+    niveau_data: dict,
+    images: dict[ElementDecor, pygame.Surface],
+    images_retournees: dict[ElementDecor, pygame.Surface],
+    retourner_rects: bool = False,
+    animations=None,
+    tick: int = 0,
+) -> list[pygame.Rect] | None:
+    """
+    Dessine le joueur et les monstres mobiles. Avec `retourner_rects`,
+    retourne les rectangles de l'écran qui ont été modifiés. Avec `animations`, les
+    images viennent du cache d'`Animations` selon l'état et le `tick`.
+    """
+    rects = []
+    if joueur['rect']:
+        if animations is not None and ElementDecor.JOUEUR in animations:
+            img_joueur = animations.image(
+                ElementDecor.JOUEUR, etat_joueur(joueur), joueur["direction"],
+                tick,
+            )
+            rects.append(ecran.blit(img_joueur, joueur["rect"]))
+        elif images.get(ElementDecor.JOUEUR):
+            if joueur["direction"] == "gauche":
+                img_joueur = images_retournees[ElementDecor.JOUEUR]
+            else:
+                img_joueur = images[ElementDecor.JOUEUR]
+            rects.append(ecran.blit(img_joueur, joueur["rect"]))
+        else:
+            rects.append(
+                ecran.fill(COULEURS[ElementDecor.JOUEUR], joueur['rect'])
+            )
+
+    element = ElementDecor.MONSTRE_MOBILE
+    if not images.get(element):
+        element = ElementDecor.MONSTRE
+    img = images.get(element)
+    mobiles = niveau_data['tuiles_monstres_mobiles']
+    if animations is not None and element in animations:
+        # Chaque monstre a sa phase, tirée de sa colonne de départ
+        sequence = [
+            (
+                animations.image(
+                    element, etat_monstre(m),
+                    "droite" if m['vitesse_x'] > 0 else "gauche",
+                    tick + m['depart'][0] // TAILLE_TUILE * 2,
+                ),
+                m['rect'],
+            )
+            for m in mobiles
+        ]
+    elif img:
+        # Le monstre regarde dans sa direction de déplacement
+        img_droite = images_retournees[element]
+        sequence = [
+            (img_droite if m['vitesse_x'] > 0 else img, m['rect'])
+            for m in mobiles
+        ]
+    else:
+        couleur = COULEURS[ElementDecor.MONSTRE_MOBILE]
+        rects += [ecran.fill(couleur, m['rect']) for m in mobiles]
+        return rects if retourner_rects else None
+    if not retourner_rects:
+        blits(ecran, sequence)
+        return None
+    rects += blits(ecran, sequence, retourner_rects=True)
+    return rects
+
+
+def afficher_chargement(ecran: pygame.Surface, faites: int, total: int):
+    """Barre de progression du chargement des images."""
+    ecran.fill(COULEURS[ElementDecor.VIDE])
+    cadre = pygame.Rect(0, 0, ECRAN_LARGEUR // 2, 24)
+    cadre.center = (ECRAN_LARGEUR // 2, ECRAN_HAUTEUR // 2)
+    pygame.draw.rect(ecran, (255, 255, 255), cadre, 2)
+    barre = cadre.inflate(-8, -8)
+    barre.width = barre.width * faites // max(total, 1)
+    ecran.fill((50, 255, 50), barre)
+    pygame.display.flip()
+    pygame.event.pump() # La fenêtre reste réactive pendant le chargement
+
+
+def afficher_message(
+    ecran,
+    texte,
+    sous_texte="",
+    couleur=(255, 255, 255),
+):
+    """Affiche un message à l'écran."""
+    font_titre = pygame.font.Font(None, 50)
+    font_sous = pygame.font.Font(None, 30)
+    surf_titre = font_titre.render(texte, True, couleur)
+    rect_titre = surf_titre.get_rect(
+        center=(ECRAN_LARGEUR // 2, ECRAN_HAUTEUR // 2 - 20)
+    )
+    fond = pygame.Surface((ECRAN_LARGEUR, 200))
+    fond.set_alpha(200)
+    fond.fill((0, 0, 0))
+    rect_fond = fond.get_rect(
+        center=(ECRAN_LARGEUR // 2, ECRAN_HAUTEUR // 2)
+    )
+    ecran.blit(fond, rect_fond)
+    ecran.blit(surf_titre, rect_titre)
+    if sous_texte:
+        surf_sous = font_sous.render(sous_texte, True, (200, 200, 200))
+        rect_sous = surf_sous.get_rect(
+            center=(ECRAN_LARGEUR // 2, ECRAN_HAUTEUR // 2 + 30)
+        )
+        ecran.blit(surf_sous, rect_sous)
+    pygame.display.flip()
+    pygame.time.wait(3000)
+
+
+def afficher_hud(
+    ecran: pygame.Rect,
+    temps_ecoule=None,
+    niveau: int | None = None,
+    essais: int | None = None,
+    fond: bool = True,
+    numero_joueur: int | None = None,
+    sorties: int | None = None,
+    tick: int | None = None,
+    debit: float | None = None,
+) -> pygame.Rect:
+    """
+    Affiche en haut de l'écran les champs donnés, sur un fond
+    semi-transparent si `fond` : niveau, essai et temps en solo ; numéro du
+    joueur, sorties atteintes, tick du serveur et débit reçu (octets/s) en
+    réseau. Retourne le rectangle occupé par le HUD.
+    """
+    champs = []
+    if numero_joueur is not None:
+        champs.append(f"Joueur {numero_joueur + 1}")
+    if niveau is not None:
+        champs.append(f"Niveau: {niveau}")
+    if essais is not None:
+        champs.append(f"Essai: {essais}")
+    if sorties is not None:
+        champs.append(f"Sorties: {sorties}")
+    if temps_ecoule is not None:
+        champs.append(f"Temps: {temps_ecoule:.1f}s")
+    if tick is not None:
+        champs.append(f"Tick: {tick}")
+    if debit is not None:
+        champs.append(f"{debit / 1024:.1f} Ko/s")
+    font = pygame.font.Font(None, 30)
+    texte = " | ".join(champs)
+    surface = font.render(texte, True, COULEUR_TEXTE)
+    rect = surface.get_rect(topleft=(10, 10))
+    if not fond:
+        return ecran.blit(surface, rect)
+    bg_surface = pygame.Surface((rect.width + 10, rect.height + 10), pygame.SRCALPHA)
+    bg_surface.fill(COULEUR_HUD_BG)
+    ecran.blit(bg_surface, (5, 5))
+    ecran.blit(surface, rect)
+    return bg_surface.get_rect(topleft=(5, 5))
+
+
+def afficher_ecran_fin(
+    ecran: pygame.Rect,
+    stats_globales: list,
+    registre,
+):
+    """Affiche le tableau récapitulatif et les records à la fin du jeu."""
+    ecran.fill((20, 20, 40)) # Fond bleu très sombre
+    font_titre = pygame.font.Font(None, 60)
+    font_texte = pygame.font.Font(None, 36)
+    titre = font_titre.render("RÉSULTATS FINAUX", True, (255, 215, 0))
+    ecran.blit(titre, (ECRAN_LARGEUR//2 - titre.get_width()//2, 50))
+    y = 150
+    headers = ["Niveau", "Temps", "Essais", "Record"]
+    x_positions = [160, 330, 500, 670]
+    for i, h in enumerate(headers):
+        text = font_texte.render(h, True, (100, 200, 255))
+        ecran.blit(text, (x_positions[i] - text.get_width()//2, y))
+    pygame.draw.line(ecran, (255, 255, 255), (100, y + 30), (700, y + 30), 2)
+    y += 50
+    total_temps = 0
+    total_essais = 0
+    for stat in stats_globales:
+        t_str = f"{stat['temps']:.1f}s"
+        e_str = str(stat['essais'])
+        total_temps += stat['temps']
+        total_essais += stat['essais']
+        l1 = font_texte.render(str(stat['niveau']), True, (255, 255, 255))
+        l2 = font_texte.render(t_str, True, (255, 255, 255))
+        l3 = font_texte.render(e_str, True, (255, 255, 255))
+        record = registre.meilleur_temps(stat['niveau'])
+        l4 = font_texte.render(f"{record:.1f}s", True, (255, 215, 0))
+        ecran.blit(l1, (x_positions[0] - l1.get_width()//2, y))
+        ecran.blit(l2, (x_positions[1] - l2.get_width()//2, y))
+        ecran.blit(l3, (x_positions[2] - l3.get_width()//2, y))
+        ecran.blit(l4, (x_positions[3] - l4.get_width()//2, y))
+        y += 40
+    pygame.draw.line(ecran, (255, 255, 255), (100, y + 10), (700, y + 10), 2)
+    y += 30
+    somme_t = font_texte.render(f"TOTAL: {total_temps:.1f}s", True, (0, 255, 0))
+    somme_e = font_texte.render(f"TOTAL: {total_essais} essais", True, (0, 255, 0))
+    ecran.blit(somme_t, (x_positions[1] - somme_t.get_width()//2, y))
+    ecran.blit(somme_e, (x_positions[2] - somme_e.get_width()//2, y))
+    # Instructions Quitter
+    y += 80
+    quit_msg = font_texte.render("Appuyez sur ÉCHAP pour quitter", True, (150, 150, 150))
+    ecran.blit(quit_msg, (ECRAN_LARGEUR//2 - quit_msg.get_width()//2, y))
+    pygame.display.flip()
+    # Boucle d'attente fin
+    attente = True
+    while attente:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                attente = False
+                pygame.quit()
+                sys.exit()
@@ -0,0 +1,166 @@
+"""
+Profil des allocations de la boucle de jeu (option --profil-allocations).
+
+Un instantané `tracemalloc` par frame ne voit que la mémoire encore
+allouée à la fin de la frame : un Rect d'`inflate`, une police ou une
+liste temporaire, libérés aussitôt, n'y apparaissent pas. Ici, chaque
+appel fait depuis le code du jeu (fonction Python, méthode pygame,
+compréhension...) est encadré par deux lectures de
+`tracemalloc.get_traced_memory()` : ce qui est encore alloué au retour de
+l'appel, moins ce qu'ont retenu les appels imbriqués déjà comptés, est
+attribué à la ligne du jeu qui l'a fait. Chaque seconde, les lignes qui
+allouent le plus sont affichées ; en régime établi, une boucle sans
+allocation n'affiche plus rien. Les objets servis par les listes libres de
+CPython (petites listes, dictionnaires, flottants...) échappent à
+`tracemalloc` et ne sont pas comptés.
+
+Le profil ralentit fortement le jeu : c'est un outil de mesure.
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+FICHIER_PROFIL = str(Path(__file__).resolve())
+DOSSIER_JEU = str(Path(__file__).resolve().parent)
+AUTRE, JEU, PROFIL = 0, 1, 2 # origine du code d'une frame
+INTERVALLE_RAPPORT = 1.0 # secondes entre deux rapports
+NB_LIGNES_RAPPORT = 10
+
+
+class ProfilAllocations:
+    """Allocations par ligne du jeu et par fonction appelée."""
+
+    def __init__(self):
+        # (code appelant, ligne, nom appelé) -> [allocations, octets]
+        self.sites: dict[tuple, list[int]] = {}
+        self._precedents: dict[tuple, tuple[int, int]] = {}
+        # Appels en cours : [mémoire au début, octets des appels imbriqués,
+        # site, jeton de fin (frame ou fonction C), frame appelante]
+        self._pile: list[list] = []
+        self._biais = 0 # octets alloués par le profil pour chaque appel
+        self._origines: dict = {}
+        self._images = 0
+        self._debut_rapport = time.perf_counter()
+
+    def demarrer(self):
+        tracemalloc.start()
+        self._calibrer()
+        sys.setprofile(self._evenement)
+
+    def _calibrer(self):
+        """Mesure ce que le profil alloue lui-même autour d'un appel vide."""
+        self._biais = 0
+        ecarts = []
+        for _ in range(100):
+            self._empiler(sys._getframe(), "calibrage", None)
+            ecarts.append(self._depiler())
+        self._biais = min(ecarts)
+        self.sites.clear()
+
+    def arreter(self):
+        sys.setprofile(None)
+        tracemalloc.stop()
+
+    def _origine(self, code) -> int:
+        origine = self._origines.get(code)
+        if origine is None:
+            fichier = str(Path(code.co_filename).resolve())
+            if fichier == FICHIER_PROFIL:
+                origine = PROFIL
+            elif fichier.startswith(DOSSIER_JEU):
+                origine = JEU
+            else:
+                origine = AUTRE
+            self._origines[code] = origine
+        return origine
+
+    def _evenement(self, frame, evenement: str, arg):
+        if evenement == "call":
+            appelant = frame.f_back
+            if (
+                appelant is not None
+                and self._origine(appelant.f_code) == JEU
+                and self._origine(frame.f_code) != PROFIL
+            ):
+                self._empiler(appelant, frame.f_code.co_name, frame)
+        elif evenement == "c_call":
+            if self._origine(frame.f_code) == JEU:
+                self._empiler(frame, arg.__name__, arg)
+        elif evenement == "return":
+            if self._pile and self._pile[-1][3] is frame:
+                self._depiler()
+        elif self._pile: # c_return, c_exception
+            sommet = self._pile[-1]
+            if sommet[3] is arg and sommet[4] is frame:
+                self._depiler()
+
+    def _empiler(self, appelant, nom: str, jeton):
+        site = (appelant.f_code, appelant.f_lineno, nom)
+        entree = [0, 0, site, jeton, appelant]
+        self._pile.append(entree)
+        entree[0] = tracemalloc.get_traced_memory()[0] # lu en dernier
+
+    def _depiler(self) -> int:
+        fin = tracemalloc.get_traced_memory()[0]
+        entree = self._pile.pop()
+        total = fin - entree[0] - self._biais
+        if self._pile:
+            self._pile[-1][1] += total
+        propre = total - entree[1]
+        if propre > 0:
+            compte = self.sites.get(entree[2])
+            if compte is None:
+                self.sites[entree[2]] = [1, propre]
+            else:
+                compte[0] += 1
+                compte[1] += propre
+        return total
+
+    def fin_frame(self):
+        """À appeler une fois par frame : affiche le rapport chaque seconde."""
+        self._images += 1
+        maintenant = time.perf_counter()
+        if maintenant - self._debut_rapport >= INTERVALLE_RAPPORT:
+            afficher_allocations(
+                self.allocations_recentes(), self._images,
+                maintenant - self._debut_rapport,
+            )
+            self._images = 0
+            self._debut_rapport = maintenant
+
+    def allocations_recentes(self) -> list[tuple[str, int, int]]:
+        """
+        (site, allocations, octets) depuis l'appel précédent, des plus
+        nombreuses aux moins nombreuses.
+        """
+        recentes = []
+        for site, (nombre, octets) in list(self.sites.items()):
+            nombre_avant, octets_avant = self._precedents.get(site, (0, 0))
+            if nombre > nombre_avant:
+                code, ligne, nom = site
+                recentes.append((
+                    f"{Path(code.co_filename).name}:{ligne} "
+                    f"{code.co_name} -> {nom}",
+                    nombre - nombre_avant,
+                    octets - octets_avant,
+                ))
+            self._precedents[site] = (nombre, octets)
+        recentes.sort(key=lambda r: (-r[1], -r[2]))
+        return recentes
+
+
+def afficher_allocations(
+    recentes: list[tuple[str, int, int]],
+    images: int,
+    duree: float,
+):
+    total = sum(nombre for _, nombre, _ in recentes)
+    print(
+        f"--- ALLOCATIONS : {total / duree:.0f}/s, "
+        f"{total / max(images, 1):.1f} par frame ({images} frames) ---"
+    )
+    for site, nombre, octets in recentes[:NB_LIGNES_RAPPORT]:
+        print(
+            f"{nombre / duree:>8.0f}/s {octets / nombre:>8.0f} o  {site}"
+        )
@@ -0,0 +1,107 @@
+"""
+Animations du joueur et des monstres à partir de planches de sprites
+(option --animations).
+
+Une planche (`PLANCHES_SPRITES`) contient une ligne d'images carrées par
+état, dans l'ordre de `ETATS` ; les cases entièrement transparentes en
+fin de ligne sont ignorées. Au chargement, chaque image est découpée,
+mise à `TAILLE_TUILE` et retournée une fois pour toutes, et rangée dans
+un cache indexé par (élément, état, direction). Le dessin d'une frame ne
+fait plus que choisir une surface du cache, sans en créer aucune.
+
+Sans planche pour un élément, son image fixe sert d'unique image de tous
+ses états.
+"""
+import pygame
+
+from jeu_arcade.config import (
+    DOSSIER_ASSETS,
+    PLANCHES_SPRITES,
+    TAILLE_TUILE,
+    ElementDecor,
+)
+from jeu_arcade.etats import ETATS, REPOS
+from jeu_arcade.images import charger_image
+
+TICKS_PAR_IMAGE = 6 # ticks d'affichage de chaque image d'une animation
+
+# Direction dans laquelle regardent les images d'origine
+REGARD = {
+    ElementDecor.JOUEUR: "droite",
+    ElementDecor.MONSTRE: "gauche",
+    ElementDecor.MONSTRE_MOBILE: "gauche",
+}
+
+
+def decouper_planche(planche: pygame.Surface) -> dict[str, list[pygame.Surface]]:
+    """
+    Images de chaque état d'une planche, mises à la taille d'une tuile.
+    Une planche trop petite pour une ligne par état ne donne aucune image.
+    """
+    cote = planche.get_height() // len(ETATS)
+    if cote == 0:
+        return {etat: [] for etat in ETATS}
+    etats = {}
+    for ligne, etat in enumerate(ETATS):
+        images = []
+        for x in range(0, planche.get_width() - cote + 1, cote):
+            case = planche.subsurface((x, ligne * cote, cote, cote))
+            if case.get_bounding_rect().width == 0:
+                break # Case vide : fin de la ligne
+            images.append(
+                pygame.transform.scale(case, (TAILLE_TUILE, TAILLE_TUILE))
+            )
+        etats[etat] = images
+    return etats
+
+
+class Animations:
+    """Images découpées et retournées de chaque élément animé."""
+
+    def __init__(self, images: dict[ElementDecor, pygame.Surface]):
+        self.cache: dict[tuple[ElementDecor, str, str], tuple] = {}
+        for element, regard in REGARD.items():
+            etats = self._charger(element, images.get(element))
+            if etats is None:
+                continue
+            autre = "gauche" if regard == "droite" else "droite"
+            for etat in ETATS:
+                # Un état absent de la planche reprend l'image de repos
+                cadres = etats.get(etat) or etats[REPOS]
+                self.cache[element, etat, regard] = tuple(cadres)
+                self.cache[element, etat, autre] = tuple(
+                    pygame.transform.flip(img, True, False) for img in cadres
+                )
+
+    @staticmethod
+    def _charger(
+        element: ElementDecor,
+        image_fixe: pygame.Surface | None,
+    ) -> dict[str, list[pygame.Surface]] | None:
+        nom_fichier = PLANCHES_SPRITES.get(element)
+        if nom_fichier and (DOSSIER_ASSETS / nom_fichier).exists():
+            planche = charger_image(nom_fichier)
+            if planche is not None:
+                etats = decouper_planche(planche)
+                if etats[REPOS]:
+                    return etats
+        if image_fixe is None:
+            return None
+        return {REPOS: [image_fixe]}
+
+    def __contains__(self, element: ElementDecor) -> bool:
+        return (element, REPOS, REGARD[element]) in self.cache
+
+    def image(
+        self,
+        element: ElementDecor,
+        etat: str,
+        direction: str,
+        tick: int,
+    ) -> pygame.Surface:
+        """Image de l'animation (élément, état, direction) au tick donné."""
+        cadres = self.cache[element, etat, direction]
+        return cadres[tick // TICKS_PAR_IMAGE % len(cadres)]
+
+    def nb_surfaces(self) -> int:
+        return sum(len(cadres) for cadres in self.cache.values())
@@ -0,0 +1,110 @@
+"""
+Cadence adaptative des frames (option --cadence-adaptative).
+
+`clock.tick(FPS)` attend la fin de la frame : quand une frame déborde, la
+suivante part en retard et le jeu tourne au ralenti. Le Cadenceur tient un
+échéancier fixe de ticks de simulation et mesure séparément le coût de la
+simulation et celui du dessin. Quand le temps restant avant l'échéance ne
+suffit plus pour un dessin complet, la frame est dessinée en mode dégradé
+(couche statique en cache, HUD sans fond) ou pas dessinée du tout, et la
+simulation reste à l'heure.
+"""
+import time
+
+RENDU_COMPLET = "complet"
+RENDU_DEGRADE = "degrade"
+RENDU_SAUTE = "saute"
+
+LISSAGE = 0.1 # poids d'une nouvelle mesure dans les moyennes glissantes
+IMAGES_SAUTEES_MAX = 4 # au-delà, la frame est dessinée (en mode dégradé)
+RETARD_MAX = 0.25 # secondes de retard au-delà desquelles on se recale
+
+
+class Cadenceur:
+    """Échéancier des ticks et choix du rendu de chaque frame."""
+
+    def __init__(self, fps: int):
+        self.periode = 1 / fps
+        self.cout_simulation = 0.0
+        self.couts_rendu = {RENDU_COMPLET: 0.0, RENDU_DEGRADE: 0.0}
+        self.compteurs = {RENDU_COMPLET: 0, RENDU_DEGRADE: 0, RENDU_SAUTE: 0}
+        self.recalages = 0
+        self._sautees_de_suite = 0
+        self._rendu = RENDU_COMPLET
+        self._debut_tick = self._fin_simulation = time.perf_counter()
+        self.recaler()
+
+    def recaler(self):
+        """Repart d'une échéance à une période d'ici (après une pause)."""
+        self._echeance = time.perf_counter() + self.periode
+
+    def debut_tick(self):
+        self._debut_tick = time.perf_counter()
+
+    def choisir_rendu(self) -> str:
+        """
+        Termine la mesure de la simulation et choisit le rendu de la frame
+        selon le temps restant avant l'échéance.
+        """
+        self._fin_simulation = time.perf_counter()
+        self.cout_simulation += LISSAGE * (
+            self._fin_simulation - self._debut_tick - self.cout_simulation
+        )
+        restant = self._echeance - self._fin_simulation
+        if restant >= self.couts_rendu[RENDU_COMPLET]:
+            rendu = RENDU_COMPLET
+        elif (
+            restant >= self.couts_rendu[RENDU_DEGRADE]
+            or self._sautees_de_suite >= IMAGES_SAUTEES_MAX
+        ):
+            rendu = RENDU_DEGRADE
+        else:
+            rendu = RENDU_SAUTE
+        self._sautees_de_suite = (
+            self._sautees_de_suite + 1 if rendu == RENDU_SAUTE else 0
+        )
+        self.compteurs[rendu] += 1
+        self._rendu = rendu
+        return rendu
+
+    def attendre(self):
+        """Mesure le dessin puis attend l'échéance du tick suivant."""
+        maintenant = time.perf_counter()
+        if self._rendu != RENDU_SAUTE:
+            cout = self.couts_rendu[self._rendu]
+            self.couts_rendu[self._rendu] = cout + LISSAGE * (
+                maintenant - self._fin_simulation - cout
+            )
+        if maintenant - self._echeance > RETARD_MAX:
+            # La simulation seule ne tient plus la cadence : on accepte le
+            # ralenti plutôt que d'enchaîner les ticks sans dessin
+            self.recalages += 1
+            self.recaler()
+            return
+        if self._echeance > maintenant:
+            time.sleep(self._echeance - maintenant)
+        self._echeance += self.periode
+
+    def statistiques(self) -> dict:
+        """Frames par type de rendu et coûts moyens (ms)."""
+        return {
+            "images_completes": self.compteurs[RENDU_COMPLET],
+            "images_degradees": self.compteurs[RENDU_DEGRADE],
+            "images_sautees": self.compteurs[RENDU_SAUTE],
+            "recalages": self.recalages,
+            "simulation_ms": self.cout_simulation * 1000,
+            "rendu_complet_ms": self.couts_rendu[RENDU_COMPLET] * 1000,
+            "rendu_degrade_ms": self.couts_rendu[RENDU_DEGRADE] * 1000,
+        }
+
+
+def afficher_statistiques(statistiques: dict):
+    print(
+        f"Cadence : {statistiques['images_completes']} images complètes, "
+        f"{statistiques['images_degradees']} dégradées, "
+        f"{statistiques['images_sautees']} sautées, "
+        f"{statistiques['recalages']} recalages | "
+        f"simulation {statistiques['simulation_ms']:.2f} ms, "
+        f"rendu {statistiques['rendu_complet_ms']:.2f} ms "
+        f"(dégradé {statistiques['rendu_degrade_ms']:.2f} ms)"
+    )
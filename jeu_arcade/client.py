@@ -0,0 +1,244 @@
+"""
+Client du jeu en réseau local.
+
+    python -m jeu_arcade.client --hote 127.0.0.1
+
+Le client n'a aucune physique : il envoie ses touches au serveur à chaque
+frame et dessine la dernière image du monde reçue. Le niveau (décor fixe)
+est reçu une fois, à l'arrivée dans la partie.
+"""
+import argparse
+import socket
+import sys
+import time
+
+import pygame
+
+from jeu_arcade.affichage import afficher_hud, dessiner_decor, preparer_decor
+from jeu_arcade.config import (
+    COULEUR_TEXTE,
+    COULEURS,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    FPS,
+    NOM_DU_JEU,
+    TAILLE_TUILE,
+    ElementDecor,
+)
+from jeu_arcade.modes import MODE_PAR_DEFAUT, MODES
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.reseau import (
+    BIENVENUE,
+    COMPLET,
+    IMAGE,
+    PORT_PAR_DEFAUT,
+    QUITTER,
+    REJOINDRE,
+    TAILLE_DATAGRAMME,
+    decoder_bienvenue,
+    decoder_image,
+    encoder_touches,
+    touches_vers_actions,
+)
+
+DELAI_CONNEXION = 5.0 # secondes d'attente de la réponse du serveur
+INTERVALLE_REJOINDRE = 0.2 # secondes entre deux demandes
+
+
+class ConnexionRefuseeErreur(Exception):
+    """Le serveur ne répond pas ou n'a plus de place."""
+
+
+class Client:
+    """Connexion UDP d'un joueur au serveur."""
+
+    def __init__(self, adresse_serveur: tuple[str, int]):
+        self.adresse_serveur = adresse_serveur
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.connect(adresse_serveur)
+        self.identifiant: int | None = None
+        self.donnees_texte = ""
+        self.sequence = 0
+        self.octets_recus = 0
+        self.octets_envoyes = 0
+        self.derniere_image: dict | None = None
+
+    def rejoindre(self, delai: float = DELAI_CONNEXION):
+        """
+        Demande une place jusqu'à recevoir la bienvenue du serveur.
+        Lève ConnexionRefuseeErreur si la partie est complète ou sans réponse.
+        """
+        limite = time.monotonic() + delai
+        self.socket.settimeout(INTERVALLE_REJOINDRE)
+        try:
+            while time.monotonic() < limite:
+                self.socket.send(REJOINDRE)
+                try:
+                    message = self.socket.recv(TAILLE_DATAGRAMME)
+                except (socket.timeout, ConnectionRefusedError):
+                    continue
+                if message[:1] == COMPLET:
+                    raise ConnexionRefuseeErreur("La partie est complète.")
+                if message[:1] == BIENVENUE:
+                    self.identifiant, self.donnees_texte = (
+                        decoder_bienvenue(message)
+                    )
+                    return
+        finally:
+            self.socket.setblocking(False)
+        raise ConnexionRefuseeErreur(
+            f"Pas de réponse de {self.adresse_serveur[0]}:"
+            f"{self.adresse_serveur[1]}."
+        )
+
+    def envoyer_actions(self, actions: int):
+        """Envoie le masque des touches tenues à cette frame."""
+        message = encoder_touches(self.sequence, actions)
+        self.sequence += 1
+        try:
+            self.socket.send(message)
+        except ConnectionRefusedError:
+            return
+        self.octets_envoyes += len(message)
+
+    def recevoir(self) -> dict | None:
+        """
+        Lit les images en attente sans bloquer et retourne la plus récente
+        reçue jusqu'ici (None avant la première).
+        """
+        while True:
+            try:
+                message = self.socket.recv(TAILLE_DATAGRAMME)
+            except (BlockingIOError, ConnectionRefusedError):
+                break
+            self.octets_recus += len(message)
+            if message[:1] != IMAGE:
+                continue
+            image = decoder_image(message)
+            if (
+                self.derniere_image is None
+                or image['tick'] > self.derniere_image['tick']
+            ):
+                self.derniere_image = image
+        return self.derniere_image
+
+    def fermer(self):
+        try:
+            self.socket.send(QUITTER)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+def dessiner_image(
+    ecran: pygame.Surface,
+    image: dict,
+    identifiant: int,
+    images: dict[ElementDecor, pygame.Surface],
+    images_retournees: dict[ElementDecor, pygame.Surface],
+    font: pygame.font.Font,
+):
+    """Dessine les joueurs (numérotés) et les monstres mobiles d'une image."""
+    element = ElementDecor.MONSTRE_MOBILE
+    if not images.get(element):
+        element = ElementDecor.MONSTRE
+    for x, y, direction in image['monstres']:
+        rect = pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE)
+        if images.get(element):
+            # Les images de monstre regardent vers la gauche
+            img = images[element] if direction == "gauche" else (
+                images_retournees[element]
+            )
+            ecran.blit(img, rect)
+        else:
+            ecran.fill(COULEURS[ElementDecor.MONSTRE_MOBILE], rect)
+    for numero, etat in image['joueurs'].items():
+        rect = pygame.Rect(etat['x'], etat['y'], TAILLE_TUILE, TAILLE_TUILE)
+        if images.get(ElementDecor.JOUEUR):
+            if etat['direction'] == "gauche":
+                ecran.blit(images_retournees[ElementDecor.JOUEUR], rect)
+            else:
+                ecran.blit(images[ElementDecor.JOUEUR], rect)
+        else:
+            ecran.fill(COULEURS[ElementDecor.JOUEUR], rect)
+        couleur = (255, 215, 0) if numero == identifiant else COULEUR_TEXTE
+        etiquette = font.render(str(numero + 1), True, couleur)
+        ecran.blit(etiquette, etiquette.get_rect(midbottom=rect.midtop))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="jeu_arcade.client", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--hote", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT_PAR_DEFAUT)
+    parser.add_argument(
+        "--mode", choices=MODES, default=MODE_PAR_DEFAUT,
+        help="images utilisées pour le dessin (défaut : %(default)s)",
+    )
+    args = parser.parse_args()
+    mode = MODES[args.mode]
+
+    client = Client((args.hote, args.port))
+    try:
+        client.rejoindre()
+    except ConnexionRefuseeErreur as e:
+        print(f"Connexion impossible : {e}")
+        sys.exit(1)
+    print(f"Connecté en tant que joueur {client.identifiant + 1}.")
+
+    pygame.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    pygame.display.set_caption(
+        f"{NOM_DU_JEU} - Joueur {client.identifiant + 1}"
+    )
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 30)
+    images = {}
+    images_retournees = {}
+    if mode.images:
+        from jeu_arcade.images import initialiser_images, retourner_images
+        images = initialiser_images(mode.elements)
+        images_retournees = retourner_images(images)
+    # Le serveur a déjà validé le niveau : tous les éléments sont acceptés
+    niveau_data = construire_niveau(client.donnees_texte)
+    decor = preparer_decor(niveau_data, images)
+
+    debut_debit = time.perf_counter()
+    octets_debut = 0
+    debit = 0.0
+    en_cours = True
+    while en_cours:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT: en_cours = False
+        client.envoyer_actions(touches_vers_actions(pygame.key.get_pressed()))
+        image = client.recevoir()
+
+        maintenant = time.perf_counter()
+        if maintenant - debut_debit >= 1.0:
+            debit = (client.octets_recus - octets_debut) / (maintenant - debut_debit)
+            octets_debut = client.octets_recus
+            debut_debit = maintenant
+
+        dessiner_decor(ecran, decor)
+        if image is not None:
+            dessiner_image(
+                ecran, image, client.identifiant, images, images_retournees,
+                font,
+            )
+            etat = image['joueurs'].get(client.identifiant)
+            afficher_hud(
+                ecran,
+                numero_joueur=client.identifiant,
+                sorties=etat['sorties'] if etat else 0,
+                tick=image['tick'],
+                debit=debit,
+            )
+        pygame.display.flip()
+        clock.tick(FPS)
+    client.fermer()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
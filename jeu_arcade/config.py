@@ -0,0 +1,119 @@
+"""Constantes du jeu : écran, chemins, éléments du décor, couleurs, physique."""
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+
+NOM_DU_JEU = "The Arcade Game"
+ECRAN_LARGEUR, ECRAN_HAUTEUR = 800, 600
+TAILLE_TUILE = 40
+FPS = 60
+
+# Chemins
+RACINE = Path(__file__).resolve().parent.parent
+DOSSIER_ASSETS = RACINE / "assets"
+DOSSIER_NIVEAUX = RACINE / "niveaux"
+DOSSIER_NIVEAUX_MONSTRES = RACINE / "niveaux_monstres"
+DOSSIER_NIVEAUX_MONSTRES_MOBILES = RACINE / "niveaux_monstres_mobiles"
+
+# Fichiers Images
+IMG_JOUEUR = "joueur.png"
+IMG_BLOC = "bloc.png"
+IMG_SORTIE = "sortie.png"
+IMG_FOND = "fond.jpg"
+IMG_MONSTRE = "monstre.png"
+IMG_MONSTRE_MOBILE = "monstre_mobiles.png"
+
+# Couches du fond en parallaxe (fichier, facteur de défilement), de la plus
+# lointaine à la plus proche ; une couche dont l'image manque est ignorée
+COUCHES_PARALLAXE = (
+    (IMG_FOND, 0.1),
+    ("fond_collines.png", 0.3),
+    ("fond_arbres.png", 0.6),
+)
+
+
+class ElementDecor(Enum):
+    MUR = "#"
+    JOUEUR = "P"
+    SORTIE = "E"
+    VIDE = "."
+    MONSTRE = "M"
+    MONSTRE_MOBILE = "X"
+
+
+# Planches de sprites animés ; sans planche, l'image fixe est utilisée
+PLANCHES_SPRITES = {
+    ElementDecor.JOUEUR: "joueur_planche.png",
+    ElementDecor.MONSTRE: "monstre_planche.png",
+    ElementDecor.MONSTRE_MOBILE: "monstre_mobiles_planche.png",
+}
+
+# Identifiants des tuiles dans les grilles uint8 des niveaux
+TUILE_VIDE = 0
+TUILE_MUR = 1
+TUILE_SORTIE = 2
+TUILE_MONSTRE = 3
+TUILE_MONSTRE_MOBILE = 4
+TUILE_JOUEUR = 5
+TUILE_INVALIDE = 255 # caractère inconnu, n'apparaît jamais dans une grille
+
+Couleur = tuple[int, int, int]
+GRIS: Couleur = (100, 100, 100)
+VERT: Couleur = (0, 200, 0)
+ROUGE: Couleur = (255, 0, 0)
+NOIR: Couleur = (0, 0, 0)
+VIOLET: Couleur = (148, 0, 211)
+ORANGE: Couleur = (255, 140, 0)
+
+
+
+@dataclass(frozen=True)
+class TypeTuile:
+    """Une ligne du registre des tuiles."""
+    ident: int # identifiant dans les grilles uint8
+    element: ElementDecor # caractère du fichier de niveau
+    couleur: Couleur # dessin sans image
+    image: str | None = None
+    solide: bool = False # arrête le joueur et les monstres mobiles
+    danger: bool = False # tue le joueur qui la touche
+    decor: bool = False # dessinée dans la couche fixe du décor
+
+
+# Registre des tuiles. Une nouvelle tuile fixe n'a besoin que d'un élément
+# dans ElementDecor et d'une ligne ici : lecture, collisions et dessin
+# passent par les tables de `tables_tuiles`.
+REGISTRE_TUILES = (
+    TypeTuile(TUILE_VIDE, ElementDecor.VIDE, NOIR, IMG_FOND),
+    TypeTuile(
+        TUILE_MUR, ElementDecor.MUR, GRIS, IMG_BLOC, solide=True, decor=True
+    ),
+    TypeTuile(TUILE_SORTIE, ElementDecor.SORTIE, VERT, IMG_SORTIE, decor=True),
+    TypeTuile(
+        TUILE_MONSTRE, ElementDecor.MONSTRE, VIOLET, IMG_MONSTRE,
+        danger=True, decor=True,
+    ),
+    TypeTuile(
+        TUILE_MONSTRE_MOBILE, ElementDecor.MONSTRE_MOBILE, ORANGE,
+        IMG_MONSTRE_MOBILE,
+    ),
+    TypeTuile(TUILE_JOUEUR, ElementDecor.JOUEUR, ROUGE, IMG_JOUEUR),
+)
+TUILES = {tuile.element: tuile for tuile in REGISTRE_TUILES}
+IDS_TUILES = {tuile.element: tuile.ident for tuile in REGISTRE_TUILES}
+COULEURS = {tuile.element: tuile.couleur for tuile in REGISTRE_TUILES}
+
+COULEUR_TEXTE = NOIR
+COULEUR_HUD_BG = (0, 0, 0, 150) # Fond semi-transparent pour le texte
+
+# Physique
+GRAVITE = 1
+VITESSE_SAUT = 15
+VITESSE_MAX_X = 5
+VITESSE_MAX_Y = 15
+VITESSE_MONSTRE = 2
+
+# Actions : masque de bits combinant les touches du jeu (environnement
+# vectorisé, protocole réseau, traces des benchmarks)
+ACTION_GAUCHE = 1   # K_LEFT
+ACTION_DROITE = 2   # K_RIGHT
+ACTION_SAUT = 4     # K_SPACE
@@ -0,0 +1,412 @@
+"""
+Éditeur de niveaux.
+
+    python -m jeu_arcade.editeur niveaux/niveau_4.txt
+
+Clic gauche : peint l'élément choisi (touches 1 à 6 ou molette) ; clic
+droit : efface. Le niveau est vérifié à chaque modification avec les
+règles du chargement (un seul départ P, une seule sortie E) et l'erreur
+reste affichée dans la barre du haut tant qu'elle n'est pas corrigée. S
+enregistre le niveau s'il est valide, TAB l'essaie (flèches et ESPACE) et
+ÉCHAP quitte.
+
+Une modification ne reconstruit pas le niveau : la case change dans la
+grille, son rectangle est inséré ou retiré à sa place dans les listes
+triées de tuiles (`bisect`), le monstre mobile entre ou sort de la
+réserve, et seule la case est redessinée dans la couche du décor en cache.
+"""
+import argparse
+from bisect import bisect_left, insort
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from jeu_arcade.affichage import dessiner_entites
+from jeu_arcade.config import (
+    COULEUR_HUD_BG,
+    COULEURS,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    FPS,
+    IDS_TUILES,
+    NOM_DU_JEU,
+    REGISTRE_TUILES,
+    TAILLE_TUILE,
+    TUILE_JOUEUR,
+    TUILE_MONSTRE_MOBILE,
+    TUILE_SORTIE,
+    TUILE_VIDE,
+    ElementDecor,
+)
+from jeu_arcade.erreurs import NiveauErreur
+from jeu_arcade.monstres import gerer_physique_monstres, verifier_collisions_danger
+from jeu_arcade.niveau import (
+    creer_tuile,
+    decoder_lignes,
+    decouper_lignes,
+    monstres_mobiles_de,
+    positions_de,
+    rects_de,
+    verifier_comptes,
+)
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+from jeu_arcade.tables_tuiles import DANGERS, DECOR, PAR_ID, SOLIDES, TUILES_DECOR
+
+# Éléments des touches 1 à 6 : ceux du registre, le vide en dernier
+PALETTE = tuple(
+    tuile.element for tuile in REGISTRE_TUILES if tuile.ident != TUILE_VIDE
+) + (ElementDecor.VIDE,)
+# Familles de tuiles et liste de `niveau_data` où elles sont rangées
+FAMILLES = ((SOLIDES, 'tuiles_sol'), (DANGERS, 'tuiles_monstres_fixes'))
+# Identifiant de tuile -> caractère du fichier, pour bytes.translate
+CARACTERES = bytes(
+    ord(PAR_ID[i].element.value) if i in PAR_ID else 0 for i in range(256)
+)
+HAUTEUR_BARRE = 30
+COULEUR_BARRE = (255, 255, 255)
+COULEUR_ERREUR = (255, 90, 90)
+COULEUR_QUADRILLAGE = (255, 255, 255, 40)
+COULEUR_CURSEUR = (255, 255, 0)
+
+
+def _cle(rect: pygame.Rect) -> tuple[int, int]:
+    """Ordre des listes de tuiles : ligne puis colonne."""
+    return (rect.y, rect.x)
+
+
+def _premiere(positions: set[tuple[int, int]]) -> tuple[int, int] | None:
+    """Première position dans l'ordre des lignes, comme au chargement."""
+    return min(positions, key=lambda p: (p[1], p[0]), default=None)
+
+
+class Editeur:
+    """Grille d'un niveau en cours d'édition, et son `niveau_data` à jour."""
+
+    def __init__(self, lignes: list[str], images: dict):
+        source = decoder_lignes(lignes) if lignes else np.zeros((0, 0), np.uint8)
+        # Partie de la grille écrite dans le fichier
+        self.hauteur, self.largeur = source.shape
+        self.grille = np.full(
+            (
+                max(self.hauteur, ECRAN_HAUTEUR // TAILLE_TUILE),
+                max(self.largeur, ECRAN_LARGEUR // TAILLE_TUILE),
+            ),
+            TUILE_VIDE, dtype=np.uint8,
+        )
+        self.grille[:self.hauteur, :self.largeur] = source
+        self.uniques = {
+            TUILE_JOUEUR: set(positions_de(self.grille, TUILE_JOUEUR)),
+            TUILE_SORTIE: set(positions_de(self.grille, TUILE_SORTIE)),
+        }
+        self.niveau = {
+            "tuiles_sol": rects_de(self.grille, SOLIDES),
+            "tuile_sortie": None,
+            "pos_joueur": None,
+            "tuiles_monstres_fixes": rects_de(self.grille, DANGERS),
+            "tuiles_monstres_mobiles": monstres_mobiles_de(self.grille),
+            "grille": self.grille,
+            "lignes": lignes,
+        }
+        self._mettre_a_jour_uniques()
+        self.images = images
+        self.couche = self._rendre_couche()
+        self.erreur = self.verifier()
+        self.modifie = False
+
+    def dessiner_element(
+        self, surface: pygame.Surface, element: ElementDecor, rect: pygame.Rect
+    ):
+        img = self.images.get(element)
+        if img:
+            surface.blit(img, rect)
+        else:
+            surface.fill(COULEURS[element], rect)
+
+    def _rendre_couche(self) -> pygame.Surface:
+        """Fond, murs, monstres fixes et sorties de toute la grille."""
+        hauteur, largeur = self.grille.shape
+        couche = pygame.Surface((largeur * TAILLE_TUILE, hauteur * TAILLE_TUILE))
+        couche.fill(COULEURS[ElementDecor.VIDE])
+        if self.images.get(ElementDecor.VIDE):
+            couche.blit(self.images[ElementDecor.VIDE], (0, 0))
+        for tuile in TUILES_DECOR:
+            for rect in rects_de(self.grille, tuile.ident):
+                self.dessiner_element(couche, tuile.element, rect)
+        return couche
+
+    def _redessiner_case(self, colonne: int, ligne: int):
+        rect = creer_tuile(colonne, ligne)
+        self.couche.fill(COULEURS[ElementDecor.VIDE], rect)
+        if self.images.get(ElementDecor.VIDE):
+            self.couche.blit(self.images[ElementDecor.VIDE], rect, rect)
+        tuile = int(self.grille[ligne, colonne])
+        if DECOR[tuile]:
+            self.dessiner_element(self.couche, PAR_ID[tuile].element, rect)
+
+    def _mettre_a_jour_uniques(self):
+        sortie = _premiere(self.uniques[TUILE_SORTIE])
+        self.niveau['tuile_sortie'] = (
+            sortie and pygame.Rect(*sortie, TAILLE_TUILE, TAILLE_TUILE)
+        )
+        self.niveau['pos_joueur'] = _premiere(self.uniques[TUILE_JOUEUR])
+
+    def _retirer(self, tuile: int, x: int, y: int):
+        for famille, cle in FAMILLES:
+            if famille[tuile]:
+                liste = self.niveau[cle]
+                del liste[bisect_left(liste, (y, x), key=_cle)]
+        if tuile == TUILE_MONSTRE_MOBILE:
+            mobiles = self.niveau['tuiles_monstres_mobiles']
+            for m in mobiles:
+                if m['depart'] == (x, y):
+                    mobiles.retirer(m)
+                    break
+        elif tuile in self.uniques:
+            self.uniques[tuile].discard((x, y))
+            self._mettre_a_jour_uniques()
+
+    def _ajouter(self, tuile: int, x: int, y: int):
+        for famille, cle in FAMILLES:
+            if famille[tuile]:
+                insort(
+                    self.niveau[cle],
+                    pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE),
+                    key=_cle,
+                )
+        if tuile == TUILE_MONSTRE_MOBILE:
+            self.niveau['tuiles_monstres_mobiles'].ajouter(x, y)
+        elif tuile in self.uniques:
+            self.uniques[tuile].add((x, y))
+            self._mettre_a_jour_uniques()
+
+    def poser(self, colonne: int, ligne: int, element: ElementDecor) -> bool:
+        """
+        Met `element` dans la case (colonne, ligne) et met à jour les tuiles,
+        la couche du décor et la vérification. Faux si rien n'a changé.
+        """
+        tuile = IDS_TUILES[element]
+        ancienne = int(self.grille[ligne, colonne])
+        if tuile == ancienne:
+            return False
+        x, y = colonne * TAILLE_TUILE, ligne * TAILLE_TUILE
+        self._retirer(ancienne, x, y)
+        self.grille[ligne, colonne] = tuile
+        self._ajouter(tuile, x, y)
+        if DECOR[ancienne] or DECOR[tuile]:
+            self._redessiner_case(colonne, ligne)
+        if tuile != TUILE_VIDE:
+            self.hauteur = max(self.hauteur, ligne + 1)
+            self.largeur = max(self.largeur, colonne + 1)
+        self.erreur = self.verifier()
+        self.modifie = True
+        return True
+
+    def verifier(self) -> str | None:
+        """Message de la NiveauErreur que lèverait le chargement, ou None."""
+        try:
+            verifier_comptes(
+                len(self.uniques[TUILE_JOUEUR]), len(self.uniques[TUILE_SORTIE])
+            )
+        except NiveauErreur as e:
+            return str(e)
+        return None
+
+    def texte(self) -> str:
+        """Le niveau au format des fichiers `niveau_N.txt`."""
+        return "".join(
+            rangee.tobytes().translate(CARACTERES).decode("ascii") + "\n"
+            for rangee in self.grille[:self.hauteur, :self.largeur]
+        )
+
+    def enregistrer(self, chemin: Path) -> bool:
+        """Écrit le niveau dans `chemin` s'il est valide."""
+        if self.erreur:
+            return False
+        texte = self.texte()
+        chemin.write_text(texte, encoding="utf-8")
+        self.niveau['lignes'] = decouper_lignes(texte)
+        self.modifie = False
+        return True
+
+    def commencer_essai(self):
+        x, y = self.niveau['pos_joueur']
+        initialiser_joueur(x, y)
+
+    def terminer_essai(self):
+        """Remet les monstres mobiles à leur départ."""
+        monstres_mobiles_de(self.grille, 0, self.niveau['tuiles_monstres_mobiles'])
+        joueur['rect'] = None
+
+    def tick_essai(self, touches) -> str | None:
+        """Un tick de jeu ; retourne la fin de l'essai s'il est fini."""
+        gerer_physique_monstres(self.niveau)
+        appliquer_physique(self.niveau, touches)
+        verifier_collisions_danger(self.niveau)
+        if joueur['mort']:
+            return "Touché !"
+        if joueur['rect'].top > ECRAN_HAUTEUR: # Même limite que le jeu
+            return "Chute !"
+        if joueur['rect'].colliderect(self.niveau['tuile_sortie']):
+            return "Sortie atteinte !"
+        return None
+
+
+def _quadrillage(taille: tuple[int, int]) -> pygame.Surface:
+    surface = pygame.Surface(taille, pygame.SRCALPHA)
+    largeur, hauteur = taille
+    for x in range(0, largeur, TAILLE_TUILE):
+        pygame.draw.line(surface, COULEUR_QUADRILLAGE, (x, 0), (x, hauteur))
+    for y in range(0, hauteur, TAILLE_TUILE):
+        pygame.draw.line(surface, COULEUR_QUADRILLAGE, (0, y), (largeur, y))
+    return surface
+
+
+def editer(
+    ecran: pygame.Surface,
+    editeur: Editeur,
+    chemin: Path,
+    images_retournees: dict,
+):
+    """Boucle de l'éditeur, jusqu'à ÉCHAP ou la fermeture de la fenêtre."""
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 26)
+    quadrillage = _quadrillage(ecran.get_size())
+    fond_barre = pygame.Surface((ecran.get_width(), HAUTEUR_BARRE), pygame.SRCALPHA)
+    fond_barre.fill(COULEUR_HUD_BG)
+    choix = 0
+    essai = False
+    message = None
+    barre = None # (texte, surface) : rendu seulement quand le texte change
+    joueur['rect'] = None
+    while True:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    if not essai:
+                        return
+                    editeur.terminer_essai()
+                    essai = False
+                elif event.key == pygame.K_TAB:
+                    if essai:
+                        editeur.terminer_essai()
+                        essai = False
+                    elif editeur.erreur:
+                        message = "Niveau invalide : essai impossible."
+                    else:
+                        editeur.commencer_essai()
+                        essai = True
+                        message = None
+                elif essai:
+                    continue # Touches du jeu pendant l'essai
+                elif event.key == pygame.K_s:
+                    if editeur.enregistrer(chemin):
+                        message = f"Enregistré dans {chemin}."
+                    else:
+                        message = "Niveau invalide : non enregistré."
+                elif pygame.K_1 <= event.key < pygame.K_1 + len(PALETTE):
+                    choix = event.key - pygame.K_1
+            elif event.type == pygame.MOUSEWHEEL and not essai:
+                choix = (choix - event.y) % len(PALETTE)
+            elif (
+                event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+                and not essai
+            ):
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    boutons = (event.button == 1, False, event.button == 3)
+                else:
+                    boutons = event.buttons
+                colonne = event.pos[0] // TAILLE_TUILE
+                ligne = event.pos[1] // TAILLE_TUILE
+                hauteur, largeur = editeur.grille.shape
+                if not (0 <= colonne < largeur and 0 <= ligne < hauteur):
+                    continue
+                element = None
+                if boutons[0]:
+                    element = PALETTE[choix]
+                elif boutons[2]:
+                    element = ElementDecor.VIDE
+                if element and editeur.poser(colonne, ligne, element):
+                    message = None
+
+        if essai:
+            fin = editeur.tick_essai(pygame.key.get_pressed())
+            if fin:
+                editeur.terminer_essai()
+                essai = False
+                message = f"Essai terminé : {fin}"
+
+        ecran.blit(editeur.couche, (0, 0))
+        dessiner_entites(
+            ecran, editeur.niveau, editeur.images, images_retournees
+        )
+        if not essai:
+            # Départs du joueur (plusieurs tant que le niveau est invalide)
+            for position in editeur.uniques[TUILE_JOUEUR]:
+                editeur.dessiner_element(
+                    ecran, ElementDecor.JOUEUR,
+                    pygame.Rect(*position, TAILLE_TUILE, TAILLE_TUILE),
+                )
+            ecran.blit(quadrillage, (0, 0))
+            x, y = pygame.mouse.get_pos()
+            pygame.draw.rect(
+                ecran, COULEUR_CURSEUR,
+                creer_tuile(x // TAILLE_TUILE, y // TAILLE_TUILE), 2,
+            )
+
+        if essai:
+            texte = "Essai : TAB ou ÉCHAP pour revenir à l'édition"
+        else:
+            texte = f"[{choix + 1}] {PALETTE[choix].name}"
+            if editeur.modifie:
+                texte += " *"
+            texte += f" | {message or editeur.erreur or 'Niveau valide'}"
+        if barre is None or barre[0] != texte:
+            couleur = COULEUR_ERREUR if editeur.erreur and not essai else COULEUR_BARRE
+            barre = (texte, font.render(texte, True, couleur))
+        ecran.blit(fond_barre, (0, 0))
+        ecran.blit(barre[1], (8, (HAUTEUR_BARRE - barre[1].get_height()) // 2))
+        pygame.display.flip()
+        clock.tick(FPS)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="jeu_arcade.editeur", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "fichier", type=Path, help="niveau à éditer (créé à l'enregistrement)"
+    )
+    parser.add_argument(
+        "--couleurs",
+        action="store_true",
+        help="dessine les éléments en couleurs, sans charger les images",
+    )
+    args = parser.parse_args()
+    lignes = []
+    if args.fichier.exists():
+        lignes = decouper_lignes(args.fichier.read_text(encoding="utf-8"))
+    pygame.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    pygame.display.set_caption(f"{NOM_DU_JEU} - Éditeur - {args.fichier.name}")
+    images = {}
+    images_retournees = {}
+    if not args.couleurs:
+        from jeu_arcade.images import initialiser_images, retourner_images
+        images = initialiser_images(frozenset(ElementDecor))
+        images_retournees = retourner_images(images)
+    try:
+        editeur = Editeur(lignes, images)
+    except NiveauErreur as e:
+        print(f"Erreur critique: {e}")
+    else:
+        editer(ecran, editeur, args.fichier, images_retournees)
+        if editeur.modifie:
+            print("Modifications non enregistrées.")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
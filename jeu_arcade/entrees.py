@@ -0,0 +1,149 @@
+"""
+Entrées clavier pilotées par les événements.
+
+`pygame.key.get_pressed()` ne donne que l'état des touches au moment de la
+frame : un appui relâché entre deux frames, ou un saut demandé pendant que
+`au_sol` est faux, est perdu. Ici, l'état des touches suit les événements
+KEYDOWN/KEYUP, un appui bref compte pour le tick suivant et un appui sur
+ESPACE reste en mémoire quelques ticks, le temps que le joueur touche le
+sol. La boucle du jeu bloque les événements de souris, de manette et de
+saisie de texte, qu'elle n'utilise pas (`filtrer_evenements`) ; les autres
+(fenêtre, redimensionnement...) restent reçus.
+
+Chaque événement est daté ; quand l'image qui en montre l'effet est
+affichée, l'écart donne la latence entrée -> image.
+"""
+import time
+from collections import deque
+
+import pygame
+
+from jeu_arcade.physique import joueur
+
+TOUCHES_DU_JEU = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+TICKS_TAMPON_SAUT = 6 # ticks pendant lesquels un appui sur ESPACE attend le sol
+NB_LATENCES = 600 # latences conservées pour les statistiques
+INTERVALLE_RAPPORT = 5.0 # secondes entre deux rapports de latence
+# Événements dont la boucle du jeu n'a pas l'usage
+EVENEMENTS_IGNORES = [
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+]
+
+
+def _date(event) -> float:
+    """Date de l'événement sur l'horloge de perf_counter."""
+    horodatage = getattr(event, "timestamp", None) # pygame-ce
+    if horodatage is None:
+        return time.perf_counter()
+    retard = max(pygame.time.get_ticks() - horodatage, 0) / 1000
+    return time.perf_counter() - retard
+
+
+def filtrer_evenements():
+    """
+    Bloque les événements inutiles au jeu dans la file de Pygame. Réglage
+    global du processus : à appeler par la boucle du jeu, pas ailleurs.
+    """
+    pygame.event.set_blocked(EVENEMENTS_IGNORES)
+
+
+class Entrees:
+    """État des touches du jeu, tampon de saut et mesure de latence."""
+
+    def __init__(self, rapport: bool = False, autres_touches: tuple = ()):
+        self.rapport = rapport
+        self.tenues = dict.fromkeys(TOUCHES_DU_JEU + autres_touches, False)
+        self.latences: deque[float] = deque(maxlen=NB_LATENCES)
+        self.reinitialiser()
+
+    def reinitialiser(self) -> bool:
+        """
+        Oublie les appuis en attente (après un message bloquant). Vrai si la
+        fenêtre a été fermée pendant le message.
+        """
+        quitter = self.lire()
+        etat = pygame.key.get_pressed()
+        for touche in self.tenues:
+            self.tenues[touche] = bool(etat[touche])
+        self._appuis = set()
+        self._tampon_saut = 0
+        self._premiere_entree = None
+        self._prochain_rapport = time.perf_counter() + INTERVALLE_RAPPORT
+        return quitter
+
+    def lire(self) -> bool:
+        """Traite les événements en attente. Vrai si la fenêtre est fermée."""
+        quitter = False
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                quitter = True
+            elif (
+                event.type in (pygame.KEYDOWN, pygame.KEYUP)
+                and event.key in self.tenues
+            ):
+                appui = event.type == pygame.KEYDOWN
+                self.tenues[event.key] = appui
+                if appui:
+                    self._appuis.add(event.key)
+                    if event.key == pygame.K_SPACE:
+                        self._tampon_saut = TICKS_TAMPON_SAUT
+                if self._premiere_entree is None:
+                    self._premiere_entree = _date(event)
+        return quitter
+
+    def touches(self) -> dict:
+        """Touches du tick pour `appliquer_physique`."""
+        touches = {
+            touche: tenue or touche in self._appuis
+            for touche, tenue in self.tenues.items()
+        }
+        self._appuis.clear()
+        if self._tampon_saut:
+            if joueur['au_sol']:
+                touches[pygame.K_SPACE] = True # Le saut part à ce tick
+                self._tampon_saut = 0
+            else:
+                self._tampon_saut -= 1
+        return touches
+
+    def image_affichee(self):
+        """À appeler après l'affichage : clôt la latence des entrées lues."""
+        if self._premiere_entree is None:
+            return
+        maintenant = time.perf_counter()
+        self.latences.append(maintenant - self._premiere_entree)
+        self._premiere_entree = None
+        if self.rapport and maintenant >= self._prochain_rapport:
+            afficher_latences(self.statistiques())
+            self._prochain_rapport = maintenant + INTERVALLE_RAPPORT
+
+    def statistiques(self) -> dict:
+        """Latences entrée -> image (ms) des dernières images."""
+        if not self.latences:
+            return {"images": 0, "moyenne_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        triees = sorted(self.latences)
+        return {
+            "images": len(triees),
+            "moyenne_ms": sum(triees) / len(triees) * 1000,
+            "p95_ms": triees[int(0.95 * (len(triees) - 1))] * 1000,
+            "max_ms": triees[-1] * 1000,
+        }
+
+
+def afficher_latences(statistiques: dict):
+    print(
+        f"Latence entrée -> image ({statistiques['images']} images) : "
+        f"moyenne {statistiques['moyenne_ms']:.1f} ms, "
+        f"p95 {statistiques['p95_ms']:.1f} ms, "
+        f"max {statistiques['max_ms']:.1f} ms"
+    )
@@ -0,0 +1,361 @@
+"""
+Environnement vectorisé : N parties indépendantes simulées en lot avec NumPy.
+
+Chaque instance reprend les règles du mode `stats` (vitesses du joueur,
+collisions séparées par axe, monstres mobiles, hitbox des monstres) mais
+l'état de toutes les instances est stocké dans des tableaux NumPy, si bien
+qu'un appel à `pas()` fait avancer les N parties d'un tick d'un seul coup,
+sans fenêtre ni boucle pygame.
+"""
+import time
+from pathlib import Path
+
+import numpy as np
+
+from jeu_arcade.config import (
+    ACTION_DROITE,
+    ACTION_GAUCHE,
+    ACTION_SAUT,
+    DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    GRAVITE,
+    TAILLE_TUILE,
+    TUILE_JOUEUR,
+    TUILE_MONSTRE_MOBILE,
+    TUILE_VIDE,
+    VITESSE_MAX_X,
+    VITESSE_MAX_Y,
+    VITESSE_SAUT,
+)
+from jeu_arcade.niveau import charger_niveau, construire_niveau
+from jeu_arcade.tables_tuiles import DANGERS, SOLIDES
+
+NB_ACTIONS = 8 # combinaisons des masques ACTION_* de config
+
+RAYON_OBSERVATION = 3 # Fenêtre de (2R+1) x (2R+1) tuiles autour du joueur
+RECOMPENSE_SORTIE = 1.0
+RECOMPENSE_MORT = -1.0
+RECOMPENSE_PAS = -0.001
+# Demi-largeur de la hitbox réduite des monstres (inflate(-10, -10))
+MARGE_HITBOX = 5
+
+
+def niveau_vers_tableaux(donnees_texte: str) -> dict:
+    """
+    Construit le niveau avec `construire_niveau` (mêmes erreurs NiveauErreur)
+    et en garde la grille des tuiles statiques et les positions de départ.
+    """
+    niveau = construire_niveau(donnees_texte)
+    grille = niveau['grille'].copy()
+    # Le joueur et les monstres mobiles ne font pas partie du décor
+    grille[(grille == TUILE_JOUEUR) | (grille == TUILE_MONSTRE_MOBILE)] = (
+        TUILE_VIDE
+    )
+    sortie = niveau['tuile_sortie']
+    mobiles = np.array(
+        [
+            (m['rect'].x, m['rect'].y, m['vitesse_x'])
+            for m in niveau['tuiles_monstres_mobiles']
+        ],
+        dtype=np.int32,
+    ).reshape(-1, 3)
+    return {
+        "grille": grille,
+        "pos_joueur": niveau['pos_joueur'],
+        "pos_sortie": (sortie.x, sortie.y),
+        "monstres_mobiles": mobiles,
+    }
+
+
+class EnvironnementVectorise:
+    """
+    N instances indépendantes du jeu avec monstres mobiles.
+
+    Les niveaux sont complétés par du vide jusqu'à la taille du plus grand.
+    Une instance terminée (sortie atteinte, chute ou monstre touché) est
+    réinitialisée automatiquement sur son niveau au pas suivant.
+    """
+
+    def __init__(self, niveaux: list[str]):
+        if not niveaux:
+            raise ValueError("Il faut au moins un niveau.")
+        tableaux = [niveau_vers_tableaux(texte) for texte in niveaux]
+        self.nb_instances = n = len(tableaux)
+        hauteur = max(t['grille'].shape[0] for t in tableaux)
+        largeur = max(t['grille'].shape[1] for t in tableaux)
+        nb_monstres = max(len(t['monstres_mobiles']) for t in tableaux)
+
+        self.grilles = np.full((n, hauteur, largeur), TUILE_VIDE, np.uint8)
+        self.depart = np.zeros((n, 2), np.int32)
+        self.sortie = np.zeros((n, 2), np.int32)
+        self.monstres_depart = np.zeros((n, nb_monstres, 3), np.int32)
+        self.monstres_presents_depart = np.zeros((n, nb_monstres), bool)
+        for i, t in enumerate(tableaux):
+            h, w = t['grille'].shape
+            self.grilles[i, :h, :w] = t['grille']
+            self.depart[i] = t['pos_joueur']
+            self.sortie[i] = t['pos_sortie']
+            m = len(t['monstres_mobiles'])
+            self.monstres_depart[i, :m] = t['monstres_mobiles']
+            self.monstres_presents_depart[i, :m] = True
+
+        # État du joueur (un élément par instance)
+        self.x = np.zeros(n, np.int32)
+        self.y = np.zeros(n, np.int32)
+        self.vitesse_x = np.zeros(n, np.int32)
+        self.vitesse_y = np.zeros(n, np.int32)
+        self.au_sol = np.zeros(n, bool)
+        self.mort = np.zeros(n, bool)
+        # État des monstres mobiles (instance, monstre)
+        self.mx = np.zeros((n, nb_monstres), np.int32)
+        self.my = np.zeros((n, nb_monstres), np.int32)
+        self.mvx = np.zeros((n, nb_monstres), np.int32)
+        self.mvy = np.zeros((n, nb_monstres), np.int32)
+        self.monstres_presents = np.zeros((n, nb_monstres), bool)
+        self.ticks = np.zeros(n, np.int64)
+
+        self._indices = np.arange(n)
+        self.reinitialiser()
+
+    @classmethod
+    def depuis_numeros(
+        cls,
+        numeros: list[int],
+        dossier: Path = DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ) -> "EnvironnementVectorise":
+        """Crée l'environnement à partir de numéros de niveaux sur disque."""
+        return cls([charger_niveau(numero, dossier) for numero in numeros])
+
+    def reinitialiser(self, masque: np.ndarray | None = None) -> np.ndarray:
+        """Remet les instances du masque (toutes par défaut) au départ."""
+        if masque is None:
+            masque = np.ones(self.nb_instances, bool)
+        self.x[masque] = self.depart[masque, 0]
+        self.y[masque] = self.depart[masque, 1]
+        self.vitesse_x[masque] = 0
+        self.vitesse_y[masque] = 0
+        self.au_sol[masque] = False
+        self.mort[masque] = False
+        self.mx[masque] = self.monstres_depart[masque, :, 0]
+        self.my[masque] = self.monstres_depart[masque, :, 1]
+        self.mvx[masque] = self.monstres_depart[masque, :, 2]
+        self.mvy[masque] = 0
+        self.monstres_presents[masque] = self.monstres_presents_depart[masque]
+        self.ticks[masque] = 0
+        return self.observations()
+
+    def _tuiles(self, lignes: np.ndarray, colonnes: np.ndarray) -> np.ndarray:
+        """Lit les tuiles aux cellules données ; hors grille, c'est du vide."""
+        _, hauteur, largeur = self.grilles.shape
+        dedans = (
+            (lignes >= 0) & (lignes < hauteur)
+            & (colonnes >= 0) & (colonnes < largeur)
+        )
+        indices = self._indices.reshape((-1,) + (1,) * (lignes.ndim - 1))
+        tuiles = self.grilles[
+            indices,
+            np.clip(lignes, 0, hauteur - 1),
+            np.clip(colonnes, 0, largeur - 1),
+        ]
+        return np.where(dedans, tuiles, TUILE_VIDE)
+
+    def _solide(self, lignes: np.ndarray, colonnes: np.ndarray) -> np.ndarray:
+        return SOLIDES[self._tuiles(lignes, colonnes)]
+
+    def _collision_colonne(self, y, colonne):
+        """Vrai si une des lignes couvertes par le rect touche un mur."""
+        haut = y // TAILLE_TUILE
+        bas = (y + TAILLE_TUILE - 1) // TAILLE_TUILE
+        return self._solide(haut, colonne) | self._solide(bas, colonne)
+
+    def _collision_ligne(self, x, ligne):
+        """Vrai si une des colonnes couvertes par le rect touche un mur."""
+        gauche = x // TAILLE_TUILE
+        droite = (x + TAILLE_TUILE - 1) // TAILLE_TUILE
+        return self._solide(ligne, gauche) | self._solide(ligne, droite)
+
+    def _physique_monstres(self):
+        """Équivalent vectorisé de `gerer_physique_monstres`."""
+        presents = self.monstres_presents
+        self.mvy = np.minimum(self.mvy + GRAVITE, VITESSE_MAX_Y)
+        self.mx += np.where(presents, self.mvx, 0)
+        self.mvx = np.where(
+            self.mx <= 0, np.abs(self.mvx),
+            np.where(
+                self.mx + TAILLE_TUILE >= ECRAN_LARGEUR,
+                -np.abs(self.mvx), self.mvx,
+            ),
+        )
+        # Collisions horizontales : on teste la colonne du bord avant
+        avance = self.mvx > 0
+        bord = np.where(avance, self.mx + TAILLE_TUILE - 1, self.mx)
+        colonne = bord // TAILLE_TUILE
+        choc = presents & (self.mvx != 0) & self._collision_colonne(
+            self.my, colonne
+        )
+        self.mx = np.where(
+            choc & avance, colonne * TAILLE_TUILE - TAILLE_TUILE,
+            np.where(choc, (colonne + 1) * TAILLE_TUILE, self.mx),
+        )
+        self.mvx = np.where(choc, -self.mvx, self.mvx)
+        # Collisions verticales : seul l'atterrissage est géré
+        self.my += np.where(presents, self.mvy, 0)
+        ligne = (self.my + TAILLE_TUILE - 1) // TAILLE_TUILE
+        pose = (
+            presents & (self.mvy > 0) & self._collision_ligne(self.mx, ligne)
+        )
+        self.my = np.where(pose, ligne * TAILLE_TUILE - TAILLE_TUILE, self.my)
+        self.mvy = np.where(pose, 0, self.mvy)
+        self.monstres_presents = presents & (self.my <= ECRAN_HAUTEUR)
+
+    def _physique_joueurs(self, actions: np.ndarray):
+        """Équivalent vectorisé de `appliquer_physique`."""
+        gauche = (actions & ACTION_GAUCHE) != 0
+        droite = (actions & ACTION_DROITE) != 0
+        saut = (actions & ACTION_SAUT) != 0
+        # mettre_a_jour_vitesses (la droite l'emporte, comme dans le jeu)
+        self.vitesse_x = np.where(
+            droite, VITESSE_MAX_X, np.where(gauche, -VITESSE_MAX_X, 0)
+        ).astype(np.int32)
+        self.vitesse_y = np.where(
+            self.au_sol, self.vitesse_y, self.vitesse_y + GRAVITE
+        )
+        saute = saut & self.au_sol
+        self.vitesse_y = np.where(saute, -VITESSE_SAUT, self.vitesse_y)
+        self.au_sol &= ~saute
+        self.vitesse_y = np.minimum(self.vitesse_y, VITESSE_MAX_Y)
+
+        # Axe X
+        self.x += self.vitesse_x
+        avance = self.vitesse_x > 0
+        bord = np.where(avance, self.x + TAILLE_TUILE - 1, self.x)
+        colonne = bord // TAILLE_TUILE
+        choc = (self.vitesse_x != 0) & self._collision_colonne(
+            self.y, colonne
+        )
+        self.x = np.where(
+            choc & avance, colonne * TAILLE_TUILE - TAILLE_TUILE,
+            np.where(choc, (colonne + 1) * TAILLE_TUILE, self.x),
+        )
+
+        # Axe Y
+        self.y += self.vitesse_y
+        self.au_sol[:] = False
+        descend = self.vitesse_y > 0
+        bord = np.where(descend, self.y + TAILLE_TUILE - 1, self.y)
+        ligne = bord // TAILLE_TUILE
+        choc = (self.vitesse_y != 0) & self._collision_ligne(self.x, ligne)
+        self.y = np.where(
+            choc & descend, ligne * TAILLE_TUILE - TAILLE_TUILE,
+            np.where(choc, (ligne + 1) * TAILLE_TUILE, self.y),
+        )
+        self.au_sol = choc & descend
+        self.vitesse_y = np.where(choc, 0, self.vitesse_y)
+
+        self._collisions_danger()
+
+    def _collisions_danger(self):
+        """Équivalent vectorisé de `verifier_collisions_danger`."""
+        portee = TAILLE_TUILE - MARGE_HITBOX
+        # Monstres fixes : au plus 2x2 cellules recouvertes par le joueur
+        touche = np.zeros(self.nb_instances, bool)
+        for ligne in (
+            self.y // TAILLE_TUILE, (self.y + TAILLE_TUILE - 1) // TAILLE_TUILE
+        ):
+            for colonne in (
+                self.x // TAILLE_TUILE,
+                (self.x + TAILLE_TUILE - 1) // TAILLE_TUILE,
+            ):
+                dx = self.x - colonne * TAILLE_TUILE
+                dy = self.y - ligne * TAILLE_TUILE
+                touche |= (
+                    DANGERS[self._tuiles(ligne, colonne)]
+                    & (np.abs(dx) < portee) & (np.abs(dy) < portee)
+                )
+        # Monstres mobiles
+        dx = self.x[:, None] - self.mx
+        dy = self.y[:, None] - self.my
+        touche |= np.any(
+            self.monstres_presents
+            & (np.abs(dx) < portee) & (np.abs(dy) < portee),
+            axis=1,
+        )
+        self.mort |= touche
+
+    def observations(self) -> np.ndarray:
+        """
+        Fenêtre de tuiles centrée sur le joueur, de forme (N, 2R+1, 2R+1),
+        avec les identifiants TUILE_* de la configuration. Les monstres
+        mobiles et le joueur y sont superposés.
+        """
+        r = RAYON_OBSERVATION
+        decalages = np.arange(-r, r + 1)
+        centre_l = (self.y + TAILLE_TUILE // 2) // TAILLE_TUILE
+        centre_c = (self.x + TAILLE_TUILE // 2) // TAILLE_TUILE
+        lignes = centre_l[:, None, None] + decalages[None, :, None]
+        colonnes = centre_c[:, None, None] + decalages[None, None, :]
+        obs = self._tuiles(lignes, colonnes).astype(np.uint8)
+
+        ml = (self.my + TAILLE_TUILE // 2) // TAILLE_TUILE - centre_l[:, None]
+        mc = (self.mx + TAILLE_TUILE // 2) // TAILLE_TUILE - centre_c[:, None]
+        visibles = (
+            self.monstres_presents & (np.abs(ml) <= r) & (np.abs(mc) <= r)
+        )
+        instances, monstres = np.nonzero(visibles)
+        obs[
+            instances,
+            ml[instances, monstres] + r,
+            mc[instances, monstres] + r,
+        ] = TUILE_MONSTRE_MOBILE
+        obs[:, r, r] = TUILE_JOUEUR
+        return obs
+
+    def pas(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avance toutes les instances d'un tick.
+        Retourne (observations, récompenses, terminés).
+        """
+        actions = np.asarray(actions, dtype=np.uint8)
+        self._physique_monstres()
+        self._physique_joueurs(actions)
+        self.ticks += 1
+
+        echec = self.mort | (self.y > ECRAN_HAUTEUR)
+        sortie_x = self.sortie[:, 0]
+        sortie_y = self.sortie[:, 1]
+        victoire = ~echec & (
+            (np.abs(self.x - sortie_x) < TAILLE_TUILE)
+            & (np.abs(self.y - sortie_y) < TAILLE_TUILE)
+        )
+        termines = echec | victoire
+        recompenses = np.full(self.nb_instances, RECOMPENSE_PAS, np.float32)
+        recompenses[echec] = RECOMPENSE_MORT
+        recompenses[victoire] = RECOMPENSE_SORTIE
+        if termines.any():
+            self.reinitialiser(termines)
+        return self.observations(), recompenses, termines
+
+
+def main():
+    """Mesure le débit de l'environnement avec des actions aléatoires."""
+    rng = np.random.default_rng(0)
+    for n in (1, 64, 1024, 8192):
+        env = EnvironnementVectorise.depuis_numeros(
+            [1 + i % 3 for i in range(n)]
+        )
+        nb_pas = 200
+        debut = time.perf_counter()
+        for _ in range(nb_pas):
+            env.pas(rng.integers(0, NB_ACTIONS, n, dtype=np.uint8))
+        duree = time.perf_counter() - debut
+        print(
+            f"N={n:5d} : {nb_pas * n / duree:12.0f} pas-instance/s "
+            f"({duree / nb_pas * 1000:.2f} ms par pas)"
+        )
+
+
+if __name__ == "__main__":
+    main()
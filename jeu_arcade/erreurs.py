@@ -0,0 +1,45 @@
+"""Exceptions levées lors du chargement et de la construction des niveaux."""
+from pathlib import Path
+
+
+class NiveauErreur(Exception):
+    """Classe mère pour toutes les erreurs liées aux niveaux."""
+    pass
+
+class NiveauIntrouvableErreur(NiveauErreur):
+    """Levée quand le fichier n'existe pas."""
+    def __init__(self, chemin: str | Path):
+        super().__init__(
+            f"ERREUR FATALE : Le fichier '{chemin}' est introuvable."
+        )
+
+class CaractereInvalideErreur(NiveauErreur):
+    """Levée quand un caractère inconnu est lu."""
+    def __init__(self, caractere: str, ligne: int, colonne: int):
+        super().__init__(
+            f"ERREUR DE SYNTAXE : Caractère interdit '{caractere}' "
+            f"trouvé à la ligne {ligne+1}, colonne {colonne+1}."
+        )
+
+class PositionJoueurErreur(NiveauErreur):
+    """Levée quand le nombre de joueurs 'P' est incorrect."""
+    def __init__(self, compte: int):
+        super().__init__(
+            f"ERREUR DE LOGIQUE : Le niveau contient {compte} "
+            f"départ(s) de joueur (1 seul requis)."
+        )
+
+class TuileSortieErreur(NiveauErreur):
+    """Levée quand le nombre de tuiles de sortie est incorrect."""
+    def __init__(self, compte: int):
+        super().__init__(
+            f"ERREUR DE LOGIQUE : Le niveau contient {compte} "
+            f"sorties (1 seule requise)."
+        )
+
+class PaquetInvalideErreur(NiveauErreur):
+    """Levée quand un paquet de niveaux est illisible."""
+    def __init__(self, chemin: str | Path, raison: str):
+        super().__init__(
+            f"ERREUR FATALE : Le paquet '{chemin}' est invalide ({raison})."
+        )
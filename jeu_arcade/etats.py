@@ -0,0 +1,22 @@
+"""
+États d'animation du joueur et des monstres, sans dépendance : l'affichage
+les calcule à chaque frame sans importer le chargement des planches.
+"""
+REPOS = "repos"
+COURSE = "course"
+SAUT = "saut"
+CHUTE = "chute"
+MORT = "mort"
+ETATS = (REPOS, COURSE, SAUT, CHUTE, MORT) # lignes des planches, de haut en bas
+
+
+def etat_joueur(joueur: dict) -> str:
+    if joueur['mort']:
+        return MORT
+    if not joueur['au_sol']:
+        return SAUT if joueur['vitesse_y'] < 0 else CHUTE
+    return COURSE if joueur['vitesse_x'] else REPOS
+
+
+def etat_monstre(monstre: dict) -> str:
+    return CHUTE if monstre['vitesse_y'] > 0 else COURSE
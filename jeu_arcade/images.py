@@ -0,0 +1,132 @@
+"""Chargement et redimensionnement des images du jeu."""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pygame
+
+from jeu_arcade.config import (
+    DOSSIER_ASSETS,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    REGISTRE_TUILES,
+    TAILLE_TUILE,
+    ElementDecor,
+)
+
+THREADS_IMAGES = min(8, os.cpu_count() or 1)
+
+# Fichier et taille de chaque image du registre des tuiles ; le fond
+# (image du vide) couvre l'écran et n'a pas besoin d'alpha
+FICHIERS_IMAGES = {
+    tuile.element: (tuile.image, TAILLE_TUILE, TAILLE_TUILE, True)
+    for tuile in REGISTRE_TUILES
+    if tuile.image
+}
+FICHIERS_IMAGES[ElementDecor.VIDE] = (
+    FICHIERS_IMAGES[ElementDecor.VIDE][0], ECRAN_LARGEUR, ECRAN_HAUTEUR, False
+)
+
+
+def decoder_image(
+    nom_fichier: str,
+    largeur: int | None = None,
+    hauteur: int | None = None,
+) -> pygame.Surface | None:
+    """
+    Lit et redimensionne une image, sans la convertir au format de
+    l'écran : peut tourner dans un autre thread. Retourne None si échec.
+    """
+    chemin = DOSSIER_ASSETS / nom_fichier
+    try:
+        if not chemin.exists():
+            print(
+                f"AVERTISSEMENT : Image introuvable '{chemin}'. "
+                f"Utilisation de la couleur par défaut."
+            )
+            return None
+        img = pygame.image.load(str(chemin))
+        # Redimensionnement si demandé
+        if largeur and hauteur:
+            img = pygame.transform.scale(img, (largeur, hauteur))
+        return img
+    except pygame.error as e:
+        print(f"ERREUR PYGAME : Impossible de lire '{chemin}' ({e}).")
+        return None
+
+
+def convertir_image(img: pygame.Surface | None, alpha: bool = True):
+    """Conversion au format de l'écran (thread principal seulement)."""
+    if img is None:
+        return None
+    # Optimisation de l'image (convert vs convert_alpha)
+    return img.convert_alpha() if alpha else img.convert()
+
+
+def charger_image(
+    nom_fichier: str,
+    largeur: int | None = None,
+    hauteur: int | None = None,
+    alpha: bool = True,
+) -> pygame.Surface:
+    """
+    Tente de charger une image. Retourne l'image pygame ou None si échec.
+    Gère le redimensionnement automatique.
+    """
+    return convertir_image(decoder_image(nom_fichier, largeur, hauteur), alpha)
+
+
+def charger_element(element: ElementDecor) -> pygame.Surface:
+    """Charge l'image d'un élément du décor (None si absente)."""
+    nom, largeur, hauteur, alpha = FICHIERS_IMAGES[element]
+    return charger_image(nom, largeur, hauteur, alpha)
+
+
+def charger_images(
+    demandes: dict,
+    progression=None,
+) -> dict:
+    """
+    Charge les images `demandes` (clé -> (fichier, largeur, hauteur, alpha)).
+    Les images sont lues et redimensionnées par un pool de threads (les
+    chargeurs d'images de pygame relâchent le GIL) ; seule la conversion
+    au format de l'écran reste sur le thread principal, au fil des
+    résultats. `progression(faites, total)` est appelée après chaque image.
+    """
+    images = {}
+    with ThreadPoolExecutor(max_workers=THREADS_IMAGES) as pool:
+        futures = {
+            pool.submit(decoder_image, nom, largeur, hauteur): cle
+            for cle, (nom, largeur, hauteur, _) in demandes.items()
+        }
+        for faites, future in enumerate(as_completed(futures), start=1):
+            cle = futures[future]
+            images[cle] = convertir_image(future.result(), demandes[cle][3])
+            if progression is not None:
+                progression(faites, len(demandes))
+    # Même ordre qu'un chargement séquentiel
+    return {cle: images[cle] for cle in demandes}
+
+
+def initialiser_images(
+    elements: frozenset[ElementDecor],
+    progression=None,
+) -> dict[ElementDecor, pygame.Surface]:
+    """Charge dans un dictionnaire les images des éléments demandés."""
+    print("--- CHARGEMENT DES IMAGES ---")
+    images = charger_images(
+        {e: fichier for e, fichier in FICHIERS_IMAGES.items() if e in elements},
+        progression,
+    )
+    print("-----------------------------")
+    return images
+
+
+def retourner_images(
+    images: dict[ElementDecor, pygame.Surface],
+) -> dict[ElementDecor, pygame.Surface]:
+    """Précalcule les images retournées horizontalement (joueur, monstres)."""
+    return {
+        element: pygame.transform.flip(img, True, False)
+        for element, img in images.items()
+        if img is not None
+    }
@@ -0,0 +1,470 @@
+"""
+Instantanés compressés de l'état du monde (joueur et monstres mobiles).
+
+Un instantané « clé » contient tout l'état ; un instantané « delta » ne
+contient que ce qui a changé depuis un instantané de référence. Les
+positions des instantanés clés sont découpées en numéro de tuile et
+décalage dans la tuile (un octet), les autres entiers sont écrits en
+varint zigzag : la plupart des valeurs tiennent sur un octet. Le décodage
+redonne exactement l'état encodé.
+
+Les monstres mobiles sont identifiés par leur case de départ ('depart'),
+ce qui permet de suivre les monstres supprimés (tombés), ajoutés
+(rechargement du niveau) ou déplacés dans la liste (retrait par échange de
+la réserve) entre deux instantanés.
+"""
+import pickle
+import random
+
+import pygame
+
+from jeu_arcade.config import (
+    DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    TAILLE_TUILE,
+)
+from jeu_arcade.physique import joueur
+
+CLE = 0
+DELTA = 1
+INTERVALLE_CLE = 60 # ticks entre deux instantanés clés d'un flux
+
+# Drapeaux du joueur
+AU_SOL = 1
+GAUCHE = 2
+MORT = 4
+
+CHAMPS_JOUEUR = ("x", "y", "vitesse_x", "vitesse_y")
+CHAMPS_MONSTRE = ("x", "y", "vitesse_x", "vitesse_y")
+
+
+def capturer(niveau_data: dict, tick: int) -> dict:
+    """État courant du joueur et des monstres mobiles, en valeurs simples."""
+    return {
+        "tick": tick,
+        "joueur": {
+            "x": joueur['rect'].x,
+            "y": joueur['rect'].y,
+            "vitesse_x": joueur['vitesse_x'],
+            "vitesse_y": joueur['vitesse_y'],
+            "au_sol": joueur['au_sol'],
+            "direction": joueur['direction'],
+            "mort": joueur['mort'],
+        },
+        "monstres": [
+            {
+                "x": m['rect'].x,
+                "y": m['rect'].y,
+                "vitesse_x": m['vitesse_x'],
+                "vitesse_y": m['vitesse_y'],
+                "depart": m['depart'],
+            }
+            for m in niveau_data['tuiles_monstres_mobiles']
+        ],
+    }
+
+
+def restaurer(etat: dict, niveau_data: dict):
+    """Replace le joueur et les monstres mobiles dans l'état `etat`."""
+    j = etat['joueur']
+    joueur['rect'] = pygame.Rect(j['x'], j['y'], TAILLE_TUILE, TAILLE_TUILE)
+    for cle in ("vitesse_x", "vitesse_y", "au_sol", "direction", "mort"):
+        joueur[cle] = j[cle]
+    reserve = niveau_data['tuiles_monstres_mobiles']
+    reserve.vider()
+    for m in etat['monstres']:
+        reserve.ajouter(
+            m['x'], m['y'], m['vitesse_x'], m['vitesse_y'], m['depart']
+        )
+
+
+# --- Entiers compacts -------------------------------------------------------
+
+def _ecrire_varint(tampon: bytearray, n: int):
+    while n >= 0x80:
+        tampon.append((n & 0x7F) | 0x80)
+        n >>= 7
+    tampon.append(n)
+
+
+def _lire_varint(donnees: bytes, position: int) -> tuple[int, int]:
+    n = decalage = 0
+    while True:
+        octet = donnees[position]
+        position += 1
+        n |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return n, position
+        decalage += 7
+
+
+def _ecrire_entier(tampon: bytearray, n: int):
+    """Entier signé en zigzag : 0, -1, 1, -2... -> 0, 1, 2, 3..."""
+    _ecrire_varint(tampon, (n << 1) if n >= 0 else ((-n << 1) - 1))
+
+
+def _lire_entier(donnees: bytes, position: int) -> tuple[int, int]:
+    n, position = _lire_varint(donnees, position)
+    return (n >> 1) ^ -(n & 1), position
+
+
+def _ecrire_position(tampon: bytearray, pixels: int):
+    """Numéro de tuile (zigzag) puis décalage dans la tuile (un octet)."""
+    tuile, decalage = divmod(pixels, TAILLE_TUILE)
+    _ecrire_entier(tampon, tuile)
+    tampon.append(decalage)
+
+
+def _lire_position(donnees: bytes, position: int) -> tuple[int, int]:
+    tuile, position = _lire_entier(donnees, position)
+    return tuile * TAILLE_TUILE + donnees[position], position + 1
+
+
+def _drapeaux(j: dict) -> int:
+    return (
+        (AU_SOL if j['au_sol'] else 0)
+        | (GAUCHE if j['direction'] == "gauche" else 0)
+        | (MORT if j['mort'] else 0)
+    )
+
+
+# --- Encodage ---------------------------------------------------------------
+
+def _ecrire_monstre_complet(tampon: bytearray, m: dict):
+    _ecrire_entier(tampon, m['depart'][0] // TAILLE_TUILE)
+    _ecrire_entier(tampon, m['depart'][1] // TAILLE_TUILE)
+    _ecrire_position(tampon, m['x'])
+    _ecrire_position(tampon, m['y'])
+    _ecrire_entier(tampon, m['vitesse_x'])
+    _ecrire_entier(tampon, m['vitesse_y'])
+
+
+def _ecrire_differences(
+    tampon: bytearray, actuel: dict, reference: dict, champs: tuple
+) -> bool:
+    """Masque des champs modifiés puis leurs écarts. Faux si rien n'a changé."""
+    masque = 0
+    for i, champ in enumerate(champs):
+        if actuel[champ] != reference[champ]:
+            masque |= 1 << i
+    if not masque:
+        return False
+    tampon.append(masque)
+    for i, champ in enumerate(champs):
+        if masque & (1 << i):
+            _ecrire_entier(tampon, actuel[champ] - reference[champ])
+    return True
+
+
+def _encoder_cle(tampon: bytearray, etat: dict):
+    j = etat['joueur']
+    _ecrire_position(tampon, j['x'])
+    _ecrire_position(tampon, j['y'])
+    _ecrire_entier(tampon, j['vitesse_x'])
+    _ecrire_entier(tampon, j['vitesse_y'])
+    tampon.append(_drapeaux(j))
+    _ecrire_varint(tampon, len(etat['monstres']))
+    for m in etat['monstres']:
+        _ecrire_monstre_complet(tampon, m)
+
+
+def _correspondance(etat: dict, reference: dict) -> list[int | None] | None:
+    """
+    Pour chaque monstre actuel, son indice dans la référence (même case de
+    départ) ou None s'il est nouveau. None si deux monstres partagent une
+    case de départ.
+    """
+    indices = {m['depart']: i for i, m in enumerate(reference['monstres'])}
+    if len(indices) != len(reference['monstres']):
+        return None
+    sources = [indices.get(m['depart']) for m in etat['monstres']]
+    if len({m['depart'] for m in etat['monstres']}) != len(sources):
+        return None
+    return sources
+
+
+def _encoder_delta(
+    tampon: bytearray, etat: dict, reference: dict, sources: list[int | None]
+):
+    # Joueur : le bit après ceux des champs signale des drapeaux modifiés
+    j, r = etat['joueur'], reference['joueur']
+    drapeaux = _drapeaux(j)
+    masque = 0
+    for i, champ in enumerate(CHAMPS_JOUEUR):
+        if j[champ] != r[champ]:
+            masque |= 1 << i
+    if drapeaux != _drapeaux(r):
+        masque |= 1 << len(CHAMPS_JOUEUR)
+    tampon.append(masque)
+    for i, champ in enumerate(CHAMPS_JOUEUR):
+        if masque & (1 << i):
+            _ecrire_entier(tampon, j[champ] - r[champ])
+    if masque >> len(CHAMPS_JOUEUR):
+        tampon.append(drapeaux)
+
+    # Monstres : ceux de la référence, moins les supprimés, puis les
+    # nouveaux ; sinon (réserve réordonnée), l'origine de chaque monstre
+    conserves = [i for i in sources if i is not None]
+    nouveaux = [m for m, i in zip(etat['monstres'], sources) if i is None]
+    if conserves == sorted(conserves) and None not in sources[:len(conserves)]:
+        tampon.append(0)
+        gardes = set(conserves)
+        supprimes = [
+            i for i in range(len(reference['monstres'])) if i not in gardes
+        ]
+        _ecrire_varint(tampon, len(supprimes))
+        precedent = 0
+        for i in supprimes: # Écarts entre indices croissants
+            _ecrire_varint(tampon, i - precedent)
+            precedent = i
+        _ecrire_varint(tampon, len(nouveaux))
+    else:
+        tampon.append(1)
+        _ecrire_varint(tampon, len(sources))
+        for i in sources:
+            _ecrire_varint(tampon, 0 if i is None else i + 1)
+
+    # Un bit par monstre conservé (modifié ou non), puis les modifiés
+    bits = bytearray((len(conserves) + 7) // 8)
+    modifications = bytearray()
+    actuels = [m for m, i in zip(etat['monstres'], sources) if i is not None]
+    for i, (m, source) in enumerate(zip(actuels, conserves)):
+        ancien = reference['monstres'][source]
+        if _ecrire_differences(modifications, m, ancien, CHAMPS_MONSTRE):
+            bits[i // 8] |= 1 << (i % 8)
+    tampon += bits
+    tampon += modifications
+    for m in nouveaux:
+        _ecrire_monstre_complet(tampon, m)
+
+
+def encoder_instantane(etat: dict, reference: dict | None = None) -> bytes:
+    """
+    Encode `etat` en binaire, par différence avec `reference` si elle est
+    donnée et si chaque monstre y a une case de départ distincte (sinon en
+    clé).
+    """
+    tampon = bytearray()
+    sources = None
+    if reference is not None:
+        sources = _correspondance(etat, reference)
+    if sources is None:
+        tampon.append(CLE)
+        _ecrire_varint(tampon, etat['tick'])
+        _encoder_cle(tampon, etat)
+    else:
+        tampon.append(DELTA)
+        _ecrire_varint(tampon, etat['tick'])
+        _ecrire_varint(tampon, etat['tick'] - reference['tick'])
+        _encoder_delta(tampon, etat, reference, sources)
+    return bytes(tampon)
+
+
+# --- Décodage ---------------------------------------------------------------
+
+def _lire_monstre_complet(donnees: bytes, position: int) -> tuple[dict, int]:
+    depart_x, position = _lire_entier(donnees, position)
+    depart_y, position = _lire_entier(donnees, position)
+    x, position = _lire_position(donnees, position)
+    y, position = _lire_position(donnees, position)
+    vitesse_x, position = _lire_entier(donnees, position)
+    vitesse_y, position = _lire_entier(donnees, position)
+    return {
+        "x": x,
+        "y": y,
+        "vitesse_x": vitesse_x,
+        "vitesse_y": vitesse_y,
+        "depart": (depart_x * TAILLE_TUILE, depart_y * TAILLE_TUILE),
+    }, position
+
+
+def _lire_differences(
+    donnees: bytes, position: int, reference: dict, champs: tuple
+) -> tuple[dict, int]:
+    masque = donnees[position]
+    position += 1
+    resultat = dict(reference)
+    for i, champ in enumerate(champs):
+        if masque & (1 << i):
+            ecart, position = _lire_entier(donnees, position)
+            resultat[champ] = reference[champ] + ecart
+    return resultat, position
+
+
+def _appliquer_drapeaux(j: dict, drapeaux: int):
+    j['au_sol'] = bool(drapeaux & AU_SOL)
+    j['direction'] = "gauche" if drapeaux & GAUCHE else "droite"
+    j['mort'] = bool(drapeaux & MORT)
+
+
+def decoder_instantane(donnees: bytes, reference: dict | None = None) -> dict:
+    """
+    Reconstruit l'état encodé. Un delta demande l'état de référence utilisé
+    à l'encodage (ValueError sinon).
+    """
+    genre = donnees[0]
+    tick, position = _lire_varint(donnees, 1)
+    if genre == CLE:
+        j = {}
+        j['x'], position = _lire_position(donnees, position)
+        j['y'], position = _lire_position(donnees, position)
+        j['vitesse_x'], position = _lire_entier(donnees, position)
+        j['vitesse_y'], position = _lire_entier(donnees, position)
+        _appliquer_drapeaux(j, donnees[position])
+        nb_monstres, position = _lire_varint(donnees, position + 1)
+        monstres = []
+        for _ in range(nb_monstres):
+            m, position = _lire_monstre_complet(donnees, position)
+            monstres.append(m)
+        return {"tick": tick, "joueur": j, "monstres": monstres}
+
+    ecart_tick, position = _lire_varint(donnees, position)
+    if reference is None or reference['tick'] != tick - ecart_tick:
+        raise ValueError(
+            f"L'instantané du tick {tick} dépend du tick {tick - ecart_tick}."
+        )
+    masque = donnees[position]
+    j, position = _lire_differences(
+        donnees, position, reference['joueur'], CHAMPS_JOUEUR
+    )
+    if masque >> len(CHAMPS_JOUEUR):
+        _appliquer_drapeaux(j, donnees[position])
+        position += 1
+
+    reordonne = donnees[position]
+    position += 1
+    if not reordonne:
+        nb_supprimes, position = _lire_varint(donnees, position)
+        supprimes = set()
+        indice = 0
+        for _ in range(nb_supprimes):
+            ecart, position = _lire_varint(donnees, position)
+            indice += ecart
+            supprimes.add(indice)
+        nb_nouveaux, position = _lire_varint(donnees, position)
+        sources = [
+            i for i in range(len(reference['monstres'])) if i not in supprimes
+        ] + [None] * nb_nouveaux
+    else:
+        nb_monstres, position = _lire_varint(donnees, position)
+        sources = []
+        for _ in range(nb_monstres):
+            source, position = _lire_varint(donnees, position)
+            sources.append(source - 1 if source else None)
+    conserves = [i for i in sources if i is not None]
+    bits = donnees[position:position + (len(conserves) + 7) // 8]
+    position += len(bits)
+    anciens = []
+    for i, source in enumerate(conserves):
+        ancien = reference['monstres'][source]
+        if bits[i // 8] & (1 << (i % 8)):
+            m, position = _lire_differences(
+                donnees, position, ancien, CHAMPS_MONSTRE
+            )
+            anciens.append(m)
+        else:
+            anciens.append(dict(ancien))
+    anciens.reverse()
+    monstres = []
+    for source in sources:
+        if source is not None:
+            monstres.append(anciens.pop())
+        else:
+            m, position = _lire_monstre_complet(donnees, position)
+            monstres.append(m)
+    return {"tick": tick, "joueur": j, "monstres": monstres}
+
+
+# --- Flux -------------------------------------------------------------------
+
+class EncodeurFlux:
+    """
+    Suite d'instantanés pour un spectateur ou une sauvegarde : une clé tous
+    les `intervalle_cle` ticks, des deltas par rapport au tick précédent
+    entre les deux.
+    """
+
+    def __init__(self, intervalle_cle: int = INTERVALLE_CLE):
+        self.intervalle_cle = intervalle_cle
+        self._reference: dict | None = None
+        self._depuis_cle = 0
+
+    def encoder(self, etat: dict) -> bytes:
+        if self._reference is None or self._depuis_cle >= self.intervalle_cle:
+            donnees = encoder_instantane(etat)
+        else:
+            donnees = encoder_instantane(etat, self._reference)
+        self._depuis_cle = 0 if donnees[0] == CLE else self._depuis_cle + 1
+        self._reference = etat
+        return donnees
+
+
+class DecodeurFlux:
+    """Relit un flux produit par EncodeurFlux, instantané par instantané."""
+
+    def __init__(self):
+        self.etat: dict | None = None
+
+    def decoder(self, donnees: bytes) -> dict:
+        self.etat = decoder_instantane(donnees, self.etat)
+        return self.etat
+
+
+def main():
+    """
+    Compare la taille des instantanés (clés, deltas, pickle de l'état
+    complet) sur des parties aux touches aléatoires et vérifie le décodage.
+    """
+    from jeu_arcade.modes import ELEMENTS_MONSTRES_MOBILES
+    from jeu_arcade.monstres import (
+        gerer_physique_monstres,
+        verifier_collisions_danger,
+    )
+    from jeu_arcade.niveau import charger_niveau, construire_niveau
+    from jeu_arcade.physique import appliquer_physique, initialiser_joueur
+
+    rng = random.Random(0)
+    touches_possibles = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+    # Niveaux fournis, puis un niveau chargé de monstres mobiles
+    largeur = ECRAN_LARGEUR // TAILLE_TUILE
+    charge = ["P" + "." * (largeur - 2) + "E", "#" * largeur]
+    for _ in range(6):
+        charge += [".X." * (largeur // 3) + "." * (largeur % 3), "#" * largeur]
+    niveaux = {
+        str(numero): charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+        for numero in (1, 2, 3)
+    }
+    niveaux["chargé"] = "\n".join(charge)
+    for nom, donnees_texte in niveaux.items():
+        niveau_data = construire_niveau(
+            donnees_texte, ELEMENTS_MONSTRES_MOBILES
+        )
+        initialiser_joueur(*niveau_data['pos_joueur'])
+        encodeur = EncodeurFlux()
+        decodeur = DecodeurFlux()
+        taille_flux = taille_cles = taille_pickle = 0
+        nb_ticks = 1000
+        for tick in range(nb_ticks):
+            touches = {t: rng.random() < 0.5 for t in touches_possibles}
+            gerer_physique_monstres(niveau_data)
+            appliquer_physique(niveau_data, touches)
+            verifier_collisions_danger(niveau_data)
+            if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+                initialiser_joueur(*niveau_data['pos_joueur'])
+            etat = capturer(niveau_data, tick)
+            donnees = encodeur.encoder(etat)
+            assert decodeur.decoder(donnees) == etat
+            taille_flux += len(donnees)
+            taille_cles += len(encoder_instantane(etat))
+            taille_pickle += len(pickle.dumps(etat))
+        print(
+            f"Niveau {nom} ({len(niveau_data['tuiles_monstres_mobiles'])} "
+            f"monstres) : flux {taille_flux / nb_ticks:.1f} o/tick, "
+            f"clés seules {taille_cles / nb_ticks:.1f} o/tick, "
+            f"pickle {taille_pickle / nb_ticks:.1f} o/tick"
+        )
+
+
+if __name__ == "__main__":
+    main()
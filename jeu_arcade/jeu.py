@@ -0,0 +1,437 @@
+"""Boucle principale commune à tous les modes de jeu."""
+import sys
+import time
+
+import pygame
+
+from jeu_arcade.affichage import (
+    afficher_chargement,
+    afficher_message,
+    dessiner_entites,
+    dessiner_niveau,
+    preparer_decor,
+)
+from jeu_arcade.config import (
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    FPS,
+    NOM_DU_JEU,
+)
+from jeu_arcade.entrees import Entrees, afficher_latences, filtrer_evenements
+from jeu_arcade.erreurs import NiveauErreur, NiveauIntrouvableErreur
+from jeu_arcade.modes import Mode, Options
+from jeu_arcade.niveau import (
+    charger_niveau,
+    chemin_niveau,
+    construire_niveau,
+)
+from jeu_arcade.physique import (
+    appliquer_physique,
+    initialiser_joueur,
+    joueur,
+)
+from jeu_arcade.reserve import ReserveMonstres
+
+
+def main(mode: Mode, options: Options):
+    if options.demarrage_rapide:
+        # Pas de mixer ni de joystick : seulement ce qui sert à l'écran
+        pygame.display.init()
+        pygame.font.init()
+    else:
+        pygame.init()
+    ecran = pygame.display.set_mode((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    pygame.display.set_caption(f"{NOM_DU_JEU} - {mode.titre}")
+    clock = pygame.time.Clock()
+    filtrer_evenements()
+    retour = None
+    autres_touches = ()
+    if options.retour_arriere and mode.physique:
+        from jeu_arcade.retour_arriere import TOUCHE_RETOUR
+        autres_touches = (TOUCHE_RETOUR,)
+    entrees = Entrees(
+        rapport=options.latence_entrees, autres_touches=autres_touches
+    )
+    if options.rapport_memoire:
+        from jeu_arcade.memoire import afficher_rapport, demarrer, rapport
+        demarrer()
+
+    # Sous-systèmes importés seulement si le mode les utilise
+    images = {}
+    images_retournees = {}
+    images_a_charger = []
+    if mode.images:
+        from jeu_arcade.images import (
+            FICHIERS_IMAGES,
+            charger_element,
+            initialiser_images,
+            retourner_images,
+        )
+        if options.demarrage_rapide:
+            # Couleurs de COULEURS en attendant que les images arrivent
+            images_a_charger = [
+                e for e in FICHIERS_IMAGES if e in mode.elements
+            ]
+        else:
+            images = initialiser_images(
+                mode.elements,
+                lambda faites, total: afficher_chargement(ecran, faites, total),
+            )
+            images_retournees = retourner_images(images)
+    parallaxe = None
+    if options.parallaxe and mode.images:
+        from jeu_arcade.parallaxe import FondParallaxe
+        parallaxe = FondParallaxe.depuis_config(ecran.get_size())
+    animations = None
+    if options.animations and mode.images:
+        from jeu_arcade.animations import Animations
+        if not images_a_charger:
+            animations = Animations(images)
+    if mode.monstres:
+        from jeu_arcade.monstres import (
+            compteurs,
+            gerer_physique_monstres,
+            verifier_collisions_danger,
+        )
+    niveaux = mode.dossier_niveaux
+    if options.paquet is not None:
+        from jeu_arcade.erreurs import PaquetInvalideErreur
+        from jeu_arcade.paquet import PaquetNiveaux
+        try:
+            niveaux = PaquetNiveaux(options.paquet)
+        except PaquetInvalideErreur as e:
+            print(f"Erreur critique: {e}")
+            pygame.quit()
+            sys.exit(1)
+        print(f"Paquet {options.paquet} : {len(niveaux)} niveaux.")
+    # Le rechargement à chaud suit les fichiers du dossier, pas un paquet
+    surveiller = options.surveiller and options.paquet is None
+    if surveiller:
+        from jeu_arcade.affichage import modifier_decor, redessiner_decor
+        from jeu_arcade.rechargement import (
+            SurveillanceNiveau,
+            appliquer_modifications,
+        )
+        surveillance = None
+    cadence = None
+    if options.cadence_adaptative:
+        from jeu_arcade.affichage import rendre_couche_decor
+        from jeu_arcade.cadence import (
+            RENDU_COMPLET,
+            RENDU_SAUTE,
+            Cadenceur,
+            afficher_statistiques,
+        )
+        cadence = Cadenceur(FPS)
+        couche_decor = None
+    metriques = None
+    if options.metriques is not None:
+        from jeu_arcade.metriques import Metriques, demarrer_serveur
+        metriques = Metriques()
+        if cadence is not None:
+            metriques.compteurs["images_sautees"] = (
+                "Frames sautées par la cadence adaptative.",
+                lambda: cadence.compteurs[RENDU_SAUTE],
+            )
+        if mode.monstres:
+            metriques.jauges["monstres_endormis"] = (
+                "Monstres mobiles endormis au dernier tick.",
+                lambda: compteurs['endormis'],
+            )
+            metriques.jauges["monstres_eveilles"] = (
+                "Monstres mobiles éveillés au dernier tick.",
+                lambda: compteurs['eveilles'],
+            )
+        serveur_metriques = demarrer_serveur(metriques, options.metriques)
+        if serveur_metriques is None:
+            metriques = None # Partie jouée sans exportateur
+    rendu = None
+    if options.rendu_partiel:
+        from jeu_arcade.rendu import RenduPartiel
+        rendu = RenduPartiel(ecran)
+    registre = None
+    if mode.stats:
+        from jeu_arcade.affichage import afficher_ecran_fin, afficher_hud
+        from jeu_arcade.registre_stats import RegistreStats
+        registre = RegistreStats()
+
+    niveau_actuel = 1
+    niveau_data = None
+    jeu_en_cours = True
+
+    # Variables de statistiques
+    stats_globales = []
+    temps_debut_niveau = 0
+    essais_niveau = 1
+    niveau_precedent = 0 # Pour détecter si c'est un nouveau niveau ou un retry
+    premiere_image = True
+    decor = None
+    reserve = ReserveMonstres() # Monstres réutilisés d'un chargement à l'autre
+    tick = 0 # Horloge des animations
+    profil = None
+    if options.profil_allocations:
+        from jeu_arcade.allocations import ProfilAllocations
+        profil = ProfilAllocations()
+        profil.demarrer() # Seule la boucle de jeu est profilée
+
+    while jeu_en_cours:
+        # 1. LOAD / RESTART
+        if niveau_data is None:
+            try:
+                niveau_data = construire_niveau(
+                    charger_niveau(niveau_actuel, niveaux),
+                    mode.elements,
+                    compact=options.niveau_compact,
+                    reserve=reserve,
+                )
+                initialiser_joueur(
+                    niveau_data['pos_joueur'][0],
+                    niveau_data['pos_joueur'][1],
+                )
+                print(f"Niveau {niveau_actuel} chargé avec succès.")
+                if metriques is not None:
+                    metriques.niveau_charge(niveau_actuel)
+                if options.rapport_memoire and niveau_actuel != niveau_precedent:
+                    afficher_rapport(f"niveau {niveau_actuel}", rapport(
+                        niveau_data, images, images_retournees, animations,
+                    ))
+                decor = None
+                if autres_touches:
+                    retour = preparer_retour(retour, niveau_data)
+                if surveiller:
+                    surveillance = SurveillanceNiveau(
+                        chemin_niveau(niveau_actuel, mode.dossier_niveaux)
+                    )
+                if premiere_image:
+                    # Le niveau est affiché avant le message de début
+                    dessiner_niveau(
+                        ecran, niveau_data, images, images_retournees
+                    )
+                    pygame.display.flip()
+                    premiere_image = False
+                    if options.temps_demarrage:
+                        from jeu_arcade import DEBUT_PROCESSUS
+                        duree = time.perf_counter() - DEBUT_PROCESSUS
+                        print(f"Première image après {duree * 1000:.0f} ms.")
+                # Gestion du Timer et des Essais
+                if niveau_actuel != niveau_precedent:
+                    # C'est un tout nouveau niveau
+                    temps_debut_niveau = pygame.time.get_ticks()
+                    essais_niveau = 1
+                    niveau_precedent = niveau_actuel
+                else:
+                    # C'est un ré-essai
+                    essais_niveau += 1
+                afficher_message(
+                    ecran, f"Début niveau {niveau_actuel} (Essai {essais_niveau})"
+                )
+                # Appuis faits pendant le message ; fermeture de la fenêtre
+                if entrees.reinitialiser(): jeu_en_cours = False
+                if cadence is not None:
+                    cadence.recaler() # Pas de retard dû au message
+                if metriques is not None:
+                    metriques.recaler()
+            except NiveauIntrouvableErreur as e:
+                # FIN DU JEU (Plus de niveaux)
+                if registre is not None:
+                    registre.fermer()
+                if niveau_actuel == 1:
+                    print(f"Erreur critique: {e}")
+                elif registre is not None:
+                    afficher_ecran_fin(ecran, stats_globales, registre)
+                else:
+                    afficher_message(
+                        ecran, "FIN DU JEU", "Tous les niveaux terminés !",
+                        (50, 255, 50),
+                    )
+                jeu_en_cours = False
+                continue
+            except NiveauErreur as e:
+                print(f"Erreur critique au niveau {niveau_actuel}: {e}")
+                afficher_message(ecran, "ERREUR", str(e), (255, 50, 50))
+                jeu_en_cours = False
+                continue
+
+        if cadence is not None:
+            cadence.debut_tick()
+        if entrees.lire(): jeu_en_cours = False
+
+        if surveiller and surveillance.a_change():
+            try:
+                lignes = appliquer_modifications(
+                    niveau_data,
+                    surveillance.chemin.read_text(encoding='utf-8'),
+                    mode.elements,
+                )
+                print(f"Niveau {niveau_actuel} rechargé (lignes {lignes}).")
+                if decor is not None:
+                    # Seules les lignes modifiées sont redessinées
+                    zones = modifier_decor(decor, niveau_data, images, lignes)
+                    if rendu is not None:
+                        rendu.redessiner(decor, zones)
+                    if cadence is not None and couche_decor is not None:
+                        redessiner_decor(couche_decor, decor, zones)
+                if retour is not None:
+                    retour = preparer_retour(retour, niveau_data)
+            except (OSError, NiveauErreur) as e:
+                print(f"Rechargement ignoré : {e}")
+
+        temps_actuel = (pygame.time.get_ticks() - temps_debut_niveau) / 1000.0
+
+        recul = retour is not None and entrees.tenues[TOUCHE_RETOUR]
+        if recul:
+            # Touche maintenue : un état restauré par tick, sans physique
+            etat = retour.reculer(niveau_data)
+            if etat is not None:
+                temps_ms, essais_niveau, tick = etat
+                temps_debut_niveau = pygame.time.get_ticks() - temps_ms
+                temps_actuel = temps_ms / 1000.0
+
+        if mode.physique and not recul:
+            touches = entrees.touches()
+            if mode.monstres:
+                gerer_physique_monstres(niveau_data)
+            appliquer_physique(niveau_data, touches)
+            if mode.monstres:
+                verifier_collisions_danger(niveau_data)
+            tick += 1
+            if metriques is not None:
+                metriques.tick()
+            if retour is not None:
+                retour.capturer(
+                    niveau_data,
+                    pygame.time.get_ticks() - temps_debut_niveau,
+                    essais_niveau,
+                    tick,
+                )
+
+            if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+                msg = "Touché !" if joueur['mort'] else "Chute !"
+                if metriques is not None:
+                    metriques.mort("touche" if joueur['mort'] else "chute")
+                afficher_message(
+                    ecran, "ÉCHEC", f"{msg} Essai {essais_niveau} raté.",
+                    (255, 50, 50),
+                )
+                niveau_data = None # Force reload (même niveau)
+                continue
+
+            if (
+                niveau_data['tuile_sortie'] and
+                joueur['rect'].colliderect(niveau_data['tuile_sortie'])
+            ):
+                # Enregistrement des stats
+                temps_final = temps_actuel
+                stats_globales.append({
+                    'niveau': niveau_actuel,
+                    'temps': temps_final,
+                    'essais': essais_niveau
+                })
+                if registre is not None:
+                    registre.enregistrer(
+                        niveau_actuel, temps_final, essais_niveau
+                    )
+                if metriques is not None:
+                    metriques.niveau_termine(temps_final)
+                afficher_message(
+                    ecran,
+                    "NIVEAU TERMINÉ !",
+                    f"Temps: {temps_final:.1f}s | Essais: {essais_niveau}",
+                    (50, 255, 50)
+                )
+                niveau_actuel += 1
+                niveau_data = None
+                continue
+
+        if images_a_charger:
+            # Chargement différé : une image par frame
+            element = images_a_charger.pop(0)
+            images[element] = charger_element(element)
+            images_retournees.update(
+                retourner_images({element: images[element]})
+            )
+            if options.animations and not images_a_charger:
+                animations = Animations(images)
+            decor = None
+
+        if decor is None:
+            # Couches fixes préparées une fois, dessinées avec blits
+            decor = preparer_decor(niveau_data, images, parallaxe)
+            if rendu is not None:
+                rendu.invalider()
+            if cadence is not None:
+                couche_decor = None
+        dessiner = complet = True
+        if cadence is not None:
+            # Rendu dégradé : décor en une seule couche, HUD sans fond
+            qualite = cadence.choisir_rendu()
+            dessiner = qualite != RENDU_SAUTE
+            complet = qualite == RENDU_COMPLET
+        if not dessiner:
+            pass # Frame sautée : la simulation garde sa cadence
+        elif rendu is None:
+            if complet:
+                dessiner_niveau(
+                    ecran, niveau_data, images, images_retournees, decor,
+                    camera_x=joueur['rect'].x,
+                    animations=animations,
+                    tick=tick,
+                )
+            else:
+                if couche_decor is None:
+                    couche_decor = rendre_couche_decor(decor, ecran.get_size())
+                ecran.blit(couche_decor, (0, 0))
+                dessiner_entites(
+                    ecran, niveau_data, images, images_retournees,
+                    animations=animations, tick=tick,
+                )
+            if mode.stats:
+                afficher_hud(
+                    ecran, temps_actuel, niveau_actuel, essais_niveau,
+                    fond=complet,
+                )
+            pygame.display.flip()
+        else:
+            rendu.commencer(decor)
+            rects = dessiner_entites(
+                ecran, niveau_data, images, images_retournees,
+                retourner_rects=True, animations=animations, tick=tick,
+            )
+            if mode.stats:
+                rects.append(afficher_hud(
+                    ecran, temps_actuel, niveau_actuel, essais_niveau,
+                    fond=complet,
+                ))
+            rendu.terminer(rects)
+        if dessiner:
+            entrees.image_affichee()
+        if cadence is None:
+            clock.tick(FPS)
+        else:
+            cadence.attendre()
+        if metriques is not None:
+            metriques.fin_frame()
+        if profil is not None:
+            profil.fin_frame()
+    if profil is not None:
+        profil.arreter()
+    if cadence is not None:
+        afficher_statistiques(cadence.statistiques())
+    if options.latence_entrees:
+        afficher_latences(entrees.statistiques())
+    if registre is not None:
+        registre.fermer()
+    if metriques is not None:
+        serveur_metriques.shutdown()
+    pygame.quit()
+    sys.exit()
+
+
+def preparer_retour(retour, niveau_data: dict):
+    """Anneau vidé, agrandi si le niveau a plus de monstres mobiles."""
+    from jeu_arcade.retour_arriere import TamponEtats
+    nombre = len(niveau_data['tuiles_monstres_mobiles'])
+    if retour is None or retour.monstres_max < nombre:
+        return TamponEtats(nombre)
+    retour.vider()
+    return retour
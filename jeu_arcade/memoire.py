@@ -0,0 +1,103 @@
+"""
+Rapport d'occupation mémoire par sous-système (option --rapport-memoire).
+
+Le rapport mesure les objets que le jeu tient réellement (tuiles,
+monstres, grille du niveau, images et animations), sans rien reconstruire
+ni recharger : chaque sous-système est parcouru et ses objets Python
+comptés une fois avec `sys.getsizeof`. Les pixels des images sont alloués
+par SDL hors de Python ; ils sont comptés à part. `tracemalloc` donne en
+plus le total Python du processus et son pic.
+"""
+import sys
+import tracemalloc
+
+import numpy as np
+import pygame
+
+
+def demarrer():
+    tracemalloc.start()
+
+
+def taille_objets(racine) -> int:
+    """
+    Octets Python de `racine` et de tout ce qu'elle contient (conteneurs,
+    attributs, tableaux NumPy), chaque objet compté une fois.
+    """
+    vus = set()
+    total = 0
+    a_voir = [racine]
+    while a_voir:
+        objet = a_voir.pop()
+        if id(objet) in vus:
+            continue
+        vus.add(id(objet))
+        total += sys.getsizeof(objet)
+        if isinstance(objet, dict):
+            a_voir += objet.values() # Clés : chaînes partagées par tous
+        elif isinstance(objet, (list, tuple, set, frozenset)):
+            a_voir += objet
+        elif isinstance(objet, np.ndarray) and objet.base is not None:
+            a_voir.append(objet.base) # Vue : les données sont à la base
+        if hasattr(objet, "__dict__") and not isinstance(objet, type):
+            a_voir.append(vars(objet))
+    return total
+
+
+def octets_pixels(surfaces) -> int:
+    return sum(s.get_pitch() * s.get_height() for s in surfaces if s)
+
+
+def rapport(
+    niveau_data: dict,
+    images: dict | None = None,
+    images_retournees: dict | None = None,
+    animations=None,
+) -> dict[str, dict]:
+    """
+    Octets Python des objets du niveau en cours et des images chargées, le
+    nombre d'objets de chaque sous-système et, pour les images, les octets
+    de pixels.
+    """
+    tuiles = (niveau_data['tuiles_sol'], niveau_data['tuiles_monstres_fixes'])
+    monstres = niveau_data['tuiles_monstres_mobiles']
+    grille = (niveau_data['grille'], niveau_data['lignes'])
+    mesures = {
+        "tuiles": {
+            "octets": taille_objets(tuiles),
+            "objets": len(tuiles[0]) + len(tuiles[1]),
+        },
+        "monstres": {"octets": taille_objets(monstres), "objets": len(monstres)},
+        "grille": {"octets": taille_objets(grille), "objets": grille[0].size},
+    }
+    surfaces = {
+        id(s): s
+        for source in (images or {}, images_retournees or {})
+        for s in source.values() if isinstance(s, pygame.Surface)
+    }
+    if animations is not None:
+        for cadres in animations.cache.values():
+            surfaces.update((id(s), s) for s in cadres)
+    if surfaces:
+        mesures["images"] = {
+            "octets": taille_objets(list(surfaces.values())),
+            "objets": len(surfaces),
+            "pixels": octets_pixels(surfaces.values()),
+        }
+    return mesures
+
+
+def afficher_rapport(titre: str, mesures: dict[str, dict]):
+    actuel, pic = tracemalloc.get_traced_memory()
+    print(f"--- MÉMOIRE : {titre} ---")
+    for nom, m in mesures.items():
+        ligne = f"{nom:<9}{m['octets']:>12,} o  {m['objets']:>8} objets"
+        if m['objets']:
+            ligne += f"  ({m['octets'] / m['objets']:.1f} o/objet)"
+        if "pixels" in m:
+            ligne += f"  + {m['pixels']:,} o de pixels (SDL)"
+        print(ligne.replace(",", " "))
+    print(
+        f"Python total : {actuel:,} o (pic {pic:,} o)".replace(",", " ")
+    )
+    print("-" * (len(titre) + 15))
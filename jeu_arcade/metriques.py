@@ -0,0 +1,171 @@
+"""
+Métriques d'une partie, exportées au format texte de Prometheus (option
+--metriques PORT).
+
+    curl http://127.0.0.1:9108/metrics
+
+La boucle de jeu ne fait qu'incrémenter des compteurs et ranger des
+durées dans des histogrammes à bornes fixes (`bisect`), sans verrou ni
+allocation. Le texte est produit par un serveur HTTP sur un thread à part,
+à chaque lecture : une lecture peut tomber au milieu d'une frame, ce qui
+décale au plus d'une frame les valeurs lues, sans conséquence pour un
+suivi de longue durée.
+"""
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+PORT_PAR_DEFAUT = 9108
+PREFIXE = "jeu_arcade"
+# Bornes supérieures des histogrammes, en secondes
+BORNES_FRAME = (0.005, 0.010, 0.0167, 0.020, 0.025, 0.033, 0.050, 0.100, 0.250)
+BORNES_NIVEAU = (5, 10, 20, 30, 45, 60, 90, 120, 180, 300, 600)
+
+
+class Histogramme:
+    """Nombre d'observations par intervalle, somme et total."""
+
+    def __init__(self, bornes: tuple[float, ...]):
+        self.bornes = bornes
+        self.nombres = [0] * (len(bornes) + 1) # dernier : au-delà de la borne max
+        self.somme = 0.0
+        self.total = 0
+
+    def observer(self, valeur: float):
+        self.nombres[bisect_left(self.bornes, valeur)] += 1
+        self.somme += valeur
+        self.total += 1
+
+    def lignes(self, nom: str, aide: str) -> list[str]:
+        nombres = list(self.nombres)
+        lignes = [f"# HELP {nom} {aide}", f"# TYPE {nom} histogram"]
+        cumul = 0
+        for borne, nombre in zip(self.bornes, nombres):
+            cumul += nombre
+            lignes.append(f'{nom}_bucket{{le="{borne}"}} {cumul}')
+        lignes.append(f'{nom}_bucket{{le="+Inf"}} {cumul + nombres[-1]}')
+        lignes.append(f"{nom}_sum {self.somme}")
+        lignes.append(f"{nom}_count {cumul + nombres[-1]}")
+        return lignes
+
+
+class Metriques:
+    """Compteurs et histogrammes tenus par la boucle de jeu."""
+
+    def __init__(self):
+        self.temps_frame = Histogramme(BORNES_FRAME)
+        self.temps_niveau = Histogramme(BORNES_NIVEAU)
+        self.ticks = 0
+        self.chargements = 0
+        self.morts = {"touche": 0, "chute": 0}
+        self.niveau_actuel = 0
+        # Valeurs lues à chaque export : nom -> (aide, fonction sans argument).
+        # Les compteurs ne font que croître et prennent le suffixe _total.
+        self.jauges: dict[str, tuple] = {}
+        self.compteurs: dict[str, tuple] = {}
+        self._fin_frame: float | None = None
+
+    def recaler(self):
+        """Oublie la frame en cours (après un message bloquant)."""
+        self._fin_frame = None
+
+    def fin_frame(self):
+        """Range la durée écoulée depuis la fin de la frame précédente."""
+        maintenant = time.perf_counter()
+        if self._fin_frame is not None:
+            self.temps_frame.observer(maintenant - self._fin_frame)
+        self._fin_frame = maintenant
+
+    def tick(self):
+        self.ticks += 1
+
+    def niveau_charge(self, numero: int):
+        self.chargements += 1
+        self.niveau_actuel = numero
+
+    def mort(self, cause: str):
+        self.morts[cause] = self.morts.get(cause, 0) + 1
+        self.recaler()
+
+    def niveau_termine(self, temps: float):
+        self.temps_niveau.observer(temps)
+        self.recaler()
+
+    def exporter(self) -> str:
+        """Toutes les métriques au format texte de Prometheus."""
+        p = PREFIXE
+        lignes = self.temps_frame.lignes(
+            f"{p}_frame_duree_secondes", "Durée entre deux frames."
+        )
+        lignes += self.temps_niveau.lignes(
+            f"{p}_niveau_termine_secondes", "Temps mis pour finir un niveau."
+        )
+        lignes += [
+            f"# HELP {p}_ticks_total Ticks de simulation.",
+            f"# TYPE {p}_ticks_total counter",
+            f"{p}_ticks_total {self.ticks}",
+            f"# HELP {p}_niveaux_charges_total Chargements (essais compris).",
+            f"# TYPE {p}_niveaux_charges_total counter",
+            f"{p}_niveaux_charges_total {self.chargements}",
+            f"# HELP {p}_morts_total Morts du joueur par cause.",
+            f"# TYPE {p}_morts_total counter",
+        ]
+        lignes += [
+            f'{p}_morts_total{{cause="{cause}"}} {nombre}'
+            for cause, nombre in list(self.morts.items())
+        ]
+        lignes += [
+            f"# HELP {p}_niveau_actuel Numéro du niveau en cours.",
+            f"# TYPE {p}_niveau_actuel gauge",
+            f"{p}_niveau_actuel {self.niveau_actuel}",
+        ]
+        for nom, (aide, lire) in list(self.jauges.items()):
+            lignes += [
+                f"# HELP {p}_{nom} {aide}",
+                f"# TYPE {p}_{nom} gauge",
+                f"{p}_{nom} {lire()}",
+            ]
+        for nom, (aide, lire) in list(self.compteurs.items()):
+            lignes += [
+                f"# HELP {p}_{nom}_total {aide}",
+                f"# TYPE {p}_{nom}_total counter",
+                f"{p}_{nom}_total {lire()}",
+            ]
+        return "\n".join(lignes) + "\n"
+
+
+def demarrer_serveur(
+    metriques: Metriques,
+    port: int = PORT_PAR_DEFAUT,
+    hote: str = "127.0.0.1",
+) -> HTTPServer | None:
+    """
+    Sert `/metrics` sur un thread démon ; `shutdown()` pour l'arrêter.
+    Retourne None, avec un message, si le port est déjà pris.
+    """
+
+    class Gestionnaire(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            corps = metriques.exporter().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(corps)))
+            self.end_headers()
+            self.wfile.write(corps)
+
+        def log_message(self, *args):
+            pass # Pas de ligne dans la console à chaque lecture
+
+    try:
+        serveur = HTTPServer((hote, port), Gestionnaire)
+    except OSError as e:
+        print(f"Métriques désactivées : port {port} indisponible ({e}).")
+        return None
+    threading.Thread(
+        target=serveur.serve_forever, name="metriques", daemon=True
+    ).start()
+    return serveur
@@ -0,0 +1,111 @@
+"""
+Modes de jeu : chaque étape du TP devient un mode sélectionnable.
+
+Ce module n'importe pas pygame : la boucle de jeu et les sous-systèmes
+(images, monstres, statistiques) ne sont importés qu'au lancement, et
+seulement s'ils sont utilisés par le mode choisi.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+
+from jeu_arcade.config import (
+    DOSSIER_NIVEAUX,
+    DOSSIER_NIVEAUX_MONSTRES,
+    DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ElementDecor,
+)
+
+ELEMENTS_DE_BASE = frozenset({
+    ElementDecor.MUR,
+    ElementDecor.JOUEUR,
+    ElementDecor.SORTIE,
+    ElementDecor.VIDE,
+})
+ELEMENTS_MONSTRES = ELEMENTS_DE_BASE | {ElementDecor.MONSTRE}
+ELEMENTS_MONSTRES_MOBILES = ELEMENTS_MONSTRES | {ElementDecor.MONSTRE_MOBILE}
+
+
+@dataclass(frozen=True)
+class Mode:
+    """Sous-systèmes et niveaux utilisés par une étape du jeu."""
+    nom: str
+    titre: str
+    dossier_niveaux: Path
+    elements: frozenset[ElementDecor]
+    physique: bool = True
+    images: bool = False
+    monstres: bool = False
+    stats: bool = False
+
+
+@dataclass
+class Options:
+    """Options de lancement, indépendantes du mode."""
+    # N'initialise que l'affichage et les polices, et charge les images
+    # une par une après la première image affichée
+    demarrage_rapide: bool = False
+    # Affiche le temps écoulé entre le lancement et la première image
+    temps_demarrage: bool = False
+    # Recharge à chaud le fichier du niveau en cours quand il est modifié
+    surveiller: bool = False
+    # Ne met à jour que les zones de l'écran qui ont changé
+    rendu_partiel: bool = False
+    # Garde la simulation à l'heure en dégradant ou sautant le dessin
+    cadence_adaptative: bool = False
+    # Affiche la mémoire occupée par sous-système (tracemalloc)
+    rapport_memoire: bool = False
+    # Range murs et monstres fixes en grille de bits et coordonnées
+    niveau_compact: bool = False
+    # Affiche la latence entre une touche et l'image qui en montre l'effet
+    latence_entrees: bool = False
+    # Dessine le fond en couches qui défilent avec le joueur
+    parallaxe: bool = False
+    # Anime le joueur et les monstres à partir de planches de sprites
+    animations: bool = False
+    # Lit les niveaux dans ce paquet au lieu du dossier du mode
+    paquet: Path | None = None
+    # Port local où exporter les métriques au format Prometheus
+    metriques: int | None = None
+    # Affiche chaque seconde les lignes du jeu qui allouent le plus
+    profil_allocations: bool = False
+    # Garde les dernières secondes de jeu pour revenir en arrière
+    retour_arriere: bool = False
+
+
+MODES = {
+    mode.nom: mode
+    for mode in (
+        Mode(
+            "carte", "Affichage d'un niveau", DOSSIER_NIVEAUX,
+            ELEMENTS_DE_BASE, physique=False,
+        ),
+        Mode(
+            "couleurs", "Rectangles de couleur", DOSSIER_NIVEAUX,
+            ELEMENTS_DE_BASE,
+        ),
+        Mode(
+            "images", "Images", DOSSIER_NIVEAUX,
+            ELEMENTS_DE_BASE, images=True,
+        ),
+        Mode(
+            "monstres", "Monstres", DOSSIER_NIVEAUX_MONSTRES,
+            ELEMENTS_MONSTRES, images=True, monstres=True,
+        ),
+        Mode(
+            "monstres_mobiles", "Monstres mobiles",
+            DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+            ELEMENTS_MONSTRES_MOBILES, images=True, monstres=True,
+        ),
+        Mode(
+            "stats", "Stats & Timer", DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+            ELEMENTS_MONSTRES_MOBILES, images=True, monstres=True, stats=True,
+        ),
+    )
+}
+MODE_PAR_DEFAUT = "stats"
+
+
+def lancer(nom_mode: str = MODE_PAR_DEFAUT, options: Options | None = None):
+    """Lance le jeu dans le mode demandé."""
+    from jeu_arcade.jeu import main
+    main(MODES[nom_mode], options or Options())
@@ -0,0 +1,178 @@
+"""
+Monstres fixes et mobiles : déplacement et collisions avec le joueur.
+
+Un monstre mobile loin du joueur et posé sur un sol continu entre deux
+murs (ou bords de l'écran) est endormi : sa patrouille est calculée une
+fois à partir de la grille du niveau et il n'avance plus qu'en rebondissant
+entre ces deux bornes (`_patrouiller`), sans gravité ni parcours des murs
+du niveau. Il est réveillé dès qu'un joueur s'approche (en réseau, le plus
+proche de tous les joueurs connectés), et le mode exact (`exact=True`)
+simule tous les monstres complètement.
+"""
+import numpy as np
+import pygame
+
+from jeu_arcade.config import (
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    GRAVITE,
+    TAILLE_TUILE,
+    VITESSE_MAX_Y,
+)
+from jeu_arcade.physique import joueur, tuiles_proches
+from jeu_arcade.tables_tuiles import SOLIDES
+
+DISTANCE_REVEIL = 6 * TAILLE_TUILE # en deçà, le monstre est simulé en entier
+
+# Monstres simulés en entier / endormis au dernier tick
+compteurs = {"eveilles": 0, "endormis": 0}
+
+
+def _patrouille(niveau: dict, rect: pygame.Rect) -> tuple | None:
+    """
+    Murs qui bornent la patrouille d'un monstre posé au sol, si le sol est
+    continu entre eux. None si le monstre ne peut pas être endormi.
+    """
+    grille = niveau['grille']
+    if rect.y < 0 or rect.y % TAILLE_TUILE:
+        return None
+    ligne = rect.y // TAILLE_TUILE
+    if ligne + 1 >= grille.shape[0]:
+        return None
+    murs = np.flatnonzero(SOLIDES[grille[ligne]])
+    c0 = rect.left // TAILLE_TUILE
+    c1 = (rect.right - 1) // TAILLE_TUILE
+    a_gauche = murs[murs < c0]
+    a_droite = murs[murs > c1]
+    bornes = []
+    debut = 0
+    if len(a_gauche):
+        bornes.append(pygame.Rect(
+            int(a_gauche[-1]) * TAILLE_TUILE, rect.y, TAILLE_TUILE, TAILLE_TUILE
+        ))
+        debut = bornes[0].right
+    fin = ECRAN_LARGEUR
+    if len(a_droite) and a_droite[0] * TAILLE_TUILE <= ECRAN_LARGEUR:
+        bornes.append(pygame.Rect(
+            int(a_droite[0]) * TAILLE_TUILE, rect.y, TAILLE_TUILE, TAILLE_TUILE
+        ))
+        fin = bornes[-1].left
+    if len(murs[(murs >= c0) & (murs <= c1)]) or rect.left >= fin:
+        return None
+    sol = grille[ligne + 1, debut // TAILLE_TUILE:fin // TAILLE_TUILE]
+    if fin > grille.shape[1] * TAILLE_TUILE or not SOLIDES[sol].all():
+        return None
+    return grille, tuple(bornes)
+
+
+def _simuler_monstre(niveau: dict, monstre: dict):
+    """Gravité, déplacement et rebonds contre tous les murs proches."""
+    rect = monstre['rect']
+    monstre['vitesse_y'] += GRAVITE
+    if monstre['vitesse_y'] > VITESSE_MAX_Y:
+        monstre['vitesse_y'] = VITESSE_MAX_Y
+    rect.x += monstre['vitesse_x']
+    if rect.left <= 0:
+        monstre['vitesse_x'] = abs(monstre['vitesse_x'])
+    elif rect.right >= ECRAN_LARGEUR:
+        monstre['vitesse_x'] = -abs(monstre['vitesse_x'])
+    for mur in tuiles_proches(niveau['tuiles_sol'], rect):
+        if rect.colliderect(mur):
+            if monstre['vitesse_x'] > 0:
+                rect.right = mur.left
+                monstre['vitesse_x'] *= -1
+            elif monstre['vitesse_x'] < 0:
+                rect.left = mur.right
+                monstre['vitesse_x'] *= -1
+    rect.y += monstre['vitesse_y']
+    for mur in tuiles_proches(niveau['tuiles_sol'], rect):
+        if rect.colliderect(mur):
+            if monstre['vitesse_y'] > 0:
+                rect.bottom = mur.top
+                monstre['vitesse_y'] = 0
+
+
+def _patrouiller(monstre: dict):
+    """
+    Tick d'un monstre endormi : mêmes rebonds que `_simuler_monstre`, mais
+    contre ses deux bornes seulement. Le sol étant continu, la gravité le
+    ramène chaque tick à la même hauteur.
+    """
+    rect = monstre['rect']
+    rect.x += monstre['vitesse_x']
+    if rect.left <= 0:
+        monstre['vitesse_x'] = abs(monstre['vitesse_x'])
+    elif rect.right >= ECRAN_LARGEUR:
+        monstre['vitesse_x'] = -abs(monstre['vitesse_x'])
+    for mur in monstre['patrouille'][1]:
+        if rect.colliderect(mur):
+            if monstre['vitesse_x'] > 0:
+                rect.right = mur.left
+                monstre['vitesse_x'] *= -1
+            elif monstre['vitesse_x'] < 0:
+                rect.left = mur.right
+                monstre['vitesse_x'] *= -1
+
+
+def _loin_des_joueurs(rect: pygame.Rect, joueurs: list[pygame.Rect]) -> bool:
+    """Vrai si aucun joueur n'est à moins de DISTANCE_REVEIL (par axe)."""
+    for j in joueurs:
+        if (
+            abs(rect.centerx - j.centerx) <= DISTANCE_REVEIL
+            and abs(rect.centery - j.centery) <= DISTANCE_REVEIL
+        ):
+            return False
+    return True
+
+
+def gerer_physique_monstres(
+    niveau: dict,
+    exact: bool = False,
+    joueurs: list[pygame.Rect] | None = None,
+):
+    """
+    Applique gravité, déplacement et rebonds aux monstres mobiles. Sauf en
+    mode `exact`, les monstres loin de tous les `joueurs` (par défaut, le
+    joueur local) et posés sur un sol continu sont endormis (voir
+    `_patrouiller`).
+    """
+    if joueurs is None:
+        joueurs = [joueur['rect']] if joueur['rect'] is not None else []
+    monstres_a_supprimer = []
+    endormis = 0
+    for monstre in niveau['tuiles_monstres_mobiles']:
+        rect = monstre['rect']
+        patrouille = monstre.get('patrouille')
+        if exact or not _loin_des_joueurs(rect, joueurs):
+            patrouille = None
+        elif patrouille is not None and patrouille[0] is not niveau['grille']:
+            patrouille = None # Niveau rechargé : les bornes ont pu changer
+        elif patrouille is None and monstre['vitesse_y'] == 0:
+            patrouille = _patrouille(niveau, rect)
+        monstre['patrouille'] = patrouille
+        if patrouille is not None:
+            _patrouiller(monstre)
+            endormis += 1
+            continue
+        _simuler_monstre(niveau, monstre)
+        if rect.top > ECRAN_HAUTEUR:
+            monstres_a_supprimer.append(monstre)
+    for m in monstres_a_supprimer:
+        niveau['tuiles_monstres_mobiles'].retirer(m)
+    compteurs['endormis'] = endormis
+    compteurs['eveilles'] = len(niveau['tuiles_monstres_mobiles']) - endormis
+
+
+def verifier_collisions_danger(niveau: dict):
+    """Vérifie si le joueur touche un monstre."""
+    fixes = tuiles_proches(niveau['tuiles_monstres_fixes'], joueur['rect'])
+    for monstre in fixes:
+        # On réduit légèrement la zone de collision
+        # du monstre pour être "gentil" (hitbox)
+        hitbox_monstre = monstre.inflate(-10, -10)
+        if joueur['rect'].colliderect(hitbox_monstre):
+            joueur['mort'] = True
+    for monstre in niveau['tuiles_monstres_mobiles']:
+        hitbox_monstre = monstre["rect"].inflate(-10, -10)
+        if joueur['rect'].colliderect(hitbox_monstre):
+            joueur['mort'] = True
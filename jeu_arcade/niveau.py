@@ -0,0 +1,209 @@
+"""
+Lecture des fichiers de niveaux et construction des tuiles.
+
+Le texte d'un niveau est décodé en une grille NumPy `uint8` (une case par
+caractère, identifiants `TUILE_*` de la configuration) par une table de
+correspondance de 256 octets (`bytes.translate`). Les listes de rectangles
+utilisées par la physique sont ensuite dérivées de cette grille par
+familles de tuiles (`SOLIDES`, `DANGERS` de `tables_tuiles`).
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+from jeu_arcade.config import (
+    IDS_TUILES,
+    TAILLE_TUILE,
+    TUILE_INVALIDE,
+    TUILE_JOUEUR,
+    TUILE_MONSTRE_MOBILE,
+    TUILE_SORTIE,
+    ElementDecor,
+)
+from jeu_arcade.erreurs import (
+    CaractereInvalideErreur,
+    NiveauIntrouvableErreur,
+    PositionJoueurErreur,
+    TuileSortieErreur,
+)
+from jeu_arcade.reserve import ReserveMonstres
+from jeu_arcade.tables_tuiles import DANGERS, SOLIDES, cases_de
+from jeu_arcade.tuiles_compactes import TuilesCompactes
+
+TOUS_LES_ELEMENTS = frozenset(ElementDecor)
+
+
+def creer_tuile(x_grille: int, y_grille: int) -> pygame.Rect:
+    """Crée et retourne un objet pygame.Rect pour une tuile."""
+    return pygame.Rect(
+        x_grille * TAILLE_TUILE,
+        y_grille * TAILLE_TUILE,
+        TAILLE_TUILE, TAILLE_TUILE
+    )
+
+
+def decouper_lignes(donnees_texte: str) -> list[str]:
+    """Découpe le texte d'un niveau en lignes nettoyées."""
+    return [ligne.strip() for ligne in donnees_texte.strip().split('\n')]
+
+
+@lru_cache
+def table_decodage(elements: frozenset[ElementDecor]) -> bytes:
+    """Table caractère (0-255) -> identifiant de tuile des éléments permis."""
+    table = bytearray([TUILE_INVALIDE]) * 256
+    for element in elements:
+        table[ord(element.value)] = IDS_TUILES[element]
+    return bytes(table)
+
+
+def decoder_lignes(
+    lignes: list[str],
+    elements: frozenset[ElementDecor] = TOUS_LES_ELEMENTS,
+    premiere_ligne: int = 0,
+) -> np.ndarray:
+    """
+    Décode des lignes de texte en grille uint8, complétée par du vide à
+    droite. Lève CaractereInvalideErreur sur le premier caractère interdit
+    (`premiere_ligne` décale les numéros de ligne du message).
+    """
+    largeur = max((len(ligne) for ligne in lignes), default=0)
+    texte = "".join(
+        ligne.ljust(largeur, ElementDecor.VIDE.value) for ligne in lignes
+    )
+    table = table_decodage(elements)
+    try:
+        # Latin-1 : un octet par caractère, les colonnes restent exactes
+        octets = texte.encode("latin-1").translate(table)
+        invalide = octets.find(TUILE_INVALIDE)
+    except UnicodeEncodeError as e:
+        # Caractère hors latin-1, sauf si un caractère interdit le précède
+        invalide = texte[:e.start].encode("latin-1").translate(table).find(
+            TUILE_INVALIDE
+        )
+        if invalide < 0:
+            invalide = e.start
+    if invalide >= 0:
+        y, x = divmod(invalide, largeur)
+        raise CaractereInvalideErreur(lignes[y][x], y + premiere_ligne, x)
+    return np.frombuffer(bytearray(octets), dtype=np.uint8).reshape(
+        len(lignes), largeur
+    )
+
+
+def positions_de(
+    grille: np.ndarray, tuile: int | np.ndarray, premiere_ligne: int = 0
+) -> list[tuple[int, int]]:
+    """
+    Coordonnées en pixels des cases de ce type (ou de cette famille, voir
+    `cases_de`), dans l'ordre des lignes.
+    """
+    ys, xs = np.nonzero(cases_de(grille, tuile))
+    return list(zip(
+        (xs * TAILLE_TUILE).tolist(),
+        ((ys + premiere_ligne) * TAILLE_TUILE).tolist(),
+    ))
+
+
+def rects_de(
+    grille: np.ndarray, tuile: int | np.ndarray, premiere_ligne: int = 0
+) -> list[pygame.Rect]:
+    """Un rectangle par case de ce type."""
+    return [
+        pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE)
+        for x, y in positions_de(grille, tuile, premiere_ligne)
+    ]
+
+
+def monstres_mobiles_de(
+    grille: np.ndarray,
+    premiere_ligne: int = 0,
+    reserve: ReserveMonstres | None = None,
+) -> ReserveMonstres:
+    """
+    Un monstre mobile par case, au départ de sa case. Les monstres déjà
+    dans `reserve` sont libérés puis réutilisés.
+    """
+    if reserve is None:
+        reserve = ReserveMonstres()
+    reserve.vider()
+    for x, y in positions_de(grille, TUILE_MONSTRE_MOBILE, premiere_ligne):
+        reserve.ajouter(x, y)
+    return reserve
+
+
+def verifier_comptes(compte_joueur: int, compte_sortie: int):
+    """Lève une NiveauErreur s'il n'y a pas un seul P et une seule E."""
+    if compte_joueur != 1:
+        raise PositionJoueurErreur(compte_joueur)
+    if compte_sortie != 1:
+        raise TuileSortieErreur(compte_sortie)
+
+
+def tuiles_depuis_grille(grille: np.ndarray, premiere_ligne: int = 0) -> dict:
+    """Dérive de la grille les tuiles de chaque type, dans l'ordre des lignes."""
+    return {
+        "tuiles_sol": rects_de(grille, SOLIDES, premiere_ligne),
+        "sorties": rects_de(grille, TUILE_SORTIE, premiere_ligne),
+        "joueurs": positions_de(grille, TUILE_JOUEUR, premiere_ligne),
+        "tuiles_monstres_fixes": rects_de(grille, DANGERS, premiere_ligne),
+        "tuiles_monstres_mobiles": monstres_mobiles_de(grille, premiere_ligne),
+    }
+
+
+def construire_niveau(
+    donnees_texte: str,
+    elements: frozenset[ElementDecor] = TOUS_LES_ELEMENTS,
+    compact: bool = False,
+    reserve: ReserveMonstres | None = None,
+) -> dict:
+    """
+    Transforme les données textuelles du niveau en objets Pygame.
+    Seuls les éléments du décor listés dans `elements` sont acceptés.
+    Avec `compact`, les murs et les monstres fixes sont des TuilesCompactes
+    au lieu de listes de rectangles. Les monstres mobiles sont pris dans
+    `reserve` si elle est donnée (celle du niveau précédent).
+    """
+    lignes = decouper_lignes(donnees_texte)
+    grille = decoder_lignes(lignes, elements)
+    verifier_comptes(
+        int(np.count_nonzero(grille == TUILE_JOUEUR)),
+        int(np.count_nonzero(grille == TUILE_SORTIE)),
+    )
+    if compact:
+        tuiles_sol = TuilesCompactes(grille, SOLIDES)
+        tuiles_monstres_fixes = TuilesCompactes(grille, DANGERS)
+    else:
+        tuiles_sol = rects_de(grille, SOLIDES)
+        tuiles_monstres_fixes = rects_de(grille, DANGERS)
+    return {
+        "tuiles_sol": tuiles_sol,
+        "tuile_sortie": rects_de(grille, TUILE_SORTIE)[0],
+        "pos_joueur": positions_de(grille, TUILE_JOUEUR)[0],
+        "tuiles_monstres_fixes": tuiles_monstres_fixes,
+        "tuiles_monstres_mobiles": monstres_mobiles_de(grille, 0, reserve),
+        "grille": grille,
+        "lignes": lignes,
+    }
+
+
+def chemin_niveau(numero_niveau: int, dossier: Path) -> Path:
+    """Chemin du fichier d'un niveau."""
+    return dossier / f"niveau_{numero_niveau}.txt"
+
+
+def charger_niveau(numero_niveau: int, dossier) -> str:
+    """
+    Charge le contenu du fichier `niveau_{numero_niveau}.txt` de `dossier`,
+    ou le niveau de ce numéro si `dossier` est un PaquetNiveaux.
+    Lève NiveauIntrouvableErreur si le fichier est manquant.
+    """
+    if not isinstance(dossier, Path):
+        return dossier.texte(numero_niveau)
+    chemin_fichier = chemin_niveau(numero_niveau, dossier)
+    try:
+        contenu = chemin_fichier.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        raise NiveauIntrouvableErreur(chemin_fichier)
+    return contenu
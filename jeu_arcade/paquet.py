@@ -0,0 +1,205 @@
+"""
+Paquet de niveaux : un seul fichier avec une table d'index, le texte de
+tous les niveaux et, au besoin, des ressources (images...).
+
+    python -m jeu_arcade.paquet construire niveaux_monstres_mobiles campagne.paq
+    python -m jeu_arcade.paquet lister campagne.paq
+
+Le fichier est projeté en mémoire (`mmap`) une seule fois. L'en-tête donne
+le nombre de niveaux et de ressources ; la table d'index qui le suit a des
+entrées de taille fixe (décalage, taille, nom), les niveaux d'abord, dans
+l'ordre de leur numéro. Le niveau `n` se lit donc sans recherche, à
+l'entrée `n - 1`, et un nom se retrouve par un dictionnaire construit à
+l'ouverture. Aucun fichier n'est ouvert par niveau.
+"""
+import argparse
+import mmap
+import re
+import struct
+from pathlib import Path
+
+from jeu_arcade.erreurs import NiveauIntrouvableErreur, PaquetInvalideErreur
+
+MAGIE = b"JAPQ"
+VERSION = 1
+EN_TETE = struct.Struct("<4sHII") # magie, version, niveaux, ressources
+ENTREE = struct.Struct("<QI64s") # décalage, taille, nom (UTF-8, complété de 0)
+
+
+class PaquetNiveaux:
+    """Paquet de niveaux projeté en mémoire, lu par numéro ou par nom."""
+
+    def __init__(self, chemin: str | Path):
+        """Lève PaquetInvalideErreur si le fichier est absent ou illisible."""
+        self.chemin = Path(chemin)
+        try:
+            with open(self.chemin, "rb") as fichier:
+                self._mmap = mmap.mmap(
+                    fichier.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        except ValueError: # mmap refuse un fichier vide
+            raise PaquetInvalideErreur(self.chemin, "fichier vide") from None
+        except OSError as e:
+            raise PaquetInvalideErreur(
+                self.chemin, e.strerror or str(e)
+            ) from None
+        try:
+            self._lire_index()
+        except UnicodeDecodeError:
+            self._mmap.close()
+            raise PaquetInvalideErreur(self.chemin, "nom illisible") from None
+        except PaquetInvalideErreur:
+            self._mmap.close()
+            raise
+
+    def _lire_index(self):
+        """Vérifie l'en-tête et la table d'index, indexe les noms."""
+        if len(self._mmap) < EN_TETE.size:
+            raise PaquetInvalideErreur(self.chemin, "fichier tronqué")
+        magie, version, self.nb_niveaux, nb_ressources = EN_TETE.unpack_from(
+            self._mmap
+        )
+        if magie != MAGIE or version != VERSION:
+            raise PaquetInvalideErreur(self.chemin, "en-tête inconnu")
+        self.nb_entrees = self.nb_niveaux + nb_ressources
+        if len(self._mmap) < EN_TETE.size + self.nb_entrees * ENTREE.size:
+            raise PaquetInvalideErreur(self.chemin, "table d'index tronquée")
+        self._indices = {}
+        for indice in range(self.nb_entrees):
+            self._indices[self._entree(indice)[2]] = indice
+
+    def _entree(self, indice: int) -> tuple[int, int, str]:
+        decalage, taille, nom = ENTREE.unpack_from(
+            self._mmap, EN_TETE.size + indice * ENTREE.size
+        )
+        if decalage + taille > len(self._mmap):
+            raise PaquetInvalideErreur(self.chemin, f"entrée {indice} tronquée")
+        return decalage, taille, nom.rstrip(b"\0").decode("utf-8")
+
+    def _octets(self, indice: int) -> bytes:
+        decalage, taille, _ = self._entree(indice)
+        return self._mmap[decalage:decalage + taille]
+
+    def __len__(self) -> int:
+        return self.nb_niveaux
+
+    def noms(self) -> list[str]:
+        """Noms des niveaux, dans l'ordre de leur numéro."""
+        return [self._entree(i)[2] for i in range(self.nb_niveaux)]
+
+    def ressources(self) -> list[str]:
+        """Noms des ressources du paquet."""
+        return [
+            self._entree(i)[2] for i in range(self.nb_niveaux, self.nb_entrees)
+        ]
+
+    def texte(self, numero_niveau: int) -> str:
+        """
+        Texte du niveau `numero_niveau` (à partir de 1). Lève
+        NiveauIntrouvableErreur après le dernier niveau.
+        """
+        if not 1 <= numero_niveau <= self.nb_niveaux:
+            raise NiveauIntrouvableErreur(f"{self.chemin}#{numero_niveau}")
+        return self._octets(numero_niveau - 1).decode("utf-8")
+
+    def texte_par_nom(self, nom: str) -> str:
+        indice = self._indices.get(nom)
+        if indice is None or indice >= self.nb_niveaux:
+            raise NiveauIntrouvableErreur(f"{self.chemin}#{nom}")
+        return self._octets(indice).decode("utf-8")
+
+    def ressource(self, nom: str) -> bytes | None:
+        """Contenu d'une ressource du paquet (None si absente)."""
+        indice = self._indices.get(nom)
+        if indice is None or indice < self.nb_niveaux:
+            return None
+        return self._octets(indice)
+
+    def fermer(self):
+        self._mmap.close()
+
+    def __enter__(self) -> "PaquetNiveaux":
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+
+def ecrire_paquet(
+    chemin: str | Path,
+    niveaux: list[tuple[str, str]],
+    ressources: dict[str, bytes] | None = None,
+):
+    """Écrit un paquet : `niveaux` est une liste (nom, texte) dans l'ordre."""
+    entrees = [(nom, texte.encode("utf-8")) for nom, texte in niveaux]
+    entrees += list((ressources or {}).items())
+    decalage = EN_TETE.size + len(entrees) * ENTREE.size
+    index = []
+    for nom, donnees in entrees:
+        nom_octets = nom.encode("utf-8")
+        if len(nom_octets) > 64:
+            raise ValueError(f"Nom trop long pour le paquet : '{nom}'")
+        index.append(ENTREE.pack(decalage, len(donnees), nom_octets))
+        decalage += len(donnees)
+    with open(chemin, "wb") as fichier:
+        fichier.write(EN_TETE.pack(
+            MAGIE, VERSION, len(niveaux), len(entrees) - len(niveaux)
+        ))
+        fichier.writelines(index)
+        fichier.writelines(donnees for _, donnees in entrees)
+
+
+def niveaux_du_dossier(dossier: Path) -> list[tuple[str, str]]:
+    """Niveaux `niveau_{n}.txt` consécutifs d'un dossier, à partir de 1."""
+    numeros = sorted(
+        int(m.group(1))
+        for chemin in dossier.glob("niveau_*.txt")
+        if (m := re.fullmatch(r"niveau_(\d+)\.txt", chemin.name))
+    )
+    niveaux = []
+    for attendu, numero in enumerate(numeros, start=1):
+        if numero != attendu:
+            break # Le jeu s'arrête au premier numéro manquant
+        chemin = dossier / f"niveau_{numero}.txt"
+        niveaux.append((chemin.stem, chemin.read_text(encoding="utf-8")))
+    return niveaux
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="jeu_arcade.paquet", description=__doc__.split("\n\n")[0]
+    )
+    commandes = parser.add_subparsers(dest="commande", required=True)
+    construire = commandes.add_parser(
+        "construire", help="regroupe les niveaux d'un dossier dans un paquet"
+    )
+    construire.add_argument("dossier", type=Path)
+    construire.add_argument("paquet", type=Path)
+    construire.add_argument(
+        "--ressources", type=Path, nargs="*", default=[],
+        help="fichiers ajoutés au paquet sous leur nom (images...)",
+    )
+    lister = commandes.add_parser("lister", help="affiche le contenu d'un paquet")
+    lister.add_argument("paquet", type=Path)
+    args = parser.parse_args()
+    if args.commande == "construire":
+        niveaux = niveaux_du_dossier(args.dossier)
+        ressources = {
+            chemin.name: chemin.read_bytes() for chemin in args.ressources
+        }
+        ecrire_paquet(args.paquet, niveaux, ressources)
+        print(
+            f"{args.paquet} : {len(niveaux)} niveaux, "
+            f"{len(ressources)} ressources."
+        )
+    else:
+        with PaquetNiveaux(args.paquet) as paquet:
+            print(f"{args.paquet} : {len(paquet)} niveaux")
+            for numero, nom in enumerate(paquet.noms(), start=1):
+                print(f"{numero:>6}  {nom}")
+            if paquet.ressources():
+                print("Ressources : " + ", ".join(paquet.ressources()))
+
+
+if __name__ == "__main__":
+    main()
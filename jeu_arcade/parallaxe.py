@@ -0,0 +1,84 @@
+"""
+Fond en plusieurs couches qui défilent en parallaxe (option --parallaxe).
+
+Chaque couche est mise à la hauteur de l'écran une seule fois, puis répétée
+horizontalement dans une bande en cache au moins aussi large que l'écran.
+Une couche qui défile d'un décalage `x` se dessine avec deux `blit` au plus
+(la fin de la bande à partir de `x`, puis son début pour boucler) : ajouter
+une couche ne coûte qu'une copie de pixels par frame, sans
+redimensionnement.
+
+Le jeu n'a pas de caméra qui défile : la position horizontale du joueur
+sert de position de caméra, et une couche se décale de `facteur` pixels
+quand elle avance d'un pixel (0 : fixe, 1 : au rythme du niveau).
+"""
+import pygame
+
+from jeu_arcade.config import COUCHES_PARALLAXE
+from jeu_arcade.images import charger_image
+
+
+class CoucheParallaxe:
+    """Bande en cache d'une couche et son facteur de défilement."""
+
+    def __init__(
+        self,
+        image: pygame.Surface,
+        facteur: float,
+        taille_ecran: tuple[int, int],
+        opaque: bool,
+    ):
+        largeur_ecran, hauteur = taille_ecran
+        largeur = max(round(image.get_width() * hauteur / image.get_height()), 1)
+        motif = pygame.transform.smoothscale(image, (largeur, hauteur))
+        self.largeur = largeur * -(-largeur_ecran // largeur) # multiple >= écran
+        if opaque:
+            self.bande = pygame.Surface((self.largeur, hauteur)).convert()
+        else:
+            self.bande = pygame.Surface(
+                (self.largeur, hauteur), pygame.SRCALPHA
+            ).convert_alpha()
+        self.bande.blits([(motif, (x, 0)) for x in range(0, self.largeur, largeur)])
+        self.facteur = facteur
+        self.largeur_ecran = largeur_ecran
+
+    def dessiner(self, ecran: pygame.Surface, camera_x: int):
+        x = int(camera_x * self.facteur) % self.largeur
+        visible = min(self.largeur - x, self.largeur_ecran)
+        ecran.blit(self.bande, (0, 0), (x, 0, visible, self.bande.get_height()))
+        if visible < self.largeur_ecran:
+            ecran.blit(
+                self.bande, (visible, 0),
+                (0, 0, self.largeur_ecran - visible, self.bande.get_height()),
+            )
+
+
+class FondParallaxe:
+    """Couches du fond, de la plus lointaine à la plus proche."""
+
+    def __init__(
+        self,
+        couches: list[tuple[pygame.Surface, float]],
+        taille_ecran: tuple[int, int],
+    ):
+        self.couches = [
+            CoucheParallaxe(image, facteur, taille_ecran, opaque=i == 0)
+            for i, (image, facteur) in enumerate(couches)
+        ]
+
+    @classmethod
+    def depuis_config(cls, taille_ecran: tuple[int, int]) -> "FondParallaxe":
+        """Charge les couches de COUCHES_PARALLAXE (images absentes ignorées)."""
+        couches = []
+        for nom_fichier, facteur in COUCHES_PARALLAXE:
+            image = charger_image(nom_fichier, alpha=bool(couches))
+            if image is not None:
+                couches.append((image, facteur))
+        return cls(couches, taille_ecran)
+
+    def __bool__(self) -> bool:
+        return bool(self.couches)
+
+    def dessiner(self, ecran: pygame.Surface, camera_x: int = 0):
+        for couche in self.couches:
+            couche.dessiner(ecran, camera_x)
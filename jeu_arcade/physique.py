@@ -0,0 +1,98 @@
+"""État du joueur, vitesses et collisions avec les tuiles solides."""
+import pygame
+
+from jeu_arcade.config import (
+    GRAVITE,
+    TAILLE_TUILE,
+    VITESSE_MAX_X,
+    VITESSE_MAX_Y,
+    VITESSE_SAUT,
+)
+
+joueur = {
+    'rect': None,
+    'vitesse_x': 0,
+    'vitesse_y': 0,
+    'au_sol': False,
+    'direction': 'droite',
+    'mort': False
+}
+
+
+def initialiser_joueur(x: int, y: int):
+    """Initialise la structure du joueur."""
+    joueur['rect'] = pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE)
+    joueur['vitesse_x'] = 0
+    joueur['vitesse_y'] = 0
+    joueur['au_sol'] = False
+    joueur["direction"] = "droite"
+    joueur["mort"] = False
+
+
+def mettre_a_jour_vitesses(touches: dict):
+    """Met à jour les vitesses du joueur selon les touches pressées."""
+    joueur['vitesse_x'] = 0
+    if touches[pygame.K_LEFT]:
+        joueur['vitesse_x'] = -VITESSE_MAX_X
+        joueur["direction"] = "gauche"
+    if touches[pygame.K_RIGHT]:
+        joueur['vitesse_x'] = VITESSE_MAX_X
+        joueur["direction"] = "droite"
+    if not joueur['au_sol']:
+        joueur['vitesse_y'] += GRAVITE
+    if touches[pygame.K_SPACE] and joueur['au_sol']:
+        sauter()
+    # Limiter la vitesse verticale pour
+    # ne pas traverser les blocs trop vite
+    if joueur['vitesse_y'] > VITESSE_MAX_Y:
+        joueur['vitesse_y'] = VITESSE_MAX_Y
+
+
+def sauter():
+    """Applique un saut si le joueur est au sol."""
+    if joueur['au_sol']:
+        joueur['vitesse_y'] = -VITESSE_SAUT
+        joueur['au_sol'] = False
+
+
+def tuiles_proches(tuiles, rect: pygame.Rect):
+    """
+    Tuiles à tester contre `rect` : toute la liste, ou seulement les cases
+    voisines de `rect` pour des TuilesCompactes.
+    """
+    if isinstance(tuiles, list):
+        return tuiles
+    return tuiles.dans(rect.inflate(2 * TAILLE_TUILE, 2 * TAILLE_TUILE))
+
+
+def gerer_collisions_horizontales(niveau: dict):
+    """Gère les collisions horizontales avec les tuiles solides du niveau."""
+    for tuile in tuiles_proches(niveau['tuiles_sol'], joueur["rect"]):
+        if joueur["rect"].colliderect(tuile):
+            if joueur["vitesse_x"] > 0: # Collision à droite
+                joueur["rect"].right = tuile.left
+            elif joueur["vitesse_x"] < 0: # Collision à gauche
+                joueur["rect"].left = tuile.right
+
+
+def gerer_collisions_verticales(niveau: dict):
+    """Gère les collisions verticales avec les tuiles solides du niveau."""
+    for tuile in tuiles_proches(niveau['tuiles_sol'], joueur["rect"]):
+        if joueur["rect"].colliderect(tuile):
+            if joueur["vitesse_y"] > 0: # Collision par le haut (atterrissage)
+                joueur["rect"].bottom = tuile.top
+                joueur["vitesse_y"] = 0
+                joueur["au_sol"] = True
+            elif joueur["vitesse_y"] < 0: # Collision par le bas (tête)
+                joueur["rect"].top = tuile.bottom
+                joueur["vitesse_y"] = 0
+
+
+def appliquer_physique(niveau: dict, touches: dict):
+    """Gère le mouvement et les collisions en séparant les axes."""
+    mettre_a_jour_vitesses(touches)
+    joueur["rect"].x += joueur["vitesse_x"]
+    gerer_collisions_horizontales(niveau)
+    joueur["rect"].y += joueur["vitesse_y"]
+    joueur["au_sol"] = False # On présume qu'on tombe jusqu'à preuve du contraire
+    gerer_collisions_verticales(niveau)
@@ -0,0 +1,151 @@
+"""
+Rechargement à chaud du niveau en cours (option --surveiller).
+
+Le fichier du niveau est surveillé par sa date de modification. Quand il
+change, seules les lignes modifiées sont analysées à nouveau et les tuiles
+correspondantes sont remplacées dans `niveau_data` (grille et listes de
+tuiles), sans relancer le niveau. Les monstres mobiles sont appariés à
+leur case de départ : un monstre dont le X est toujours là continue où il
+est, celui dont le X a disparu est retiré où qu'il se trouve, et chaque
+nouveau X fait apparaître un monstre.
+"""
+import time
+from pathlib import Path
+
+import numpy as np
+
+from jeu_arcade.config import (
+    TAILLE_TUILE,
+    TUILE_JOUEUR,
+    TUILE_MONSTRE_MOBILE,
+    TUILE_SORTIE,
+    TUILE_VIDE,
+    ElementDecor,
+)
+from jeu_arcade.niveau import (
+    decoder_lignes,
+    decouper_lignes,
+    positions_de,
+    tuiles_depuis_grille,
+    verifier_comptes,
+)
+from jeu_arcade.tables_tuiles import DANGERS, SOLIDES
+from jeu_arcade.tuiles_compactes import TuilesCompactes
+
+INTERVALLE_SURVEILLANCE = 0.5 # secondes entre deux consultations du fichier
+
+
+class SurveillanceNiveau:
+    """Détecte les modifications d'un fichier de niveau."""
+
+    def __init__(self, chemin: Path):
+        self.chemin = chemin
+        self._date = self._date_modification()
+        self._prochaine_verification = time.monotonic()
+
+    def _date_modification(self) -> int | None:
+        try:
+            return self.chemin.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def a_change(self) -> bool:
+        """Vrai si le fichier a été modifié depuis le dernier appel."""
+        maintenant = time.monotonic()
+        if maintenant < self._prochaine_verification:
+            return False
+        self._prochaine_verification = maintenant + INTERVALLE_SURVEILLANCE
+        date = self._date_modification()
+        if date is None or date == self._date:
+            return False
+        self._date = date
+        return True
+
+
+def _dans_lignes(rect, lignes: set[int]) -> bool:
+    return rect.y // TAILLE_TUILE in lignes
+
+
+def appliquer_modifications(
+    niveau_data: dict,
+    donnees_texte: str,
+    elements: frozenset[ElementDecor],
+) -> list[int]:
+    """
+    Met à jour `niveau_data` avec le nouveau texte du niveau en ne
+    reconstruisant que les lignes modifiées. Retourne ces lignes.
+
+    Lève une NiveauErreur (et ne modifie rien) si le nouveau texte est
+    invalide.
+    """
+    anciennes = niveau_data['lignes']
+    nouvelles = decouper_lignes(donnees_texte)
+    modifiees = [
+        y for y in range(max(len(anciennes), len(nouvelles)))
+        if y >= len(anciennes) or y >= len(nouvelles)
+        or anciennes[y] != nouvelles[y]
+    ]
+    if not modifiees:
+        return []
+
+    # Décodage des lignes modifiées, avant de toucher au niveau
+    ancienne = niveau_data['grille']
+    largeur = max((len(ligne) for ligne in nouvelles), default=0)
+    grille = np.full((len(nouvelles), largeur), TUILE_VIDE, dtype=np.uint8)
+    hauteur_commune = min(len(ancienne), len(nouvelles))
+    largeur_commune = min(ancienne.shape[1], largeur)
+    grille[:hauteur_commune, :largeur_commune] = (
+        ancienne[:hauteur_commune, :largeur_commune]
+    )
+    for y in modifiees:
+        if y < len(nouvelles):
+            grille[y] = TUILE_VIDE
+            rangee = decoder_lignes([nouvelles[y]], elements, y)[0]
+            grille[y, :len(rangee)] = rangee
+    verifier_comptes(
+        int(np.count_nonzero(grille == TUILE_JOUEUR)),
+        int(np.count_nonzero(grille == TUILE_SORTIE)),
+    )
+    lignes = set(modifiees)
+    tuiles = [
+        tuiles_depuis_grille(grille[y:y + 1], y)
+        for y in modifiees if y < len(nouvelles)
+    ]
+
+    # Remplacement en place des tuiles des lignes modifiées
+    for cle, tuile in (
+        ('tuiles_sol', SOLIDES),
+        ('tuiles_monstres_fixes', DANGERS),
+    ):
+        liste = niveau_data[cle]
+        if isinstance(liste, TuilesCompactes):
+            # Grille de bits et coordonnées : reconstruites d'un bloc
+            niveau_data[cle] = TuilesCompactes(grille, tuile)
+            continue
+        liste[:] = [rect for rect in liste if not _dans_lignes(rect, lignes)]
+        for t in tuiles:
+            liste += t[cle]
+        liste.sort(key=lambda rect: (rect.y, rect.x))
+    # Monstres mobiles appariés par case de départ, pas par leur ligne
+    # actuelle : ni doublon, ni monstre remis à son départ sans raison
+    avant = set()
+    apres = set()
+    for y in modifiees:
+        for source, departs in ((ancienne, avant), (grille, apres)):
+            if y < len(source):
+                departs.update(
+                    positions_de(source[y:y + 1], TUILE_MONSTRE_MOBILE, y)
+                )
+    mobiles = niveau_data['tuiles_monstres_mobiles']
+    for m in [m for m in mobiles if m['depart'] in avant - apres]:
+        mobiles.retirer(m)
+    for x, y in sorted(apres - avant, key=lambda p: (p[1], p[0])):
+        mobiles.ajouter(x, y)
+    for t in tuiles:
+        if t['sorties']:
+            niveau_data['tuile_sortie'] = t['sorties'][0]
+        if t['joueurs']:
+            niveau_data['pos_joueur'] = t['joueurs'][0]
+    niveau_data['grille'] = grille
+    niveau_data['lignes'] = nouvelles
+    return modifiees
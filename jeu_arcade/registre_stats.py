@@ -0,0 +1,207 @@
+"""
+Registre persistant des niveaux terminés (SQLite).
+
+Chaque niveau terminé est ajouté à la table `parcours` (jamais modifiée,
+seulement complétée), indexée par niveau. Les classements par niveau sont
+gardés en mémoire et mis à jour à chaque ajout : les consulter ne touche
+jamais le disque. La création du schéma, la lecture des classements et les
+écritures sont faites par un thread dédié pour ne jamais bloquer le
+démarrage ni la boucle de jeu : un parcours ajouté avant la fin de la
+lecture est fusionné aux classements relus. Une erreur SQLite (base
+verrouillée, disque plein) est affichée et le lot est gardé pour
+l'écriture suivante ; les parcours jamais écrits sont signalés à la
+fermeture.
+"""
+import bisect
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from jeu_arcade.config import RACINE
+
+FICHIER_STATS = RACINE / "stats.sqlite3"
+TAILLE_CLASSEMENT = 10
+DELAI_ECRITURE = 0.5 # secondes max avant qu'un lot en attente soit écrit
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parcours (
+    id INTEGER PRIMARY KEY,
+    partie TEXT NOT NULL,
+    date TEXT NOT NULL,
+    niveau INTEGER NOT NULL,
+    temps REAL NOT NULL,
+    essais INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS parcours_niveau_temps
+    ON parcours (niveau, temps);
+CREATE INDEX IF NOT EXISTS parcours_niveau_essais
+    ON parcours (niveau, essais, temps);
+"""
+
+
+class RegistreStats:
+    """Enregistre les parcours et tient les classements par niveau."""
+
+    def __init__(self, chemin: str | Path = FICHIER_STATS):
+        self.chemin = Path(chemin)
+        self.partie = datetime.now().isoformat(timespec="seconds")
+        # niveau -> liste triée de (temps, essais) / (essais, temps)
+        self._par_temps: dict[int, list[tuple[float, int]]] = {}
+        self._par_essais: dict[int, list[tuple[int, float]]] = {}
+        self._file: queue.Queue = queue.Queue()
+        self._verrou = threading.Lock() # classements et parcours à fusionner
+        self._pret = False # classements relus (ou lecture ratée)
+        self._a_fusionner: list[tuple[int, float, int]] = []
+        self._ferme = False
+        self.non_ecrits = 0 # parcours restés en attente à la fermeture
+        self._thread = threading.Thread(
+            target=self._ecrire_en_continu, name="registre-stats", daemon=True
+        )
+        self._thread.start()
+
+    def _charger_classements(self, connexion: sqlite3.Connection) -> tuple:
+        """Relit les meilleurs parcours de chaque niveau via les index."""
+        par_temps, par_essais = {}, {}
+        niveaux = [
+            n for (n,) in connexion.execute(
+                "SELECT DISTINCT niveau FROM parcours"
+            )
+        ]
+        for niveau in niveaux:
+            par_temps[niveau] = connexion.execute(
+                "SELECT temps, essais FROM parcours WHERE niveau = ? "
+                "ORDER BY temps LIMIT ?",
+                (niveau, TAILLE_CLASSEMENT),
+            ).fetchall()
+            par_essais[niveau] = connexion.execute(
+                "SELECT essais, temps FROM parcours WHERE niveau = ? "
+                "ORDER BY essais, temps LIMIT ?",
+                (niveau, TAILLE_CLASSEMENT),
+            ).fetchall()
+        return par_temps, par_essais
+
+    def _classer(self, niveau: int, temps: float, essais: int):
+        _inserer(self._par_temps.setdefault(niveau, []), (temps, essais))
+        _inserer(self._par_essais.setdefault(niveau, []), (essais, temps))
+
+    def _installer_classements(self, par_temps: dict, par_essais: dict):
+        """Remplace les classements par ceux relus, parcours récents compris."""
+        with self._verrou:
+            self._par_temps, self._par_essais = par_temps, par_essais
+            for parcours in self._a_fusionner:
+                self._classer(*parcours)
+            self._a_fusionner.clear()
+            self._pret = True
+
+    def enregistrer(self, niveau: int, temps: float, essais: int):
+        """
+        Ajoute un niveau terminé. Les classements en mémoire sont mis à jour
+        tout de suite, l'écriture disque est confiée au thread d'écriture.
+        """
+        with self._verrou:
+            self._classer(niveau, temps, essais)
+            if not self._pret:
+                self._a_fusionner.append((niveau, temps, essais))
+        date = datetime.now().isoformat(timespec="seconds")
+        self._file.put((self.partie, date, niveau, temps, essais))
+
+    def meilleur_temps(self, niveau: int) -> float | None:
+        """Meilleur temps enregistré pour ce niveau."""
+        classement = self._par_temps.get(niveau)
+        return classement[0][0] if classement else None
+
+    def moins_essais(self, niveau: int) -> int | None:
+        """Plus petit nombre d'essais enregistré pour ce niveau."""
+        classement = self._par_essais.get(niveau)
+        return classement[0][0] if classement else None
+
+    def classement_temps(self, niveau: int) -> list[tuple[float, int]]:
+        """Top des (temps, essais) pour ce niveau, du plus rapide au plus lent."""
+        return list(self._par_temps.get(niveau, []))
+
+    def classement_essais(self, niveau: int) -> list[tuple[int, float]]:
+        """Top des (essais, temps) pour ce niveau."""
+        return list(self._par_essais.get(niveau, []))
+
+    def _ouvrir(self) -> sqlite3.Connection | None:
+        """Ouvre la base et crée le schéma. None si SQLite échoue."""
+        try:
+            connexion = sqlite3.connect(self.chemin)
+            connexion.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            print(f"Registre des stats indisponible ({self.chemin}) : {e}")
+            return None
+        return connexion
+
+    def _ecrire_en_continu(self):
+        """
+        Boucle du thread d'écriture : relit les classements, puis regroupe
+        les parcours par lots. Un lot qui échoue est retenté avec le suivant.
+        """
+        connexion = self._ouvrir()
+        classements = ({}, {})
+        try:
+            if connexion is not None:
+                classements = self._charger_classements(connexion)
+        except sqlite3.Error as e:
+            print(f"Lecture des classements impossible : {e}")
+        finally:
+            self._installer_classements(*classements)
+        en_attente = []
+        en_cours = True
+        while en_cours:
+            ligne = self._file.get()
+            try:
+                while ligne is not None:
+                    en_attente.append(ligne)
+                    ligne = self._file.get(timeout=DELAI_ECRITURE)
+            except queue.Empty:
+                pass
+            en_cours = ligne is not None
+            if not en_attente:
+                continue
+            if connexion is None:
+                connexion = self._ouvrir()
+                if connexion is None:
+                    continue
+            try:
+                with connexion:
+                    connexion.executemany(
+                        "INSERT INTO parcours "
+                        "(partie, date, niveau, temps, essais)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        en_attente,
+                    )
+            except sqlite3.Error as e:
+                print(
+                    f"Écriture des stats impossible ({len(en_attente)} "
+                    f"parcours en attente) : {e}"
+                )
+                continue
+            en_attente.clear()
+        self.non_ecrits = len(en_attente)
+        if connexion is not None:
+            connexion.close()
+
+    def fermer(self):
+        """
+        Écrit les parcours en attente et arrête le thread d'écriture. Les
+        parcours qui n'ont pas pu être écrits sont comptés dans `non_ecrits`.
+        Sans effet si le registre est déjà fermé.
+        """
+        if self._ferme:
+            return
+        self._ferme = True
+        self._file.put(None)
+        self._thread.join()
+        if self.non_ecrits:
+            print(f"{self.non_ecrits} parcours n'ont pas pu être enregistrés.")
+
+
+def _inserer(classement: list, entree: tuple):
+    """Insère une entrée dans un classement trié borné à TAILLE_CLASSEMENT."""
+    if len(classement) < TAILLE_CLASSEMENT or entree < classement[-1]:
+        bisect.insort(classement, entree)
+        del classement[TAILLE_CLASSEMENT:]
@@ -0,0 +1,59 @@
+"""
+Rendu par rectangles modifiés (option --rendu-partiel).
+
+Le décor fixe du niveau est dessiné une fois dans une couche en cache. À
+chaque frame, seuls les rectangles occupés par le joueur, les monstres
+mobiles et le HUD (à la frame précédente et à la frame courante) sont
+restaurés depuis cette couche puis envoyés à l'écran avec
+`pygame.display.update(rects)` au lieu d'un `flip()` de toute la fenêtre.
+"""
+import pygame
+
+from jeu_arcade.affichage import redessiner_decor, rendre_couche_decor
+
+
+class RenduPartiel:
+    """Couche de décor en cache et rectangles modifiés de la frame passée."""
+
+    def __init__(self, ecran: pygame.Surface):
+        self.ecran = ecran
+        self.couche_decor: pygame.Surface | None = None
+        self._rects_precedents: list[pygame.Rect] | None = None
+
+    def invalider(self):
+        """Force la reconstruction du décor et un rafraîchissement complet."""
+        self.couche_decor = None
+
+    def redessiner(self, decor: dict, zones: list[pygame.Rect]):
+        """
+        Redessine les `zones` de la couche en cache (lignes rechargées) ;
+        elles sont restaurées et envoyées à l'écran à la frame suivante.
+        """
+        if self.couche_decor is None or not zones:
+            return
+        redessiner_decor(self.couche_decor, decor, zones)
+        if self._rects_precedents is not None:
+            self._rects_precedents = self._rects_precedents + zones
+
+    def commencer(self, decor: dict):
+        """
+        Efface les entités de la frame précédente en restaurant le décor
+        (préparé par `preparer_decor`).
+        """
+        if self.couche_decor is None:
+            self.couche_decor = rendre_couche_decor(
+                decor, self.ecran.get_size()
+            )
+            self.ecran.blit(self.couche_decor, (0, 0))
+            self._rects_precedents = None
+            return
+        for rect in self._rects_precedents:
+            self.ecran.blit(self.couche_decor, rect, rect)
+
+    def terminer(self, rects: list[pygame.Rect]):
+        """Envoie à l'écran les zones effacées et les zones redessinées."""
+        if self._rects_precedents is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._rects_precedents + rects)
+        self._rects_precedents = rects
@@ -0,0 +1,128 @@
+"""
+Protocole du jeu en réseau local (UDP).
+
+Chaque datagramme commence par un octet de type. Les touches sont envoyées
+sous forme de masque de bits (mêmes actions que l'environnement vectorisé)
+et le serveur répond à chaque tick par une image complète du monde : tous
+les joueurs et tous les monstres mobiles.
+"""
+import struct
+
+import pygame
+
+from jeu_arcade.config import ACTION_DROITE, ACTION_GAUCHE, ACTION_SAUT
+
+PORT_PAR_DEFAUT = 50007
+JOUEURS_MAX = 8
+TAILLE_DATAGRAMME = 65507 # Maximum d'un datagramme UDP
+
+# Types de messages
+REJOINDRE = b"J"   # client -> serveur
+BIENVENUE = b"B"   # serveur -> client : identifiant et texte du niveau
+COMPLET = b"C"     # serveur -> client : plus de place
+TOUCHES = b"T"     # client -> serveur : numéro de séquence et touches
+QUITTER = b"Q"     # client -> serveur
+IMAGE = b"I"       # serveur -> client : état du monde à un tick
+
+FORMAT_BIENVENUE = struct.Struct("<B")
+FORMAT_TOUCHES = struct.Struct("<IB")
+FORMAT_ENTETE_IMAGE = struct.Struct("<IBH")
+FORMAT_JOUEUR = struct.Struct("<BiiBH")
+FORMAT_MONSTRE = struct.Struct("<iiB")
+
+# Drapeaux des joueurs et des monstres
+GAUCHE = 1
+MORT = 2
+
+
+def touches_vers_actions(touches) -> int:
+    """Masque d'actions à partir de `pygame.key.get_pressed()`."""
+    actions = 0
+    if touches[pygame.K_LEFT]:
+        actions |= ACTION_GAUCHE
+    if touches[pygame.K_RIGHT]:
+        actions |= ACTION_DROITE
+    if touches[pygame.K_SPACE]:
+        actions |= ACTION_SAUT
+    return actions
+
+
+def actions_vers_touches(actions: int) -> dict:
+    """Touches lisibles par `appliquer_physique` à partir d'un masque."""
+    return {
+        pygame.K_LEFT: bool(actions & ACTION_GAUCHE),
+        pygame.K_RIGHT: bool(actions & ACTION_DROITE),
+        pygame.K_SPACE: bool(actions & ACTION_SAUT),
+    }
+
+
+def encoder_bienvenue(identifiant: int, donnees_texte: str) -> bytes:
+    return (
+        BIENVENUE + FORMAT_BIENVENUE.pack(identifiant)
+        + donnees_texte.encode("utf-8")
+    )
+
+
+def decoder_bienvenue(message: bytes) -> tuple[int, str]:
+    (identifiant,) = FORMAT_BIENVENUE.unpack_from(message, 1)
+    return identifiant, message[1 + FORMAT_BIENVENUE.size:].decode("utf-8")
+
+
+def encoder_touches(sequence: int, actions: int) -> bytes:
+    return TOUCHES + FORMAT_TOUCHES.pack(sequence, actions)
+
+
+def decoder_touches(message: bytes) -> tuple[int, int]:
+    return FORMAT_TOUCHES.unpack_from(message, 1)
+
+
+def encoder_image(tick: int, joueurs: dict[int, dict], monstres: list) -> bytes:
+    """
+    Image du monde : `joueurs` associe un identifiant à un client du serveur
+    ('joueur' au format de `physique.joueur` et compteur 'sorties'),
+    `monstres` est la liste 'tuiles_monstres_mobiles' du niveau.
+    """
+    morceaux = [IMAGE, FORMAT_ENTETE_IMAGE.pack(tick, len(joueurs), len(monstres))]
+    for identifiant, client in joueurs.items():
+        etat = client['joueur']
+        drapeaux = GAUCHE if etat['direction'] == "gauche" else 0
+        if etat['mort']:
+            drapeaux |= MORT
+        morceaux.append(FORMAT_JOUEUR.pack(
+            identifiant, etat['rect'].x, etat['rect'].y, drapeaux,
+            client['sorties'],
+        ))
+    for monstre in monstres:
+        morceaux.append(FORMAT_MONSTRE.pack(
+            monstre['rect'].x, monstre['rect'].y,
+            0 if monstre['vitesse_x'] > 0 else GAUCHE,
+        ))
+    return b"".join(morceaux)
+
+
+def decoder_image(message: bytes) -> dict:
+    """
+    Retourne {"tick", "joueurs": {id: {"x", "y", "direction", "mort",
+    "sorties"}}, "monstres": [(x, y, direction)]}.
+    """
+    tick, nb_joueurs, nb_monstres = FORMAT_ENTETE_IMAGE.unpack_from(message, 1)
+    position = 1 + FORMAT_ENTETE_IMAGE.size
+    joueurs = {}
+    for identifiant, x, y, drapeaux, sorties in FORMAT_JOUEUR.iter_unpack(
+        message[position:position + nb_joueurs * FORMAT_JOUEUR.size]
+    ):
+        joueurs[identifiant] = {
+            "x": x,
+            "y": y,
+            "direction": "gauche" if drapeaux & GAUCHE else "droite",
+            "mort": bool(drapeaux & MORT),
+            "sorties": sorties,
+        }
+    position += nb_joueurs * FORMAT_JOUEUR.size
+    monstres = [
+        (x, y, "gauche" if drapeaux & GAUCHE else "droite")
+        for x, y, drapeaux in FORMAT_MONSTRE.iter_unpack(
+            message[position:position + nb_monstres * FORMAT_MONSTRE.size]
+        )
+    ]
+    return {"tick": tick, "joueurs": joueurs, "monstres": monstres}
@@ -0,0 +1,56 @@
+"""
+Réserve de monstres mobiles : liste des monstres actifs et liste libre.
+
+`niveau_data['tuiles_monstres_mobiles']` reste une liste de dictionnaires
+(mêmes clés qu'avant) lue telle quelle par la physique et le dessin. Un
+monstre retiré est échangé avec le dernier de la liste (O(1), l'ordre des
+monstres change) et son dictionnaire, avec son Rect, part dans la liste
+libre pour être réutilisé par le prochain `ajouter`. Recharger un niveau
+avec la même réserve ne crée donc aucun nouvel objet.
+"""
+import pygame
+
+from jeu_arcade.config import TAILLE_TUILE, VITESSE_MONSTRE
+
+
+class ReserveMonstres(list):
+    """Monstres mobiles actifs, avec les monstres libérés à réutiliser."""
+
+    def __init__(self):
+        super().__init__()
+        self.libres: list[dict] = []
+
+    def ajouter(
+        self,
+        x: int,
+        y: int,
+        vitesse_x: int = VITESSE_MONSTRE,
+        vitesse_y: int = 0,
+        depart: tuple[int, int] | None = None,
+    ) -> dict:
+        """Active un monstre en (x, y), recyclé si possible."""
+        if self.libres:
+            monstre = self.libres.pop()
+            monstre['rect'].topleft = (x, y)
+        else:
+            monstre = {"rect": pygame.Rect(x, y, TAILLE_TUILE, TAILLE_TUILE)}
+        monstre['vitesse_x'] = vitesse_x
+        monstre['vitesse_y'] = vitesse_y
+        monstre['depart'] = depart if depart is not None else (x, y)
+        monstre['patrouille'] = None
+        monstre['indice'] = len(self)
+        self.append(monstre)
+        return monstre
+
+    def retirer(self, monstre: dict):
+        """Retire un monstre actif en le remplaçant par le dernier."""
+        dernier = self.pop()
+        if dernier is not monstre:
+            self[monstre['indice']] = dernier
+            dernier['indice'] = monstre['indice']
+        self.libres.append(monstre)
+
+    def vider(self):
+        """Libère tous les monstres actifs."""
+        self.libres += self
+        self.clear()
@@ -0,0 +1,156 @@
+"""
+Sauvegarde et restauration rapides de l'état du jeu, et retour en arrière
+(option --retour-arriere, touche RETOUR ARRIÈRE maintenue).
+
+L'état complet d'un tick (champs du joueur, position et vitesse de chaque
+monstre mobile, chronomètre, numéro d'essai, horloge des animations) est
+écrit en entiers 32 bits dans un tampon alloué une fois (`ecrire_etat`),
+et relu par `lire_etat` : le Rect du joueur est modifié sur place et les
+monstres reviennent de la liste libre de la réserve, sans allocation de
+tampon ni de Rect. `TamponEtats` garde ainsi les dernières secondes de jeu
+dans un anneau ; les mêmes fonctions peuvent servir à revenir à un tick
+passé pour une prédiction avec correction (rollback).
+"""
+import struct
+
+import pygame
+
+from jeu_arcade.config import FPS
+from jeu_arcade.physique import joueur
+
+TOUCHE_RETOUR = pygame.K_BACKSPACE
+DUREE_RETOUR = 5 # secondes de jeu gardées pour le retour en arrière
+
+# tick, chronomètre (ms), essai, x, y, vitesse_x, vitesse_y, drapeaux, monstres
+EN_TETE = struct.Struct("<9i")
+# x, y, vitesse_x, vitesse_y, départ x, départ y
+MONSTRE = struct.Struct("<6i")
+
+# Drapeaux du joueur
+AU_SOL = 1
+GAUCHE = 2
+MORT = 4
+
+
+def taille_etat(monstres_max: int) -> int:
+    """Octets d'un état avec au plus `monstres_max` monstres mobiles."""
+    return EN_TETE.size + monstres_max * MONSTRE.size
+
+
+def ecrire_etat(
+    tampon,
+    decalage: int,
+    niveau_data: dict,
+    temps_ms: int,
+    essais: int,
+    tick: int,
+):
+    """Écrit l'état courant dans `tampon` (bytearray, memoryview...)."""
+    rect = joueur['rect']
+    mobiles = niveau_data['tuiles_monstres_mobiles']
+    EN_TETE.pack_into(
+        tampon, decalage, tick, temps_ms, essais,
+        rect.x, rect.y, joueur['vitesse_x'], joueur['vitesse_y'],
+        (AU_SOL if joueur['au_sol'] else 0)
+        | (GAUCHE if joueur['direction'] == "gauche" else 0)
+        | (MORT if joueur['mort'] else 0),
+        len(mobiles),
+    )
+    position = decalage + EN_TETE.size
+    for m in mobiles:
+        rect = m['rect']
+        depart = m['depart']
+        MONSTRE.pack_into(
+            tampon, position, rect.x, rect.y, m['vitesse_x'], m['vitesse_y'],
+            depart[0], depart[1],
+        )
+        position += MONSTRE.size
+
+
+def lire_etat(tampon, decalage: int, niveau_data: dict) -> tuple[int, int, int]:
+    """
+    Replace le joueur et les monstres mobiles dans l'état écrit à
+    `decalage`. Retourne (chronomètre en ms, essai, tick).
+    """
+    (
+        tick, temps_ms, essais, x, y, vitesse_x, vitesse_y, drapeaux, nombre
+    ) = EN_TETE.unpack_from(tampon, decalage)
+    joueur['rect'].topleft = (x, y)
+    joueur['vitesse_x'] = vitesse_x
+    joueur['vitesse_y'] = vitesse_y
+    joueur['au_sol'] = bool(drapeaux & AU_SOL)
+    joueur['direction'] = "gauche" if drapeaux & GAUCHE else "droite"
+    joueur['mort'] = bool(drapeaux & MORT)
+    debut = decalage + EN_TETE.size
+    valeurs = MONSTRE.iter_unpack(
+        memoryview(tampon)[debut:debut + nombre * MONSTRE.size]
+    )
+    reserve = niveau_data['tuiles_monstres_mobiles']
+    if len(reserve) != nombre:
+        # Des monstres sont tombés depuis : la réserve est reconstruite
+        reserve.vider()
+        for x, y, vitesse_x, vitesse_y, depart_x, depart_y in valeurs:
+            reserve.ajouter(x, y, vitesse_x, vitesse_y, (depart_x, depart_y))
+        return temps_ms, essais, tick
+    # Cas courant : mêmes monstres, modifiés sur place. Leur ordre a pu
+    # changer (retrait par échange), d'où la patrouille oubliée.
+    for m, (x, y, vitesse_x, vitesse_y, depart_x, depart_y) in zip(
+        reserve, valeurs
+    ):
+        m['rect'].topleft = (x, y)
+        m['vitesse_x'] = vitesse_x
+        m['vitesse_y'] = vitesse_y
+        m['depart'] = (depart_x, depart_y)
+        m['patrouille'] = None
+    return temps_ms, essais, tick
+
+
+class TamponEtats:
+    """Anneau des derniers états du jeu, dans un seul tampon préalloué."""
+
+    def __init__(self, monstres_max: int, capacite: int = DUREE_RETOUR * FPS):
+        self.monstres_max = monstres_max
+        self.capacite = capacite
+        self.taille = taille_etat(monstres_max)
+        self.tampon = bytearray(self.taille * capacite)
+        self._suivant = 0 # case du prochain état écrit
+        self._nombre = 0
+        self._tete_affichee = False # l'état le plus récent est l'état actuel
+
+    def __len__(self) -> int:
+        return self._nombre
+
+    def vider(self):
+        self._nombre = 0
+        self._tete_affichee = False
+
+    def capturer(self, niveau_data: dict, temps_ms: int, essais: int, tick: int):
+        """Ajoute l'état courant, à la place du plus ancien si l'anneau est plein."""
+        if len(niveau_data['tuiles_monstres_mobiles']) > self.monstres_max:
+            raise ValueError("Plus de monstres mobiles que prévu par le tampon")
+        ecrire_etat(
+            self.tampon, self._suivant * self.taille, niveau_data,
+            temps_ms, essais, tick,
+        )
+        self._suivant = (self._suivant + 1) % self.capacite
+        self._nombre = min(self._nombre + 1, self.capacite)
+        self._tete_affichee = True
+
+    def _retirer_tete(self):
+        self._suivant = (self._suivant - 1) % self.capacite
+        self._nombre -= 1
+
+    def reculer(self, niveau_data: dict) -> tuple[int, int, int] | None:
+        """
+        Recule d'un tick : retire l'état le plus récent et le restaure. Si
+        cet état est celui capturé au tick en cours, il est d'abord oublié,
+        pour que le premier pas en arrière ne soit pas un pas sur place.
+        None quand il n'y a plus d'état à restaurer.
+        """
+        if self._tete_affichee and self._nombre:
+            self._retirer_tete()
+        self._tete_affichee = False
+        if not self._nombre:
+            return None
+        self._retirer_tete()
+        return lire_etat(self.tampon, self._suivant * self.taille, niveau_data)
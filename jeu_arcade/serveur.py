@@ -0,0 +1,284 @@
+"""
+Serveur du jeu en réseau local : de 2 à 8 joueurs dans le même niveau.
+
+    python -m jeu_arcade.serveur --niveau 1
+
+Le serveur est seul à simuler le monde. À chaque tick, il lit les touches
+reçues des clients, fait avancer les monstres mobiles une fois
+(`gerer_physique_monstres`) puis chaque joueur (`appliquer_physique`), et
+envoie à chaque client une image du monde. La physique du jeu travaille
+sur le dictionnaire global `physique.joueur` : l'état de chaque joueur y
+est recopié le temps de son tick.
+
+Le serveur mesure sa fréquence de tick réelle, le temps CPU de simulation
+par joueur et le débit envoyé à chaque client.
+"""
+import argparse
+import socket
+import threading
+import time
+
+from jeu_arcade.config import ECRAN_HAUTEUR, FPS
+from jeu_arcade.modes import MODE_PAR_DEFAUT, MODES, Mode
+from jeu_arcade.niveau import charger_niveau, construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+from jeu_arcade.reseau import (
+    COMPLET,
+    JOUEURS_MAX,
+    PORT_PAR_DEFAUT,
+    QUITTER,
+    REJOINDRE,
+    TAILLE_DATAGRAMME,
+    TOUCHES,
+    actions_vers_touches,
+    decoder_touches,
+    encoder_bienvenue,
+    encoder_image,
+)
+
+DELAI_DECONNEXION = 5.0 # secondes sans message avant de retirer un joueur
+INTERVALLE_RAPPORT = 5.0 # secondes entre deux rapports de mesures
+
+
+class Serveur:
+    """Simulation d'un niveau partagé et diffusion de son état en UDP."""
+
+    def __init__(
+        self,
+        mode: Mode,
+        numero_niveau: int = 1,
+        adresse: tuple[str, int] = ("127.0.0.1", PORT_PAR_DEFAUT),
+        joueurs_max: int = JOUEURS_MAX,
+        frequence: int = FPS,
+    ):
+        self.mode = mode
+        self.donnees_texte = charger_niveau(numero_niveau, mode.dossier_niveaux)
+        self.niveau = construire_niveau(self.donnees_texte, mode.elements)
+        self.joueurs_max = min(joueurs_max, JOUEURS_MAX)
+        self.frequence = frequence
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(adresse)
+        self.socket.setblocking(False)
+        self.adresse = self.socket.getsockname()
+        self.tick = 0
+        # identifiant -> {"adresse", "joueur", "sorties", "actions", ...}
+        self.clients: dict[int, dict] = {}
+        self._arret = threading.Event()
+        if mode.monstres:
+            from jeu_arcade.monstres import (
+                gerer_physique_monstres,
+                verifier_collisions_danger,
+            )
+            self._physique_monstres = gerer_physique_monstres
+            self._collisions_danger = verifier_collisions_danger
+        self.reinitialiser_mesures()
+
+    def reinitialiser_mesures(self):
+        """Remet à zéro les compteurs utilisés par `mesures()`."""
+        self._debut_mesures = time.perf_counter()
+        self._ticks_mesures = 0
+        self._ticks_joueurs = 0
+        self._cpu_joueurs = 0.0
+        self._cpu_monstres = 0.0
+        for client in self.clients.values():
+            client['octets_envoyes'] = 0
+            client['octets_recus'] = 0
+
+    def mesures(self) -> dict:
+        """
+        Fréquence de tick réelle, temps CPU de simulation (µs) par joueur et
+        par tick, et débits (octets/s) de chaque client depuis la dernière
+        remise à zéro.
+        """
+        duree = max(time.perf_counter() - self._debut_mesures, 1e-9)
+        return {
+            "ticks_par_seconde": self._ticks_mesures / duree,
+            "cpu_par_joueur_us": (
+                self._cpu_joueurs / max(self._ticks_joueurs, 1) * 1e6
+            ),
+            "cpu_monstres_us": (
+                self._cpu_monstres / max(self._ticks_mesures, 1) * 1e6
+            ),
+            "debit_envoye": {
+                i: c['octets_envoyes'] / duree for i, c in self.clients.items()
+            },
+            "debit_recu": {
+                i: c['octets_recus'] / duree for i, c in self.clients.items()
+            },
+        }
+
+    def _nouveau_joueur(self) -> dict:
+        initialiser_joueur(*self.niveau['pos_joueur'])
+        return dict(joueur)
+
+    def _accueillir(self, adresse: tuple[str, int]):
+        for identifiant, client in self.clients.items():
+            if client['adresse'] == adresse: # Bienvenue perdue : on renvoie
+                self._envoyer(client, encoder_bienvenue(
+                    identifiant, self.donnees_texte
+                ))
+                return
+        libres = [i for i in range(self.joueurs_max) if i not in self.clients]
+        if not libres:
+            self.socket.sendto(COMPLET, adresse)
+            return
+        client = {
+            "adresse": adresse,
+            "joueur": self._nouveau_joueur(),
+            "sorties": 0,
+            "actions": 0,
+            "sequence": -1,
+            "dernier_message": time.monotonic(),
+            "octets_envoyes": 0,
+            "octets_recus": 0,
+        }
+        self.clients[libres[0]] = client
+        self._envoyer(client, encoder_bienvenue(libres[0], self.donnees_texte))
+        print(f"Joueur {libres[0] + 1} connecté depuis {adresse}.")
+
+    def recevoir(self):
+        """Lit tous les messages en attente sans bloquer."""
+        par_adresse = {c['adresse']: i for i, c in self.clients.items()}
+        while True:
+            try:
+                message, adresse = self.socket.recvfrom(TAILLE_DATAGRAMME)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            type_message = message[:1]
+            if type_message == REJOINDRE:
+                self._accueillir(adresse)
+                par_adresse = {c['adresse']: i for i, c in self.clients.items()}
+                continue
+            identifiant = par_adresse.get(adresse)
+            if identifiant is None:
+                continue
+            client = self.clients[identifiant]
+            client['octets_recus'] += len(message)
+            client['dernier_message'] = time.monotonic()
+            if type_message == TOUCHES:
+                sequence, actions = decoder_touches(message)
+                # Les datagrammes peuvent arriver dans le désordre
+                if sequence > client['sequence']:
+                    client['sequence'] = sequence
+                    client['actions'] = actions
+            elif type_message == QUITTER:
+                del self.clients[identifiant]
+                del par_adresse[adresse]
+                print(f"Joueur {identifiant + 1} parti.")
+        limite = time.monotonic() - DELAI_DECONNEXION
+        for identifiant in [
+            i for i, c in self.clients.items() if c['dernier_message'] < limite
+        ]:
+            del self.clients[identifiant]
+            print(f"Joueur {identifiant + 1} déconnecté (délai dépassé).")
+
+    def simuler_tick(self):
+        """Fait avancer les monstres puis chaque joueur d'un tick."""
+        debut = time.thread_time()
+        if self.mode.monstres:
+            # Un monstre reste éveillé près de n'importe quel joueur
+            self._physique_monstres(self.niveau, joueurs=[
+                c['joueur']['rect'] for c in self.clients.values()
+            ])
+        milieu = time.thread_time()
+        for client in self.clients.values():
+            etat = client['joueur']
+            if etat['mort'] or etat['rect'].top > ECRAN_HAUTEUR:
+                etat = client['joueur'] = self._nouveau_joueur()
+            joueur.update(etat)
+            appliquer_physique(self.niveau, actions_vers_touches(client['actions']))
+            if self.mode.monstres:
+                self._collisions_danger(self.niveau)
+            if (
+                not joueur['mort']
+                and joueur['rect'].colliderect(self.niveau['tuile_sortie'])
+            ):
+                client['sorties'] += 1
+                joueur.update(self._nouveau_joueur())
+            etat.update(joueur)
+        fin = time.thread_time()
+        self._cpu_monstres += milieu - debut
+        self._cpu_joueurs += fin - milieu
+        self._ticks_joueurs += len(self.clients)
+        self._ticks_mesures += 1
+        self.tick += 1
+
+    def _envoyer(self, client: dict, message: bytes):
+        try:
+            self.socket.sendto(message, client['adresse'])
+        except OSError:
+            return
+        client['octets_envoyes'] += len(message)
+
+    def diffuser(self):
+        """Envoie l'image du tick courant à chaque client."""
+        image = encoder_image(
+            self.tick, self.clients, self.niveau['tuiles_monstres_mobiles']
+        )
+        for client in self.clients.values():
+            self._envoyer(client, image)
+
+    def executer(self, rapport: bool = False):
+        """Boucle de ticks à fréquence fixe, jusqu'à `arreter()`."""
+        periode = 1 / self.frequence
+        prochain_tick = time.perf_counter()
+        prochain_rapport = prochain_tick + INTERVALLE_RAPPORT
+        while not self._arret.is_set():
+            self.recevoir()
+            self.simuler_tick()
+            self.diffuser()
+            maintenant = time.perf_counter()
+            if rapport and maintenant >= prochain_rapport:
+                afficher_mesures(self.mesures())
+                self.reinitialiser_mesures()
+                prochain_rapport = maintenant + INTERVALLE_RAPPORT
+            prochain_tick += periode
+            if prochain_tick > maintenant:
+                self._arret.wait(prochain_tick - maintenant)
+            else:
+                prochain_tick = maintenant # En retard : on ne rattrape pas
+        self.socket.close()
+
+    def arreter(self):
+        self._arret.set()
+
+
+def afficher_mesures(mesures: dict):
+    debits = ", ".join(
+        f"J{i + 1} {octets / 1024:.1f} Ko/s"
+        for i, octets in mesures['debit_envoye'].items()
+    )
+    print(
+        f"{mesures['ticks_par_seconde']:.1f} ticks/s | "
+        f"CPU {mesures['cpu_par_joueur_us']:.1f} µs/joueur/tick "
+        f"+ {mesures['cpu_monstres_us']:.1f} µs monstres | "
+        f"envoyé : {debits or 'aucun joueur'}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="jeu_arcade.serveur", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--mode", choices=MODES, default=MODE_PAR_DEFAUT)
+    parser.add_argument("--niveau", type=int, default=1)
+    parser.add_argument("--hote", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT_PAR_DEFAUT)
+    parser.add_argument(
+        "--joueurs", type=int, default=JOUEURS_MAX,
+        choices=range(2, JOUEURS_MAX + 1), metavar="2-8",
+        help="nombre maximal de joueurs (défaut : %(default)s)",
+    )
+    args = parser.parse_args()
+    serveur = Serveur(
+        MODES[args.mode], args.niveau, (args.hote, args.port), args.joueurs
+    )
+    print(f"Serveur en écoute sur {serveur.adresse[0]}:{serveur.adresse[1]}.")
+    try:
+        serveur.executer(rapport=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Tables indexées par identifiant de tuile, dérivées de `REGISTRE_TUILES`.
+
+Les collisions et le dessin ne testent pas le type de chaque case : un
+masque de famille (`SOLIDES[grille]`, `DANGERS[grille]`) se lit d'un coup
+pour toute une grille, et une tuile ajoutée au registre entre dans les
+familles sans nouvelle branche.
+"""
+import numpy as np
+
+from jeu_arcade.config import REGISTRE_TUILES, TypeTuile
+
+
+def _table(propriete) -> np.ndarray:
+    table = np.zeros(256, dtype=bool)
+    for tuile in REGISTRE_TUILES:
+        table[tuile.ident] = propriete(tuile)
+    return table
+
+
+SOLIDES = _table(lambda tuile: tuile.solide)
+DANGERS = _table(lambda tuile: tuile.danger)
+DECOR = _table(lambda tuile: tuile.decor)
+TUILES_DECOR: tuple[TypeTuile, ...] = tuple(
+    tuile for tuile in REGISTRE_TUILES if tuile.decor
+)
+PAR_ID: dict[int, TypeTuile] = {tuile.ident: tuile for tuile in REGISTRE_TUILES}
+
+
+def cases_de(grille: np.ndarray, tuile: int | np.ndarray) -> np.ndarray:
+    """
+    Masque des cases d'un identifiant de tuile, ou d'une famille donnée par
+    une table de booléens indexée par identifiant.
+    """
+    if isinstance(tuile, np.ndarray):
+        return tuile[grille]
+    return grille == tuile
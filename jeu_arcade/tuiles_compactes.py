@@ -0,0 +1,74 @@
+"""
+Stockage compact des tuiles fixes d'un niveau (option --niveau-compact).
+
+Au lieu d'un `pygame.Rect` par tuile dans une liste, un type de tuile
+(murs, monstres fixes) est rangé dans une grille de bits (`np.packbits`,
+un bit par case) et deux tableaux de coordonnées en tuiles. Les
+rectangles ne sont créés qu'à la demande, pour les seules cases proches
+d'une zone (`dans`), ce qui suffit aux collisions et au dessin de l'écran.
+"""
+import numpy as np
+import pygame
+
+from jeu_arcade.config import TAILLE_TUILE
+from jeu_arcade.tables_tuiles import cases_de
+
+
+class TuilesCompactes:
+    """Cases d'un même type de tuile, en bits et en coordonnées."""
+
+    def __init__(self, grille: np.ndarray, tuile: int | np.ndarray):
+        presentes = cases_de(grille, tuile)
+        self.hauteur, self.largeur = presentes.shape
+        self.bits = np.packbits(presentes, axis=1)
+        lignes, colonnes = np.nonzero(presentes)
+        type_coordonnee = np.min_scalar_type(max(self.hauteur, self.largeur))
+        self.lignes = lignes.astype(type_coordonnee)
+        self.colonnes = colonnes.astype(type_coordonnee)
+
+    def __len__(self) -> int:
+        return len(self.colonnes)
+
+    def __getitem__(self, i: int) -> pygame.Rect:
+        return pygame.Rect(
+            int(self.colonnes[i]) * TAILLE_TUILE,
+            int(self.lignes[i]) * TAILLE_TUILE,
+            TAILLE_TUILE, TAILLE_TUILE,
+        )
+
+    def __iter__(self):
+        for colonne, ligne in zip(self.colonnes.tolist(), self.lignes.tolist()):
+            yield pygame.Rect(
+                colonne * TAILLE_TUILE, ligne * TAILLE_TUILE,
+                TAILLE_TUILE, TAILLE_TUILE,
+            )
+
+    def contient(self, colonne: int, ligne: int) -> bool:
+        """Vrai si la case (colonne, ligne) est de ce type."""
+        if not (0 <= colonne < self.largeur and 0 <= ligne < self.hauteur):
+            return False
+        return bool(self.bits[ligne, colonne >> 3] & (0x80 >> (colonne & 7)))
+
+    def dans(self, zone: pygame.Rect) -> list[pygame.Rect]:
+        """Rectangles des cases qui touchent `zone`, ligne par ligne."""
+        c0 = max(zone.left // TAILLE_TUILE, 0)
+        c1 = min((zone.right - 1) // TAILLE_TUILE, self.largeur - 1)
+        l0 = max(zone.top // TAILLE_TUILE, 0)
+        l1 = min((zone.bottom - 1) // TAILLE_TUILE, self.hauteur - 1)
+        if c0 > c1 or l0 > l1:
+            return []
+        octet0 = c0 >> 3
+        fenetre = np.unpackbits(self.bits[l0:l1 + 1, octet0:(c1 >> 3) + 1], axis=1)
+        fenetre = fenetre[:, c0 - octet0 * 8:c1 - octet0 * 8 + 1]
+        lignes, colonnes = np.nonzero(fenetre)
+        return [
+            pygame.Rect(
+                (c0 + c) * TAILLE_TUILE, (l0 + l) * TAILLE_TUILE,
+                TAILLE_TUILE, TAILLE_TUILE,
+            )
+            for l, c in zip(lignes.tolist(), colonnes.tolist())
+        ]
+
+    def octets(self) -> int:
+        """Taille des tableaux NumPy (grille de bits et coordonnées)."""
+        return self.bits.nbytes + self.lignes.nbytes + self.colonnes.nbytes
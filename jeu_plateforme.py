@@ -0,0 +1,5 @@
+"""Lance le jeu : `python jeu_plateforme.py --mode stats`."""
+from jeu_arcade.__main__ import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Réglages communs des tests : Pygame sans fenêtre, paquet importable."""
+import os
+import random
+import sys
+from pathlib import Path
+
+import pygame
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from jeu_arcade.config import ECRAN_HAUTEUR, ECRAN_LARGEUR, TAILLE_TUILE
+
+TOUCHES = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+
+
+def touches_aleatoires(rng: random.Random) -> dict:
+    return {touche: rng.random() < 0.5 for touche in TOUCHES}
+
+
+def niveau_charge() -> str:
+    """Un écran de monstres mobiles sur des sols continus, le joueur en haut."""
+    largeur = ECRAN_LARGEUR // TAILLE_TUILE
+    lignes = ["P" + "." * (largeur - 2) + "E", "#" * largeur]
+    while len(lignes) < ECRAN_HAUTEUR // TAILLE_TUILE - 1:
+        lignes += [".X." * (largeur // 3) + "." * (largeur % 3), "#" * largeur]
+    return "\n".join(lignes)
+
+
+def niveau_aleatoire(graine: int, largeur: int = 20, hauteur: int = 15) -> str:
+    """Murs, monstres fixes et mobiles au hasard, un départ et une sortie."""
+    rng = random.Random(graine)
+    lignes = [
+        "".join(rng.choice("#....X.M") for _ in range(largeur))
+        for _ in range(hauteur)
+    ]
+    lignes[0] = "P" + lignes[0][1:]
+    lignes[-1] = lignes[-1][:-1] + "E"
+    return "\n".join(lignes)
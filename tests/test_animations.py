@@ -0,0 +1,53 @@
+"""Animations : découpage des planches et repli sur l'image fixe."""
+import pygame
+import pytest
+
+from jeu_arcade import animations as module_animations
+from jeu_arcade import images as module_images
+from jeu_arcade.animations import Animations, decouper_planche
+from jeu_arcade.config import TAILLE_TUILE, ElementDecor
+from jeu_arcade.etats import ETATS, REPOS
+
+
+def planche(cote: int, longueurs: list[int]) -> pygame.Surface:
+    """Une ligne par état, `longueurs[i]` cases pleines puis du transparent."""
+    surface = pygame.Surface(
+        (cote * max(longueurs), cote * len(ETATS)), pygame.SRCALPHA
+    )
+    for ligne, longueur in enumerate(longueurs):
+        for colonne in range(longueur):
+            surface.fill(
+                (40 * ligne, 20 * colonne, 200, 255),
+                (colonne * cote, ligne * cote, cote, cote),
+            )
+    return surface
+
+
+def test_decoupage_par_etat():
+    longueurs = [4, 1, 3, 0, 2][:len(ETATS)]
+    etats = decouper_planche(planche(16, longueurs))
+    assert [len(etats[etat]) for etat in ETATS] == longueurs
+    for images in etats.values():
+        for img in images:
+            assert img.get_size() == (TAILLE_TUILE, TAILLE_TUILE)
+
+
+@pytest.mark.parametrize("hauteur", [0, 1, len(ETATS) - 1])
+def test_planche_trop_petite(hauteur):
+    etats = decouper_planche(pygame.Surface((64, hauteur), pygame.SRCALPHA))
+    assert etats == {etat: [] for etat in ETATS}
+
+
+def test_planche_trop_petite_remplacee_par_l_image_fixe(tmp_path, monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.image.save(pygame.Surface((64, 2)), tmp_path / "planche.png")
+    monkeypatch.setattr(module_animations, "DOSSIER_ASSETS", tmp_path)
+    monkeypatch.setattr(module_images, "DOSSIER_ASSETS", tmp_path)
+    monkeypatch.setattr(
+        module_animations, "PLANCHES_SPRITES", {ElementDecor.JOUEUR: "planche.png"}
+    )
+    fixe = pygame.Surface((TAILLE_TUILE, TAILLE_TUILE))
+    animations = Animations({ElementDecor.JOUEUR: fixe})
+    assert animations.image(ElementDecor.JOUEUR, REPOS, "droite", 0) is fixe
+    pygame.display.quit()
@@ -0,0 +1,94 @@
+"""Éditeur : une suite de modifications donne le niveau reconstruit."""
+import random
+
+import pygame
+import pytest
+
+from jeu_arcade.config import (
+    DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ECRAN_HAUTEUR,
+    ECRAN_LARGEUR,
+    TAILLE_TUILE,
+    TUILE_JOUEUR,
+    TUILE_SORTIE,
+    ElementDecor,
+)
+from jeu_arcade.editeur import PALETTE, Editeur
+from jeu_arcade.niveau import charger_niveau, construire_niveau, decouper_lignes
+from jeu_arcade.physique import joueur
+
+
+def editeur_de(numero: int) -> Editeur:
+    lignes = decouper_lignes(
+        charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    )
+    return Editeur(lignes, {})
+
+
+def verifier_comme_reconstruit(editeur: Editeur):
+    reference = construire_niveau(editeur.texte())
+    niveau = editeur.niveau
+    for cle in ('tuiles_sol', 'tuiles_monstres_fixes', 'tuile_sortie', 'pos_joueur'):
+        assert niveau[cle] == reference[cle]
+    assert sorted(m['depart'] for m in niveau['tuiles_monstres_mobiles']) == sorted(
+        m['depart'] for m in reference['tuiles_monstres_mobiles']
+    )
+    assert pygame.image.tobytes(editeur.couche, "RGB") == pygame.image.tobytes(
+        editeur._rendre_couche(), "RGB"
+    )
+
+
+@pytest.mark.parametrize("numero", [1, 2, 3])
+def test_texte_inchange(numero):
+    donnees_texte = charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    assert editeur_de(numero).texte() == "\n".join(
+        decouper_lignes(donnees_texte)
+    ) + "\n"
+
+
+@pytest.mark.parametrize("numero", [1, 2, 3])
+def test_modifications_comme_reconstruction(numero):
+    editeur = editeur_de(numero)
+    hauteur, largeur = editeur.grille.shape
+    rng = random.Random(numero)
+    valides = 0
+    for _ in range(200):
+        colonne, ligne = rng.randrange(largeur), rng.randrange(hauteur)
+        if editeur.grille[ligne, colonne] in (TUILE_JOUEUR, TUILE_SORTIE):
+            continue
+        element = rng.choice(PALETTE)
+        # Départ et sortie déplacés plutôt que dupliqués, pour rester valide
+        if element is ElementDecor.JOUEUR:
+            x, y = editeur.niveau['pos_joueur']
+            editeur.poser(x // TAILLE_TUILE, y // TAILLE_TUILE, ElementDecor.VIDE)
+        elif element is ElementDecor.SORTIE:
+            x, y = editeur.niveau['tuile_sortie'].topleft
+            editeur.poser(x // TAILLE_TUILE, y // TAILLE_TUILE, ElementDecor.VIDE)
+        editeur.poser(colonne, ligne, element)
+        if editeur.erreur is None:
+            valides += 1
+            verifier_comme_reconstruit(editeur)
+    assert valides > 50
+
+
+def test_erreur_tant_que_le_niveau_est_invalide():
+    editeur = editeur_de(1)
+    x, y = editeur.niveau['tuile_sortie'].topleft
+    editeur.poser(x // TAILLE_TUILE, y // TAILLE_TUILE, ElementDecor.VIDE)
+    assert editeur.erreur is not None
+    editeur.poser(0, 0, ElementDecor.SORTIE)
+    assert editeur.erreur is None
+    verifier_comme_reconstruit(editeur)
+
+
+def test_chute_a_la_limite_du_jeu():
+    """Un niveau plus haut que l'écran : la chute est comptée comme en jeu."""
+    largeur = ECRAN_LARGEUR // TAILLE_TUILE
+    lignes = ["P" + "." * (largeur - 2) + "E"]
+    lignes += ["." * largeur] * (ECRAN_HAUTEUR // TAILLE_TUILE + 5)
+    editeur = Editeur(lignes, {})
+    editeur.commencer_essai()
+    joueur['rect'].top = ECRAN_HAUTEUR
+    touches = dict.fromkeys((pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE), False)
+    assert editeur.tick_essai(touches) == "Chute !"
+    editeur.terminer_essai()
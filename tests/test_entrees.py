@@ -0,0 +1,106 @@
+"""Entrées : tampon de saut, fermeture pendant un message, latences."""
+import pygame
+import pytest
+
+from jeu_arcade.config import VITESSE_SAUT
+from jeu_arcade.entrees import TICKS_TAMPON_SAUT, Entrees
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+
+# Le joueur part de haut et tombe sur le sol
+NIVEAU = "\n".join(["P........E"] + ["." * 10] * 4 + ["#" * 10])
+
+
+@pytest.fixture(autouse=True)
+def fenetre():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    pygame.event.clear()
+    yield
+    pygame.display.quit()
+
+
+def appuyer(touche: int):
+    """Appui bref : enfoncée puis relâchée entre deux ticks."""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=touche))
+    pygame.event.post(pygame.event.Event(pygame.KEYUP, key=touche))
+
+
+def tick_atterrissage(niveau_data: dict) -> int:
+    """Premier tick où le joueur, sans rien toucher, est au sol."""
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    entrees = Entrees()
+    for tick in range(200):
+        entrees.lire()
+        appliquer_physique(niveau_data, entrees.touches())
+        if joueur['au_sol']:
+            return tick
+    raise AssertionError("le joueur n'atterrit pas")
+
+
+def sauts_apres_appui(niveau_data: dict, tick_appui: int, ticks: int) -> bool:
+    """Vrai si un appui bref au tick `tick_appui` fait sauter le joueur."""
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    entrees = Entrees()
+    for tick in range(ticks):
+        if tick == tick_appui:
+            appuyer(pygame.K_SPACE)
+        entrees.lire()
+        appliquer_physique(niveau_data, entrees.touches())
+        if joueur['vitesse_y'] <= -VITESSE_SAUT + 1:
+            return True
+    return False
+
+
+def test_appui_juste_avant_l_atterrissage_fait_sauter():
+    niveau_data = construire_niveau(NIVEAU)
+    atterrissage = tick_atterrissage(niveau_data)
+    assert atterrissage > TICKS_TAMPON_SAUT
+    # Le tick de l'appui compte parmi les ticks d'attente du tampon
+    for avance in range(TICKS_TAMPON_SAUT - 1):
+        assert sauts_apres_appui(niveau_data, atterrissage - avance, 100)
+
+
+def test_appui_trop_tot_oublie():
+    niveau_data = construire_niveau(NIVEAU)
+    atterrissage = tick_atterrissage(niveau_data)
+    tick_appui = atterrissage - TICKS_TAMPON_SAUT + 1
+    assert not sauts_apres_appui(niveau_data, tick_appui, 100)
+
+
+def test_appui_bref_compte_pour_le_tick_suivant():
+    entrees = Entrees()
+    appuyer(pygame.K_LEFT)
+    entrees.lire()
+    assert entrees.touches()[pygame.K_LEFT]
+    assert not entrees.touches()[pygame.K_LEFT]
+
+
+def test_fermeture_pendant_un_message():
+    entrees = Entrees()
+    pygame.event.post(pygame.event.Event(pygame.QUIT))
+    assert entrees.reinitialiser()
+    assert not entrees.reinitialiser()
+
+
+def test_statistiques_de_latence():
+    entrees = Entrees()
+    assert entrees.statistiques()["images"] == 0
+    entrees.latences.extend(i / 1000 for i in range(1, 101)) # 1 à 100 ms
+    statistiques = entrees.statistiques()
+    assert statistiques["images"] == 100
+    assert statistiques["moyenne_ms"] == pytest.approx(50.5)
+    assert statistiques["p95_ms"] == pytest.approx(95)
+    assert statistiques["max_ms"] == pytest.approx(100)
+
+
+def test_latence_close_a_l_image_affichee():
+    entrees = Entrees()
+    entrees.image_affichee() # Aucune entrée : rien à mesurer
+    assert not entrees.latences
+    appuyer(pygame.K_RIGHT)
+    entrees.lire()
+    entrees.image_affichee()
+    entrees.image_affichee()
+    assert len(entrees.latences) == 1
+    assert 0 <= entrees.latences[0] < 1
@@ -0,0 +1,61 @@
+"""Images : le pool de threads donne les mêmes surfaces que le chargement un à un."""
+import shutil
+
+import pygame
+import pytest
+
+from jeu_arcade import images as module_images
+from jeu_arcade.config import DOSSIER_ASSETS, ElementDecor
+from jeu_arcade.images import (
+    FICHIERS_IMAGES,
+    charger_element,
+    charger_image,
+    charger_images,
+    initialiser_images,
+)
+
+
+@pytest.fixture(autouse=True)
+def fenetre():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+def pixels(img: pygame.Surface | None):
+    if img is None:
+        return None
+    return img.get_size(), pygame.image.tobytes(img, "RGBA")
+
+
+def test_comme_le_chargement_sequentiel():
+    avancement = []
+    images = initialiser_images(
+        frozenset(ElementDecor),
+        lambda faites, total: avancement.append((faites, total)),
+    )
+    attendues = {element: charger_element(element) for element in FICHIERS_IMAGES}
+    assert list(images) == list(attendues)
+    for element, img in images.items():
+        assert pixels(img) == pixels(attendues[element])
+    total = len(FICHIERS_IMAGES)
+    assert avancement == [(faites, total) for faites in range(1, total + 1)]
+
+
+def test_fichiers_absents_ou_illisibles(tmp_path, monkeypatch):
+    nom, largeur, hauteur, _ = FICHIERS_IMAGES[ElementDecor.MUR]
+    shutil.copy(DOSSIER_ASSETS / nom, tmp_path / nom)
+    (tmp_path / "abime.png").write_bytes(b"pas une image")
+    monkeypatch.setattr(module_images, "DOSSIER_ASSETS", tmp_path)
+    demandes = {
+        "present": (nom, largeur, hauteur, True),
+        "absent": ("absent.png", largeur, hauteur, True),
+        "abime": ("abime.png", largeur, hauteur, False),
+    }
+    images = charger_images(demandes)
+    assert list(images) == list(demandes)
+    for cle, (fichier, l, h, alpha) in demandes.items():
+        assert pixels(images[cle]) == pixels(charger_image(fichier, l, h, alpha))
+    assert images["present"].get_size() == (largeur, hauteur)
+    assert images["absent"] is None and images["abime"] is None
@@ -0,0 +1,94 @@
+"""Instantanés clés et deltas : le décodage redonne exactement l'état."""
+import copy
+import random
+
+import pytest
+
+from conftest import niveau_aleatoire, niveau_charge, touches_aleatoires
+from jeu_arcade.config import DOSSIER_NIVEAUX_MONSTRES_MOBILES, ECRAN_HAUTEUR
+from jeu_arcade.instantanes import (
+    CLE,
+    DELTA,
+    DecodeurFlux,
+    EncodeurFlux,
+    capturer,
+    decoder_instantane,
+    encoder_instantane,
+    restaurer,
+)
+from jeu_arcade.monstres import gerer_physique_monstres, verifier_collisions_danger
+from jeu_arcade.niveau import charger_niveau, construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+
+NIVEAUX = [
+    charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    for numero in (1, 2, 3)
+] + [niveau_aleatoire(graine) for graine in range(3)] + [niveau_charge()]
+
+
+def etats_partie(donnees_texte: str, ticks: int = 500) -> list[dict]:
+    rng = random.Random(0)
+    niveau_data = construire_niveau(donnees_texte)
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    etats = []
+    for tick in range(ticks):
+        gerer_physique_monstres(niveau_data)
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+        verifier_collisions_danger(niveau_data)
+        etats.append(capturer(niveau_data, tick))
+        if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+            initialiser_joueur(*niveau_data['pos_joueur'])
+    return etats
+
+
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_aller_retour_cles_et_deltas(donnees_texte):
+    etats = etats_partie(donnees_texte)
+    for i, etat in enumerate(etats):
+        cle = encoder_instantane(etat)
+        assert cle[0] == CLE
+        assert decoder_instantane(cle) == etat
+        for reference in (etats[max(i - 1, 0)], etats[max(i - 30, 0)]):
+            delta = encoder_instantane(etat, reference)
+            assert decoder_instantane(delta, reference) == etat
+
+
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_aller_retour_flux(donnees_texte):
+    encodeur = EncodeurFlux(intervalle_cle=20)
+    decodeur = DecodeurFlux()
+    for etat in etats_partie(donnees_texte):
+        assert decodeur.decoder(encodeur.encoder(etat)) == etat
+
+
+def test_monstres_retires_ajoutes_et_deplaces():
+    reference = etats_partie(niveau_charge(), ticks=5)[-1]
+    etat = copy.deepcopy(reference)
+    etat['tick'] += 1
+    monstres = etat['monstres']
+    del monstres[3] # tombé
+    monstres[0], monstres[-1] = monstres[-1], monstres[0] # retrait par échange
+    monstres.append({
+        "x": -7, "y": ECRAN_HAUTEUR + 45, "vitesse_x": -3, "vitesse_y": 12,
+        "depart": (0, 0),
+    })
+    etat['joueur'].update(x=-13, y=-50, mort=True, direction="gauche")
+    delta = encoder_instantane(etat, reference)
+    assert delta[0] == DELTA
+    assert decoder_instantane(delta, reference) == etat
+    assert decoder_instantane(encoder_instantane(etat)) == etat
+
+
+def test_restaurer_redonne_l_etat_capture():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    rng = random.Random(0)
+    for _ in range(30):
+        gerer_physique_monstres(niveau_data)
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+    etat = capturer(niveau_data, 30)
+    for _ in range(30):
+        gerer_physique_monstres(niveau_data)
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+    restaurer(decoder_instantane(encoder_instantane(etat)), niveau_data)
+    assert capturer(niveau_data, 30) == etat
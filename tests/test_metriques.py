@@ -0,0 +1,79 @@
+"""Métriques : texte Prometheus servi sur /metrics, port déjà pris."""
+import socket
+import urllib.error
+import urllib.request
+
+import pytest
+
+from jeu_arcade.metriques import BORNES_NIVEAU, Metriques, demarrer_serveur
+
+
+def lire(url: str) -> str:
+    with urllib.request.urlopen(url, timeout=5) as reponse:
+        assert reponse.headers["Content-Type"].startswith("text/plain")
+        return reponse.read().decode("utf-8")
+
+
+def test_lecture_de_metrics():
+    metriques = Metriques()
+    sautees = [0]
+    metriques.compteurs["images_sautees"] = ("Frames sautées.", lambda: sautees[0])
+    metriques.jauges["monstres_eveilles"] = ("Monstres éveillés.", lambda: 4)
+    serveur = demarrer_serveur(metriques, port=0)
+    assert serveur is not None
+    url = f"http://127.0.0.1:{serveur.server_address[1]}/metrics"
+    try:
+        for _ in range(3):
+            metriques.tick()
+        metriques.niveau_charge(2)
+        metriques.mort("chute")
+        metriques.niveau_termine(12.5)
+        metriques.niveau_termine(700)
+        sautees[0] = 9
+        lignes = lire(url).splitlines()
+        with pytest.raises(urllib.error.HTTPError):
+            lire(url.replace("/metrics", "/autre"))
+    finally:
+        serveur.shutdown()
+        serveur.server_close()
+
+    p = "jeu_arcade"
+    for attendue in (
+        f"# TYPE {p}_ticks_total counter",
+        f"{p}_ticks_total 3",
+        f"{p}_niveaux_charges_total 1",
+        f'{p}_morts_total{{cause="chute"}} 1',
+        f'{p}_morts_total{{cause="touche"}} 0',
+        f"{p}_niveau_actuel 2",
+        f"# TYPE {p}_images_sautees_total counter",
+        f"{p}_images_sautees_total 9",
+        f"# TYPE {p}_monstres_eveilles gauge",
+        f"{p}_monstres_eveilles 4",
+        f"# TYPE {p}_niveau_termine_secondes histogram",
+        f'{p}_niveau_termine_secondes_bucket{{le="10"}} 0',
+        f'{p}_niveau_termine_secondes_bucket{{le="20"}} 1',
+        f'{p}_niveau_termine_secondes_bucket{{le="{BORNES_NIVEAU[-1]}"}} 1',
+        f'{p}_niveau_termine_secondes_bucket{{le="+Inf"}} 2',
+        f"{p}_niveau_termine_secondes_sum 712.5",
+        f"{p}_niveau_termine_secondes_count 2",
+        f"{p}_frame_duree_secondes_count 0",
+    ):
+        assert attendue in lignes
+    # Compteurs cumulés : jamais décroissants d'une borne à l'autre
+    cumuls = [
+        int(ligne.rsplit(" ", 1)[1]) for ligne in lignes
+        if ligne.startswith(f"{p}_niveau_termine_secondes_bucket")
+    ]
+    assert cumuls == sorted(cumuls)
+
+
+def test_port_deja_pris(capsys):
+    occupe = socket.socket()
+    occupe.bind(("127.0.0.1", 0))
+    occupe.listen()
+    port = occupe.getsockname()[1]
+    try:
+        assert demarrer_serveur(Metriques(), port=port) is None
+    finally:
+        occupe.close()
+    assert "Métriques désactivées" in capsys.readouterr().out
@@ -0,0 +1,68 @@
+"""Monstres endormis : mêmes trajectoires que la simulation exacte."""
+import random
+
+import pygame
+import pytest
+
+from conftest import niveau_aleatoire, niveau_charge, touches_aleatoires
+from jeu_arcade.config import (
+    DOSSIER_NIVEAUX_MONSTRES_MOBILES,
+    ECRAN_HAUTEUR,
+    TAILLE_TUILE,
+)
+from jeu_arcade.instantanes import capturer
+from jeu_arcade.monstres import (
+    compteurs,
+    gerer_physique_monstres,
+    verifier_collisions_danger,
+)
+from jeu_arcade.niveau import charger_niveau, construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+
+NIVEAUX = [
+    charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    for numero in (1, 2, 3)
+] + [niveau_aleatoire(graine) for graine in range(5)] + [niveau_charge()]
+
+
+def partie(donnees_texte: str, exact: bool, compact: bool, ticks: int = 1000):
+    """États successifs et nombre de monstres endormis sur toute la partie."""
+    rng = random.Random(0)
+    niveau_data = construire_niveau(donnees_texte, compact=compact)
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    etats = []
+    endormis = 0
+    for tick in range(ticks):
+        gerer_physique_monstres(niveau_data, exact=exact)
+        endormis += compteurs['endormis']
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+        verifier_collisions_danger(niveau_data)
+        etats.append((capturer(niveau_data, tick), joueur['mort']))
+        if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+            initialiser_joueur(*niveau_data['pos_joueur'])
+    return etats, endormis
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_memes_trajectoires_que_le_mode_exact(donnees_texte, compact):
+    exactes, _ = partie(donnees_texte, exact=True, compact=compact)
+    endormies, _ = partie(donnees_texte, exact=False, compact=compact)
+    assert endormies == exactes
+
+
+def test_des_monstres_sont_endormis():
+    _, endormis = partie(niveau_charge(), exact=False, compact=False)
+    assert endormis > 0
+
+
+def test_reveil_pres_de_n_importe_quel_joueur():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    gerer_physique_monstres(niveau_data)
+    loin = pygame.Rect(-100 * TAILLE_TUILE, 0, TAILLE_TUILE, TAILLE_TUILE)
+    gerer_physique_monstres(niveau_data, joueurs=[loin])
+    assert compteurs['eveilles'] == 0
+    proche = niveau_data['tuiles_monstres_mobiles'][-1]['rect'].copy()
+    gerer_physique_monstres(niveau_data, joueurs=[loin, proche])
+    assert compteurs['eveilles'] > 0
@@ -0,0 +1,64 @@
+"""Décodage des niveaux : mêmes grilles et mêmes erreurs que case par case."""
+import random
+
+import numpy as np
+import pytest
+
+from jeu_arcade.config import IDS_TUILES, TUILE_VIDE, ElementDecor
+from jeu_arcade.erreurs import CaractereInvalideErreur
+from jeu_arcade.modes import ELEMENTS_DE_BASE, ELEMENTS_MONSTRES_MOBILES
+from jeu_arcade.niveau import TOUS_LES_ELEMENTS, decoder_lignes
+
+CARACTERES = "".join(element.value for element in ElementDecor)
+INTERDITS = "aZ é€ 😀?\t"
+
+
+def decoder_case_par_case(lignes, elements, premiere_ligne):
+    """Référence : un ElementDecor par caractère, comme le premier analyseur."""
+    largeur = max((len(ligne) for ligne in lignes), default=0)
+    grille = np.full((len(lignes), largeur), TUILE_VIDE, dtype=np.uint8)
+    for y, ligne in enumerate(lignes):
+        for x, caractere in enumerate(ligne):
+            try:
+                element = ElementDecor(caractere)
+            except ValueError:
+                raise CaractereInvalideErreur(caractere, y + premiere_ligne, x)
+            if element not in elements:
+                raise CaractereInvalideErreur(caractere, y + premiere_ligne, x)
+            grille[y, x] = IDS_TUILES[element]
+    return grille
+
+
+def resultat(decoder, *arguments):
+    try:
+        return decoder(*arguments).tolist()
+    except CaractereInvalideErreur as e:
+        return str(e)
+
+
+@pytest.mark.parametrize(
+    "elements", [TOUS_LES_ELEMENTS, ELEMENTS_MONSTRES_MOBILES, ELEMENTS_DE_BASE]
+)
+def test_comme_le_decodage_case_par_case(elements):
+    rng = random.Random(0)
+    for _ in range(2000):
+        alphabet = CARACTERES + INTERDITS if rng.random() < 0.2 else CARACTERES
+        lignes = [
+            "".join(rng.choice(alphabet) for _ in range(rng.randrange(25)))
+            for _ in range(rng.randrange(1, 8))
+        ]
+        attendu = resultat(decoder_case_par_case, lignes, elements, 3)
+        assert resultat(decoder_lignes, lignes, elements, 3) == attendu
+
+
+def test_position_du_premier_caractere_interdit():
+    with pytest.raises(CaractereInvalideErreur, match="ligne 2, colonne 3"):
+        decoder_lignes(["P.#E", "#.a😀"])
+    with pytest.raises(CaractereInvalideErreur, match="ligne 1, colonne 2"):
+        decoder_lignes(["P😀a", "E"])
+
+
+def test_grille_modifiable():
+    grille = decoder_lignes(["#P", "E."])
+    grille[0, 0] = TUILE_VIDE
+    assert grille[0, 0] == TUILE_VIDE
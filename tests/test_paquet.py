@@ -0,0 +1,86 @@
+"""Paquet de niveaux : aller-retour, lecture par numéro et par nom, fichiers abîmés."""
+import mmap
+
+import pytest
+
+from jeu_arcade.config import DOSSIER_NIVEAUX_MONSTRES_MOBILES
+from jeu_arcade.erreurs import NiveauIntrouvableErreur, PaquetInvalideErreur
+from jeu_arcade.niveau import charger_niveau
+from jeu_arcade.paquet import (
+    EN_TETE,
+    ENTREE,
+    PaquetNiveaux,
+    ecrire_paquet,
+    niveaux_du_dossier,
+)
+
+RESSOURCES = {"fond.png": bytes(range(256)) * 3, "vide.bin": b""}
+
+
+@pytest.fixture
+def chemin_paquet(tmp_path):
+    chemin = tmp_path / "campagne.paq"
+    ecrire_paquet(
+        chemin, niveaux_du_dossier(DOSSIER_NIVEAUX_MONSTRES_MOBILES), RESSOURCES
+    )
+    return chemin
+
+
+def test_aller_retour(chemin_paquet):
+    niveaux = niveaux_du_dossier(DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    with PaquetNiveaux(chemin_paquet) as paquet:
+        assert len(paquet) == len(niveaux) >= 3
+        assert paquet.noms() == [nom for nom, _ in niveaux]
+        assert paquet.ressources() == list(RESSOURCES)
+        for nom, donnees in RESSOURCES.items():
+            assert paquet.ressource(nom) == donnees
+        assert paquet.ressource("niveau_1") is None # Un niveau, pas une ressource
+        assert paquet.ressource("absente.png") is None
+
+
+def test_lecture_par_numero_et_par_nom(chemin_paquet):
+    with PaquetNiveaux(chemin_paquet) as paquet:
+        for numero in range(1, len(paquet) + 1):
+            texte = charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+            assert paquet.texte(numero) == texte
+            assert paquet.texte_par_nom(f"niveau_{numero}") == texte
+            assert charger_niveau(numero, paquet) == texte
+        for numero in (0, len(paquet) + 1):
+            with pytest.raises(NiveauIntrouvableErreur):
+                paquet.texte(numero)
+        for nom in ("niveau_0", "fond.png"):
+            with pytest.raises(NiveauIntrouvableErreur):
+                paquet.texte_par_nom(nom)
+
+
+@pytest.mark.parametrize("taille, raison", [
+    (0, "fichier vide"),
+    (EN_TETE.size - 1, "fichier tronqué"),
+    (EN_TETE.size + ENTREE.size, "table d'index tronquée"),
+    (-1, "tronquée"), # Dernière ressource coupée
+])
+def test_fichier_tronque(chemin_paquet, taille, raison, monkeypatch):
+    donnees = chemin_paquet.read_bytes()
+    chemin_paquet.write_bytes(donnees[:taille])
+    projections = []
+    mmap_d_origine = mmap.mmap
+
+    def projeter(*arguments, **options):
+        projections.append(mmap_d_origine(*arguments, **options))
+        return projections[-1]
+
+    monkeypatch.setattr("jeu_arcade.paquet.mmap.mmap", projeter)
+    with pytest.raises(PaquetInvalideErreur, match=raison):
+        PaquetNiveaux(chemin_paquet)
+    assert all(projection.closed for projection in projections)
+
+
+def test_fichier_absent_ou_etranger(tmp_path):
+    with pytest.raises(PaquetInvalideErreur):
+        PaquetNiveaux(tmp_path / "absent.paq")
+    with pytest.raises(PaquetInvalideErreur):
+        PaquetNiveaux(tmp_path) # Un dossier
+    etranger = tmp_path / "etranger.paq"
+    etranger.write_bytes(b"PK\x03\x04" + bytes(60))
+    with pytest.raises(PaquetInvalideErreur, match="en-tête inconnu"):
+        PaquetNiveaux(etranger)
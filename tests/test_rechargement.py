@@ -0,0 +1,95 @@
+"""Rechargement à chaud : monstres appariés au départ, décor redessiné par ligne."""
+import pygame
+import pytest
+
+from jeu_arcade.affichage import (
+    modifier_decor,
+    preparer_decor,
+    redessiner_decor,
+    rendre_couche_decor,
+)
+from jeu_arcade.config import ECRAN_HAUTEUR, ECRAN_LARGEUR, TAILLE_TUILE, ElementDecor
+from jeu_arcade.erreurs import NiveauErreur
+from jeu_arcade.niveau import TOUS_LES_ELEMENTS, construire_niveau
+from jeu_arcade.rechargement import appliquer_modifications
+
+NIVEAU = "\n".join([
+    "..........",
+    "..X.......",
+    ".####.....",
+    "..........",
+    "P........E",
+    "##########",
+])
+
+
+def recharger(niveau_data: dict, avant: str, apres: str) -> list[int]:
+    texte = "\n".join(niveau_data['lignes']).replace(avant, apres)
+    return appliquer_modifications(niveau_data, texte, TOUS_LES_ELEMENTS)
+
+
+def test_monstre_parti_de_sa_ligne_ni_double_ni_replace():
+    niveau_data = construire_niveau(NIVEAU)
+    monstre = niveau_data['tuiles_monstres_mobiles'][0]
+    monstre['rect'].topleft = (6 * TAILLE_TUILE, 3 * TAILLE_TUILE) # tombé
+    # Ligne où il se trouve, puis ligne de son départ (X gardé)
+    recharger(niveau_data, "..........\nP", ".....#....\nP")
+    recharger(niveau_data, "..X.......", "..X......#")
+    assert list(niveau_data['tuiles_monstres_mobiles']) == [monstre]
+    assert monstre['rect'].topleft == (6 * TAILLE_TUILE, 3 * TAILLE_TUILE)
+
+
+def test_x_deplace_ajoute_ou_efface():
+    niveau_data = construire_niveau(NIVEAU)
+    mobiles = niveau_data['tuiles_monstres_mobiles']
+    recharger(niveau_data, "..X.......", "...X......")
+    assert [m['depart'] for m in mobiles] == [(3 * TAILLE_TUILE, TAILLE_TUILE)]
+    recharger(niveau_data, "...X......", "...X..X...")
+    assert sorted(m['depart'] for m in mobiles) == [
+        (3 * TAILLE_TUILE, TAILLE_TUILE), (6 * TAILLE_TUILE, TAILLE_TUILE),
+    ]
+    recharger(niveau_data, "...X..X...", "..........")
+    assert len(mobiles) == 0
+
+
+def test_texte_invalide_ne_change_rien():
+    niveau_data = construire_niveau(NIVEAU)
+    grille = niveau_data['grille']
+    with pytest.raises(NiveauErreur):
+        recharger(niveau_data, "P", ".")
+    assert niveau_data['grille'] is grille
+    assert len(niveau_data['tuiles_monstres_mobiles']) == 1
+
+
+def images_de_test() -> dict:
+    """Fond en dégradé et image de mur ; les autres éléments en couleur."""
+    fond = pygame.Surface((ECRAN_LARGEUR, ECRAN_HAUTEUR))
+    for y in range(ECRAN_HAUTEUR):
+        fond.fill((y % 256, 40, 90), (0, y, ECRAN_LARGEUR, 1))
+    mur = pygame.Surface((TAILLE_TUILE, TAILLE_TUILE))
+    mur.fill((120, 80, 20))
+    return {ElementDecor.VIDE: fond, ElementDecor.MUR: mur}
+
+
+@pytest.mark.parametrize("images", [{}, "images"])
+def test_decor_modifie_comme_reprepare(images):
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    if images:
+        images = images_de_test()
+    niveau_data = construire_niveau(NIVEAU)
+    decor = preparer_decor(niveau_data, images)
+    taille = (ECRAN_LARGEUR, ECRAN_HAUTEUR)
+    couche = rendre_couche_decor(decor, taille)
+    lignes = recharger(niveau_data, ".####.....\n", "..M..##..#\n")
+    lignes += recharger(niveau_data, "#" * 10, "###..#####")
+    zones = modifier_decor(decor, niveau_data, images, lignes)
+    assert len(zones) == 2
+    redessiner_decor(couche, decor, zones)
+    reference = preparer_decor(niveau_data, images)
+    for cle in ("blits", "couleurs"):
+        assert sorted(map(repr, decor[cle])) == sorted(map(repr, reference[cle]))
+    assert pygame.image.tobytes(couche, "RGB") == pygame.image.tobytes(
+        rendre_couche_decor(reference, taille), "RGB"
+    )
+    pygame.display.quit()
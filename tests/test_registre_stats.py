@@ -0,0 +1,76 @@
+"""Registre des stats : classements bornés, relecture et base verrouillée."""
+import random
+import sqlite3
+import time
+
+from jeu_arcade.registre_stats import TAILLE_CLASSEMENT, RegistreStats, _inserer
+
+
+def test_inserer_garde_les_meilleurs_tries():
+    rng = random.Random(0)
+    classement = []
+    entrees = []
+    for _ in range(200):
+        entree = (round(rng.uniform(1, 60), 1), rng.randint(1, 9))
+        entrees.append(entree)
+        _inserer(classement, entree)
+        assert classement == sorted(entrees)[:TAILLE_CLASSEMENT]
+
+
+def test_inserer_ignore_une_entree_trop_lente():
+    classement = [(float(t), 1) for t in range(TAILLE_CLASSEMENT)]
+    _inserer(classement, (99.0, 1))
+    assert classement == [(float(t), 1) for t in range(TAILLE_CLASSEMENT)]
+    _inserer(classement, (0.5, 3))
+    assert classement[:2] == [(0.0, 1), (0.5, 3)]
+    assert len(classement) == TAILLE_CLASSEMENT
+
+
+def test_relecture_apres_reouverture(tmp_path):
+    chemin = tmp_path / "stats.sqlite3"
+    registre = RegistreStats(chemin)
+    parcours = [(1, 12.5, 3), (1, 9.0, 5), (2, 30.0, 1)]
+    parcours += [(3, 10.0 + i, 1 + i % 4) for i in range(15)]
+    for niveau, temps, essais in parcours:
+        registre.enregistrer(niveau, temps, essais)
+    attendu = {
+        niveau: (
+            registre.classement_temps(niveau), registre.classement_essais(niveau)
+        )
+        for niveau in (1, 2, 3)
+    }
+    registre.fermer()
+    registre.fermer() # Déjà fermé : sans effet
+
+    relu = RegistreStats(chemin)
+    relu.fermer() # Attend la fin de la lecture des classements
+    for niveau, (par_temps, par_essais) in attendu.items():
+        assert relu.classement_temps(niveau) == par_temps
+        assert relu.classement_essais(niveau) == par_essais
+    assert relu.meilleur_temps(1) == 9.0 and relu.moins_essais(1) == 3
+    assert len(relu.classement_temps(3)) == TAILLE_CLASSEMENT
+    assert relu.meilleur_temps(4) is None
+    with sqlite3.connect(chemin) as connexion:
+        (nombre,) = connexion.execute("SELECT COUNT(*) FROM parcours").fetchone()
+    assert nombre == len(parcours)
+
+
+def test_base_verrouillee_ne_bloque_pas(tmp_path):
+    chemin = tmp_path / "stats.sqlite3"
+    ancien = RegistreStats(chemin)
+    ancien.enregistrer(1, 20.0, 2)
+    ancien.fermer()
+
+    verrou = sqlite3.connect(chemin, isolation_level=None)
+    verrou.execute("BEGIN EXCLUSIVE")
+    registre = RegistreStats(chemin)
+    debut = time.perf_counter()
+    registre.enregistrer(1, 15.0, 4)
+    assert registre.meilleur_temps(1) == 15.0 # Partie en cours seulement
+    assert time.perf_counter() - debut < 0.5
+    verrou.execute("COMMIT")
+    verrou.close()
+    registre.fermer()
+    # Parcours de la partie fusionné aux classements relus
+    assert registre.classement_temps(1) == [(15.0, 4), (20.0, 2)]
+    assert registre.non_ecrits == 0
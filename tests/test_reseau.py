@@ -0,0 +1,89 @@
+"""Serveur et clients sur la même machine (boucle locale UDP)."""
+import threading
+import time
+
+import pytest
+
+from jeu_arcade.client import Client, ConnexionRefuseeErreur
+from jeu_arcade.config import ACTION_DROITE
+from jeu_arcade.modes import MODES
+from jeu_arcade.reseau import decoder_image, encoder_image
+from jeu_arcade.serveur import Serveur
+
+
+@pytest.fixture
+def serveur():
+    serveur = Serveur(
+        MODES["monstres_mobiles"], adresse=("127.0.0.1", 0), joueurs_max=2
+    )
+    fil = threading.Thread(target=serveur.executer, daemon=True)
+    fil.start()
+    yield serveur
+    serveur.arreter()
+    fil.join(timeout=5)
+
+
+def attendre_images(clients: list[Client], ticks: int, actions: list[int]) -> list:
+    """Envoie les actions de chaque client pendant `ticks` ticks du serveur."""
+    images = [[] for _ in clients]
+    limite = time.monotonic() + 10
+    while time.monotonic() < limite:
+        for client, action, recues in zip(clients, actions, images):
+            client.envoyer_actions(action)
+            image = client.recevoir()
+            if image is not None and (not recues or image is not recues[-1]):
+                recues.append(image)
+        if all(len(recues) >= ticks for recues in images):
+            return images
+        time.sleep(0.005)
+    raise AssertionError("images du serveur non reçues")
+
+
+def test_rejoindre_complet_et_entrees(serveur):
+    clients = [Client(serveur.adresse) for _ in range(3)]
+    try:
+        for client in clients[:2]:
+            client.rejoindre(delai=5)
+        assert [c.identifiant for c in clients[:2]] == [0, 1]
+        assert clients[1].donnees_texte == serveur.donnees_texte
+        with pytest.raises(ConnexionRefuseeErreur, match="complète"):
+            clients[2].rejoindre(delai=5)
+
+        # Le joueur 2 va à droite, le joueur 1 ne touche à rien
+        immobile, mobile = attendre_images(clients[:2], 30, [0, ACTION_DROITE])
+        depart_x = serveur.niveau['pos_joueur'][0]
+        assert {image['joueurs'][0]['x'] for image in immobile} == {depart_x}
+        assert max(image['joueurs'][1]['x'] for image in mobile) > depart_x
+        for recues in (immobile, mobile):
+            ticks = [image['tick'] for image in recues]
+            assert ticks == sorted(ticks)
+            derniere = recues[-1]
+            assert set(derniere['joueurs']) == {0, 1}
+            assert len(derniere['monstres']) == len(
+                serveur.niveau['tuiles_monstres_mobiles']
+            )
+    finally:
+        for client in clients:
+            client.fermer()
+
+
+def test_aller_retour_image():
+    serveur = Serveur(MODES["monstres_mobiles"], adresse=("127.0.0.1", 0))
+    serveur.socket.close() # Clients ajoutés à la main, sans réseau
+    for identifiant, direction, mort in ((0, "gauche", False), (3, "droite", True)):
+        joueur = serveur._nouveau_joueur()
+        joueur.update(direction=direction, mort=mort)
+        joueur['rect'].topleft = (-12 * identifiant, 70000 + identifiant)
+        serveur.clients[identifiant] = {"joueur": joueur, "sorties": 7 * identifiant}
+    mobiles = serveur.niveau['tuiles_monstres_mobiles']
+    mobiles[0]['vitesse_x'] = -2
+    image = decoder_image(encoder_image(41, serveur.clients, mobiles))
+    assert image['tick'] == 41
+    assert image['joueurs'] == {
+        0: {"x": 0, "y": 70000, "direction": "gauche", "mort": False, "sorties": 0},
+        3: {"x": -36, "y": 70003, "direction": "droite", "mort": True, "sorties": 21},
+    }
+    assert image['monstres'] == [
+        (m['rect'].x, m['rect'].y, "droite" if m['vitesse_x'] > 0 else "gauche")
+        for m in mobiles
+    ]
@@ -0,0 +1,80 @@
+"""Réserve de monstres : retrait par échange, indices tenus à jour, recyclage."""
+import random
+
+from conftest import niveau_charge
+from jeu_arcade.config import TAILLE_TUILE, VITESSE_MONSTRE
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.reserve import ReserveMonstres
+
+
+def reserve_de(nombre: int) -> ReserveMonstres:
+    reserve = ReserveMonstres()
+    for i in range(nombre):
+        reserve.ajouter(i * TAILLE_TUILE, 0)
+    return reserve
+
+
+def verifier_indices(reserve: ReserveMonstres):
+    assert [m['indice'] for m in reserve] == list(range(len(reserve)))
+
+
+def test_retrait_echange_avec_le_dernier():
+    reserve = reserve_de(5)
+    a, b, c, d, e = reserve
+    reserve.retirer(b)
+    assert list(reserve) == [a, e, c, d]
+    reserve.retirer(d) # Le dernier : rien à échanger
+    assert list(reserve) == [a, e, c]
+    reserve.retirer(a)
+    assert list(reserve) == [c, e]
+    verifier_indices(reserve)
+    assert reserve.libres == [b, d, a]
+
+
+def test_indices_apres_retraits_au_hasard():
+    rng = random.Random(0)
+    reserve = reserve_de(50)
+    actifs = list(reserve)
+    for _ in range(200):
+        if actifs and rng.random() < 0.6:
+            monstre = rng.choice(actifs)
+            actifs.remove(monstre)
+            reserve.retirer(monstre)
+        else:
+            actifs.append(reserve.ajouter(rng.randrange(800), rng.randrange(600)))
+        verifier_indices(reserve)
+        assert sorted(map(id, reserve)) == sorted(map(id, actifs))
+    assert len(reserve) + len(reserve.libres) == len(
+        {id(m) for m in [*reserve, *reserve.libres]}
+    )
+
+
+def test_ajout_recycle_un_monstre_libere():
+    reserve = reserve_de(3)
+    monstre = reserve[1]
+    rect = monstre['rect']
+    monstre.update(vitesse_x=-VITESSE_MONSTRE, vitesse_y=12, patrouille=(0, 80))
+    reserve.retirer(monstre)
+    recycle = reserve.ajouter(200, 120, depart=(40, 0))
+    assert recycle is monstre and recycle['rect'] is rect
+    assert not reserve.libres
+    assert recycle['rect'].topleft == (200, 120)
+    assert recycle['vitesse_x'] == VITESSE_MONSTRE
+    assert recycle['vitesse_y'] == 0
+    assert recycle['patrouille'] is None
+    assert recycle['depart'] == (40, 0)
+    assert recycle['indice'] == 2 and reserve[2] is recycle
+
+
+def test_rechargement_sans_nouveau_monstre():
+    reserve = ReserveMonstres()
+    texte = niveau_charge()
+    premiers = {id(m) for m in construire_niveau(texte, reserve=reserve)[
+        'tuiles_monstres_mobiles'
+    ]}
+    for _ in range(3):
+        mobiles = construire_niveau(texte, reserve=reserve)['tuiles_monstres_mobiles']
+        assert mobiles is reserve
+        assert {id(m) for m in mobiles} == premiers
+        verifier_indices(mobiles)
+        assert [m['rect'].topleft for m in mobiles] == [m['depart'] for m in mobiles]
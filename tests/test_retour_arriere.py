@@ -0,0 +1,89 @@
+"""Tampon d'états : relecture exacte et retour d'un tick par appui."""
+import random
+
+from conftest import niveau_charge, touches_aleatoires
+from jeu_arcade.config import ECRAN_HAUTEUR
+from jeu_arcade.instantanes import capturer
+from jeu_arcade.monstres import gerer_physique_monstres, verifier_collisions_danger
+from jeu_arcade.niveau import construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+from jeu_arcade.retour_arriere import TamponEtats, ecrire_etat, lire_etat, taille_etat
+
+
+def etat_complet(niveau_data: dict) -> tuple:
+    """État comparable, champs du joueur compris."""
+    return (
+        capturer(niveau_data, 0),
+        joueur['au_sol'], joueur['direction'], joueur['mort'],
+    )
+
+
+def jouer(niveau_data: dict, retour: TamponEtats, ticks: int, rng) -> list:
+    """Ticks de jeu capturés dans `retour` ; états après chaque tick."""
+    etats = []
+    for tick in range(ticks):
+        gerer_physique_monstres(niveau_data)
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+        verifier_collisions_danger(niveau_data)
+        if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+            initialiser_joueur(*niveau_data['pos_joueur'])
+        retour.capturer(niveau_data, tick * 16, 1, tick)
+        etats.append(etat_complet(niveau_data))
+    return etats
+
+
+def test_ecrire_puis_lire():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    joueur.update(vitesse_x=-5, vitesse_y=-12, au_sol=False, direction="gauche")
+    tampon = bytearray(
+        7 + taille_etat(len(niveau_data['tuiles_monstres_mobiles']))
+    )
+    ecrire_etat(tampon, 7, niveau_data, 1234, 3, 99)
+    attendu = etat_complet(niveau_data)
+    initialiser_joueur(0, 0)
+    for m in niveau_data['tuiles_monstres_mobiles']:
+        m['rect'].x += 17
+        m['vitesse_x'] = 0
+    assert lire_etat(tampon, 7, niveau_data) == (1234, 3, 99)
+    assert etat_complet(niveau_data) == attendu
+
+
+def test_chaque_recul_revient_d_un_tick():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    retour = TamponEtats(len(niveau_data['tuiles_monstres_mobiles']), capacite=50)
+    etats = jouer(niveau_data, retour, 80, random.Random(0))
+    # Les 50 derniers états sont gardés ; le plus récent est l'état actuel
+    for attendu in reversed(etats[-50:-1]):
+        assert retour.reculer(niveau_data) is not None
+        assert etat_complet(niveau_data) == attendu
+    assert retour.reculer(niveau_data) is None
+
+
+def test_reprise_apres_recul():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    retour = TamponEtats(len(niveau_data['tuiles_monstres_mobiles']))
+    rng = random.Random(1)
+    etats = jouer(niveau_data, retour, 30, rng)
+    for _ in range(10):
+        retour.reculer(niveau_data)
+    assert etat_complet(niveau_data) == etats[19]
+    etats = etats[:20] + jouer(niveau_data, retour, 5, rng)
+    retour.reculer(niveau_data)
+    assert etat_complet(niveau_data) == etats[-2]
+
+
+def test_monstres_tombes_reviennent():
+    niveau_data = construire_niveau(niveau_charge())
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    mobiles = niveau_data['tuiles_monstres_mobiles']
+    retour = TamponEtats(len(mobiles))
+    retour.capturer(niveau_data, 0, 1, 0)
+    attendu = etat_complet(niveau_data)
+    retour.capturer(niveau_data, 16, 1, 1)
+    for m in list(mobiles)[:4]:
+        mobiles.retirer(m)
+    retour.reculer(niveau_data)
+    assert etat_complet(niveau_data) == attendu
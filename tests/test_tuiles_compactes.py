@@ -0,0 +1,62 @@
+"""TuilesCompactes : mêmes tuiles et mêmes collisions que les listes de Rect."""
+import random
+
+import pygame
+import pytest
+
+from conftest import niveau_aleatoire, niveau_charge, touches_aleatoires
+from jeu_arcade.config import DOSSIER_NIVEAUX_MONSTRES_MOBILES, ECRAN_HAUTEUR
+from jeu_arcade.instantanes import capturer
+from jeu_arcade.monstres import gerer_physique_monstres, verifier_collisions_danger
+from jeu_arcade.niveau import charger_niveau, construire_niveau
+from jeu_arcade.physique import appliquer_physique, initialiser_joueur, joueur
+
+NIVEAUX = [
+    charger_niveau(numero, DOSSIER_NIVEAUX_MONSTRES_MOBILES)
+    for numero in (1, 2, 3)
+] + [niveau_aleatoire(graine) for graine in range(3)] + [niveau_charge()]
+
+
+def partie(donnees_texte: str, compact: bool, ticks: int = 600) -> list:
+    """États successifs d'une partie aux touches aléatoires (graine fixe)."""
+    rng = random.Random(0)
+    niveau_data = construire_niveau(donnees_texte, compact=compact)
+    initialiser_joueur(*niveau_data['pos_joueur'])
+    etats = []
+    for tick in range(ticks):
+        gerer_physique_monstres(niveau_data)
+        appliquer_physique(niveau_data, touches_aleatoires(rng))
+        verifier_collisions_danger(niveau_data)
+        etats.append((capturer(niveau_data, tick), joueur['mort']))
+        if joueur['mort'] or joueur['rect'].top > ECRAN_HAUTEUR:
+            initialiser_joueur(*niveau_data['pos_joueur'])
+    return etats
+
+
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_memes_tuiles(donnees_texte):
+    listes = construire_niveau(donnees_texte)
+    compactes = construire_niveau(donnees_texte, compact=True)
+    for cle in ('tuiles_sol', 'tuiles_monstres_fixes'):
+        assert list(compactes[cle]) == listes[cle]
+
+
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_dans_donne_les_tuiles_qui_touchent(donnees_texte):
+    listes = construire_niveau(donnees_texte)
+    compactes = construire_niveau(donnees_texte, compact=True)
+    rng = random.Random(1)
+    for _ in range(200):
+        zone = pygame.Rect(
+            rng.randrange(-80, 900), rng.randrange(-80, 700),
+            rng.randrange(1, 120), rng.randrange(1, 120),
+        )
+        for cle in ('tuiles_sol', 'tuiles_monstres_fixes'):
+            attendues = [r for r in listes[cle] if r.colliderect(zone)]
+            trouvees = [r for r in compactes[cle].dans(zone) if r.colliderect(zone)]
+            assert trouvees == attendues
+
+
+@pytest.mark.parametrize("donnees_texte", NIVEAUX)
+def test_memes_collisions(donnees_texte):
+    assert partie(donnees_texte, compact=True) == partie(donnees_texte, compact=False)